@@ -1,14 +1,39 @@
+import logging
+import os
 import sys
-from src.vista.InterfazRecetario import App_Recetario
-from src.logica.LogicaRecetario import LogicaRecetario
-from src.logica.LogicaMock import LogicaMock
-from src.modelo.Declarative_base import Base, Session, engine
-from src.modelo.Receta import Receta
-from src.modelo.Ingrediente import Ingrediente
-from src.modelo.IngredienteReceta import IngredienteReceta
 
-if __name__ == '__main__':
-    logica = LogicaRecetario()
+from src.consola.ConsolaRecetario import COMANDOS
+
+
+def iniciar_interfaz():
+    # La interfaz gráfica se importa sólo si se va a usar: los comandos de consola no cargan PyQt5
+    from src.vista.InterfazRecetario import App_Recetario
+    from src.logica.LogicaRecetario import LogicaRecetario
+    from src.logica.LogicaCache import LogicaCache
+    from src.logica.LogicaInstrumentada import LogicaInstrumentada
+    from src.modelo.Sentencias import activar_registro_lento
+
+    if os.environ.get('RECETARIO_SQL_LENTO'):
+        activar_registro_lento(float(os.environ['RECETARIO_SQL_LENTO']))
+    logica = LogicaInstrumentada(LogicaCache(LogicaRecetario()))
+    ruta_estadisticas = os.environ.get('RECETARIO_ESTADISTICAS')
+    if ruta_estadisticas:
+        logica.iniciar_volcado(ruta_estadisticas)
 
     app = App_Recetario(sys.argv, logica)
-    sys.exit(app.exec_())
\ No newline at end of file
+    codigo = app.exec_()
+    if ruta_estadisticas:
+        logica.detener_volcado()
+    return codigo
+
+
+if __name__ == '__main__':
+    # RECETARIO_LOG fija el nivel de logging (DEBUG registra cada llamada a la lógica),
+    # RECETARIO_ESTADISTICAS el archivo donde se vuelcan las estadísticas cada minuto y
+    # RECETARIO_SQL_LENTO el umbral en ms para registrar sentencias lentas con su plan
+    logging.basicConfig(level=os.environ.get('RECETARIO_LOG', 'WARNING').upper(),
+                        format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    if len(sys.argv) > 1 and sys.argv[1] in COMANDOS + ('-h', '--help'):
+        from src.consola.ConsolaRecetario import main
+        sys.exit(main(sys.argv[1:]))
+    sys.exit(iniciar_interfaz())
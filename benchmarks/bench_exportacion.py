@@ -0,0 +1,75 @@
+'''
+Benchmark de memoria de la exportación en flujo.
+
+Puebla una base temporal con --relaciones filas de IngredienteReceta (1M por defecto),
+la exporta y reporta el pico de memoria residente (RSS) antes y después de exportar.
+Con yield_per el incremento queda acotado por la caché de páginas de SQLite (cache_size)
+y no crece con el catálogo. mmap se desactiva para que el RSS no incluya las páginas
+del archivo mapeadas en memoria.
+
+Uso: python -m benchmarks.bench_exportacion [--relaciones 1000000] [--por-receta 20] [--formato jsonl|csv]
+'''
+import argparse
+import os
+import resource
+import sqlite3
+import sys
+import tempfile
+import time
+
+from src.logica.ExportadorRecetario import ExportadorRecetario
+from src.modelo.Declarative_base import PRAGMAS_SQLITE, configurar_engine, dar_engine
+from src.modelo.Migraciones import migrar
+
+
+def pico_rss_mb():
+    ''' Pico de memoria residente del proceso en MB '''
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (1024 * 1024) if sys.platform == 'darwin' else pico / 1024
+
+
+def poblar(ruta, relaciones, por_receta):
+    ''' Inserta los datos con generadores para no elevar el pico de memoria antes de medir '''
+    recetas = max(1, relaciones // por_receta)
+    conexion = sqlite3.connect(ruta)
+    with conexion:
+        conexion.executemany('INSERT INTO "Receta" (id, nombre, "tiempoPreparacion", "nroPersonasPreparacion", '
+                             '"caloriasPorcion", instrucciones) VALUES (?, ?, 30, 4, 250, ?)',
+                             ((i, 'Receta {}'.format(i), 'Mezclar los ingredientes y hornear. ' * 5) for i in range(1, recetas + 1)))
+        conexion.executemany('INSERT INTO "Ingrediente" (id, nombre, "unidadMedida", "valorUnidad", "nombreProveedor") '
+                             'VALUES (?, ?, \'gramo\', 10, \'Plaza Concordia\')',
+                             ((i, 'Ingrediente {}'.format(i)) for i in range(1, por_receta + 1)))
+        conexion.executemany('INSERT INTO "IngredienteReceta" ("idReceta", "idIngrediente", cantidad, "unidadMedida") '
+                             'VALUES (?, ?, 1.5, \'gramo\')',
+                             ((i // por_receta + 1, i % por_receta + 1) for i in range(recetas * por_receta)))
+    conexion.close()
+    return recetas * por_receta
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--relaciones', type=int, default=1000000)
+    parser.add_argument('--por-receta', dest='por_receta', type=int, default=20)
+    parser.add_argument('--formato', choices=['jsonl', 'csv'], default='jsonl')
+    argumentos = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, 'bench.sqlite')
+        configurar_engine(ruta, pragmas=dict(PRAGMAS_SQLITE, mmap_size=0))
+        migrar(dar_engine())
+        total = poblar(ruta, argumentos.relaciones, argumentos.por_receta)
+
+        antes = pico_rss_mb()
+        inicio = time.perf_counter()
+        resultados = ExportadorRecetario().exportar(os.path.join(directorio, 'exportacion'), argumentos.formato)
+        duracion = time.perf_counter() - inicio
+        despues = pico_rss_mb()
+        configurar_engine(':memory:')
+
+    print('relaciones exportadas: {} de {}'.format(resultados['ingredientes_receta']['filas'], total))
+    print('tiempo: {:.2f} s ({:.0f} filas/s)'.format(duracion, total / duracion))
+    print('pico RSS antes: {:.1f} MB, después: {:.1f} MB, incremento: {:.1f} MB'.format(antes, despues, despues - antes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,261 @@
+'''
+Benchmark de los métodos de FachadaRecetario con distintas lógicas y tamaños de catálogo.
+
+Genera datos deterministas con Faker("es_ES"), los carga en cada lógica y mide la latencia
+de cada método. Los resultados se escriben en JSON con percentiles para comparar commits;
+con --comparar se muestra la razón de p50 frente a un resultado anterior.
+
+Uso: python -m benchmarks.bench_fachada [--tamanos 1000 10000 100000 1000000] [--logicas recetario mock memoria]
+         [--repeticiones 200] [--presupuesto 5] [--semilla 4101] [--salida bench_fachada.json] [--comparar anterior.json]
+'''
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+
+from faker import Faker
+
+from src.logica.ImportadorRecetario import ImportadorRecetario
+from src.logica.LogicaMemoria import LogicaMemoria
+from src.logica.LogicaMock import LogicaMock
+from src.logica.LogicaRecetario import LogicaRecetario
+from src.modelo.Declarative_base import configurar_engine
+
+UNIDADES = ["kilo", "libra", "gramo", "onza", "cucharada", "cucharadita", "arroba", "miligramo", "litro"]
+
+INGREDIENTES_POR_RECETA = 5
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def generar_datos(tamano, semilla):
+    ''' Genera tamano recetas, tamano / 10 ingredientes y INGREDIENTES_POR_RECETA relaciones por receta.
+    Los nombres llevan un consecutivo para ser únicos; la misma semilla produce los mismos datos '''
+    faker = Faker("es_ES")
+    faker.seed_instance(semilla)
+    cantidad_ingredientes = max(100, tamano // 10)
+    recetas = [{'nombre': '{} {} {}'.format(faker.word().capitalize(), faker.word(), i),
+                'tiempo': faker.random_int(10, 240), 'personas': faker.random_int(1, 12),
+                'calorias': faker.random_int(50, 900), 'preparacion': faker.sentence(nb_words=12)}
+               for i in range(tamano)]
+    ingredientes = [{'nombre': '{} {}'.format(faker.word().capitalize(), i), 'unidad': faker.random_element(UNIDADES),
+                     'valor': faker.random_int(1, 100000), 'sitioCompra': faker.company()}
+                    for i in range(cantidad_ingredientes)]
+    ingredientes_receta = [{'receta': recetas[i]['nombre'],
+                            'ingrediente': ingredientes[(i * 7 + j * 13) % cantidad_ingredientes]['nombre'],
+                            'cantidad': faker.random_int(1, 10), 'unidad': ''}
+                           for i in range(tamano) for j in range(INGREDIENTES_POR_RECETA)]
+    return {'recetas': recetas, 'ingredientes': ingredientes, 'ingredientes_receta': ingredientes_receta}
+
+
+@contextlib.contextmanager
+def cargar_recetario(datos):
+    ''' LogicaRecetario sobre una base SQLite temporal poblada con el importador '''
+    with tempfile.TemporaryDirectory() as directorio:
+        configurar_engine(os.path.join(directorio, 'bench.sqlite'))
+        logica = LogicaRecetario()
+        importador = ImportadorRecetario()
+        importador.importar_recetas(datos['recetas'])
+        importador.importar_ingredientes(datos['ingredientes'])
+        importador.importar_ingredientes_receta(datos['ingredientes_receta'])
+        try:
+            yield logica
+        finally:
+            # Libera el archivo antes de borrar el directorio temporal
+            configurar_engine(':memory:')
+
+
+@contextlib.contextmanager
+def cargar_mock(datos):
+    logica = LogicaMock()
+    logica.recetas = [dict(receta) for receta in datos['recetas']]
+    logica.ingredientes = [dict(ingrediente) for ingrediente in datos['ingredientes']]
+    unidades = {ingrediente['nombre']: ingrediente['unidad'] for ingrediente in datos['ingredientes']}
+    logica.ingredientes_recetas = [{'receta': relacion['receta'], 'ingrediente': relacion['ingrediente'],
+                                    'unidad': unidades[relacion['ingrediente']], 'cantidad': relacion['cantidad']}
+                                   for relacion in datos['ingredientes_receta']]
+    yield logica
+
+
+@contextlib.contextmanager
+def cargar_memoria(datos):
+    logica = LogicaMemoria()
+    for receta in datos['recetas']:
+        logica.crear_receta(receta['nombre'], receta['tiempo'], receta['personas'], receta['calorias'], receta['preparacion'])
+    for ingrediente in datos['ingredientes']:
+        logica.crear_ingrediente(ingrediente['nombre'], ingrediente['unidad'], ingrediente['valor'], ingrediente['sitioCompra'])
+    for relacion in datos['ingredientes_receta']:
+        logica.agregar_ingrediente_receta(logica.recetas.dar_id(relacion['receta']),
+                                          logica.ingredientes.dar_id(relacion['ingrediente']), relacion['cantidad'])
+    yield logica
+
+
+class Contexto:
+    ''' Traduce posiciones de los datos generados a los argumentos que espera cada lógica '''
+
+    def __init__(self, datos, primer_id, por_objeto):
+        self.datos = datos
+        self.primer_id = primer_id
+        # LogicaMock recibe la receta y el ingrediente como diccionarios
+        self.por_objeto = por_objeto
+
+    def id_receta(self, posicion):
+        return self.primer_id + posicion % len(self.datos['recetas'])
+
+    def id_ingrediente(self, posicion):
+        return self.primer_id + posicion % len(self.datos['ingredientes'])
+
+    def id_nueva(self, posicion):
+        return self.primer_id + len(self.datos['recetas']) + posicion
+
+    def receta_nueva(self, posicion):
+        identificador = self.id_nueva(posicion)
+        return {'id': identificador, 'nombre': nombre_nuevo(posicion)} if self.por_objeto else identificador
+
+    def ingrediente(self, posicion):
+        datos = self.datos['ingredientes'][posicion % len(self.datos['ingredientes'])]
+        return dict(datos, id=self.id_ingrediente(posicion)) if self.por_objeto else self.id_ingrediente(posicion)
+
+
+# Nombre, descripción de la lógica: (cargar, primer id, recibe objetos)
+LOGICAS = {
+    'recetario': (cargar_recetario, 1, False),
+    'mock': (cargar_mock, 0, True),
+    'memoria': (cargar_memoria, 1, False),
+}
+
+
+def nombre_nuevo(posicion):
+    return 'Receta de benchmark {}'.format(posicion)
+
+
+def dar_operaciones(contexto):
+    ''' Operaciones medidas en orden: las que crean recetas van antes de las que las modifican o eliminan '''
+    datos = contexto.datos
+    recetas = datos['recetas']
+
+    def receta(i):
+        return recetas[(i * 7919) % len(recetas)]
+
+    def palabra(i):
+        return receta(i)['nombre'].split()[0]
+
+    return [
+        ('dar_recetas', lambda logica, i: logica.dar_recetas(desde_id=contexto.id_receta(i * 7919), limite=50)),
+        ('dar_receta', lambda logica, i: logica.dar_receta(contexto.id_receta(i * 7919))),
+        ('buscar_recetas', lambda logica, i: logica.buscar_recetas(palabra(i))),
+        ('validar_crear_editar_receta', lambda logica, i: logica.validar_crear_editar_receta(
+            None, receta(i)['nombre'], "30", "4", "250", "...")),
+        ('crear_receta', lambda logica, i: logica.crear_receta(nombre_nuevo(i), "30", "4", "250", "Preparación...")),
+        ('editar_receta', lambda logica, i: logica.editar_receta(contexto.id_nueva(i), nombre_nuevo(i), "45", "4", "250", "...")),
+        ('dar_ingredientes', lambda logica, i: logica.dar_ingredientes(desde_id=contexto.id_ingrediente(i * 31), limite=50)),
+        ('dar_ingrediente', lambda logica, i: logica.dar_ingrediente(contexto.id_ingrediente(i * 31))),
+        ('buscar_ingredientes', lambda logica, i: logica.buscar_ingredientes(
+            datos['ingredientes'][i % len(datos['ingredientes'])]['nombre'][:i % 4 + 1])),
+        ('validar_crear_editar_ingrediente', lambda logica, i: logica.validar_crear_editar_ingrediente(
+            datos['ingredientes'][i % len(datos['ingredientes'])]['nombre'], "gramo", "10", "Plaza")),
+        ('dar_ingredientes_receta', lambda logica, i: logica.dar_ingredientes_receta(contexto.id_receta(i * 7919))),
+        ('validar_crear_editar_ingReceta', lambda logica, i: logica.validar_crear_editar_ingReceta(
+            contexto.receta_nueva(i), contexto.ingrediente(i), "2")),
+        ('agregar_ingrediente_receta', lambda logica, i: logica.agregar_ingrediente_receta(
+            contexto.receta_nueva(i), contexto.ingrediente(i), "2")),
+        ('dar_preparacion', lambda logica, i: logica.dar_preparacion(contexto.id_receta(i * 7919), i % 12 + 1)),
+    ]
+
+
+def percentil(tiempos, valor):
+    return tiempos[min(len(tiempos) - 1, int(len(tiempos) * valor / 100))]
+
+
+def medir(logica, operacion, repeticiones, presupuesto):
+    ''' Llama la operación hasta repeticiones veces o hasta agotar el presupuesto en segundos
+    Retorna:
+        (dict): llamadas y percentiles en ms, o el error si la lógica no implementa el método
+    '''
+    tiempos = []
+    limite = time.perf_counter() + presupuesto
+    for i in range(repeticiones):
+        inicio = time.perf_counter()
+        try:
+            operacion(logica, i)
+        except NotImplementedError:
+            return {'error': 'NotImplementedError'}
+        fin = time.perf_counter()
+        tiempos.append((fin - inicio) * 1000)
+        if fin > limite:
+            break
+    tiempos.sort()
+    resultado = {'llamadas': len(tiempos), 'media_ms': sum(tiempos) / len(tiempos), 'max_ms': tiempos[-1]}
+    resultado.update({'p{}_ms'.format(valor): percentil(tiempos, valor) for valor in PERCENTILES})
+    return resultado
+
+
+def dar_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, check=True).stdout.decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparar(resultados, ruta_anterior):
+    ''' Muestra la razón entre el p50 actual y el de un resultado anterior para cada medición común '''
+    with open(ruta_anterior, encoding='utf-8') as archivo:
+        anterior = json.load(archivo)
+    previos = {(fila['logica'], fila['tamano'], fila['metodo']): fila for fila in anterior['resultados']}
+    print('\nComparación con {} ({})'.format(ruta_anterior, anterior.get('commit')))
+    for fila in resultados:
+        previa = previos.get((fila['logica'], fila['tamano'], fila['metodo']))
+        if previa and 'p50_ms' in previa and 'p50_ms' in fila and previa['p50_ms'] > 0:
+            print('{:<10} {:>8} {:<34} {:>6.2f}x'.format(fila['logica'], fila['tamano'], fila['metodo'],
+                                                         fila['p50_ms'] / previa['p50_ms']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--logicas', nargs='+', choices=sorted(LOGICAS), default=sorted(LOGICAS))
+    parser.add_argument('--repeticiones', type=int, default=200, help='Llamadas máximas por método')
+    parser.add_argument('--presupuesto', type=float, default=5, help='Segundos máximos por método')
+    parser.add_argument('--semilla', type=int, default=4101)
+    parser.add_argument('--salida', default='bench_fachada.json')
+    parser.add_argument('--comparar', help='Resultado JSON anterior para comparar')
+    argumentos = parser.parse_args()
+
+    resultados = []
+    for tamano in argumentos.tamanos:
+        inicio = time.perf_counter()
+        datos = generar_datos(tamano, argumentos.semilla)
+        print('Datos de {} recetas generados en {:.1f} s'.format(tamano, time.perf_counter() - inicio))
+        for nombre in argumentos.logicas:
+            cargar, primer_id, por_objeto = LOGICAS[nombre]
+            inicio = time.perf_counter()
+            with cargar(datos) as logica:
+                print('  {}: carga en {:.1f} s'.format(nombre, time.perf_counter() - inicio))
+                contexto = Contexto(datos, primer_id, por_objeto)
+                for metodo, operacion in dar_operaciones(contexto):
+                    # Algunas lógicas imprimen sus resultados; se descartan para no medir la consola
+                    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+                        medicion = medir(logica, operacion, argumentos.repeticiones, argumentos.presupuesto)
+                    resultados.append(dict(logica=nombre, tamano=tamano, metodo=metodo, **medicion))
+                    if 'error' in medicion:
+                        print('    {:<34} {}'.format(metodo, medicion['error']))
+                    else:
+                        print('    {:<34} p50 {:>9.3f} ms  p95 {:>9.3f} ms  p99 {:>9.3f} ms  ({} llamadas)'.format(
+                            metodo, medicion['p50_ms'], medicion['p95_ms'], medicion['p99_ms'], medicion['llamadas']))
+
+    with open(argumentos.salida, 'w', encoding='utf-8') as archivo:
+        json.dump({'commit': dar_commit(), 'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': platform.python_version(),
+                   'semilla': argumentos.semilla, 'repeticiones': argumentos.repeticiones, 'resultados': resultados},
+                  archivo, ensure_ascii=False, indent=2)
+    print('Resultados en {}'.format(argumentos.salida))
+    if argumentos.comparar:
+        comparar(resultados, argumentos.comparar)
+
+
+if __name__ == '__main__':
+    main()
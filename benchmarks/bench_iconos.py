@@ -0,0 +1,54 @@
+'''
+Benchmark del refresco de una lista con botones de íconos por fila.
+
+Llena la lista de ingredientes de una receta con filas sintéticas, la pinta fuera de
+pantalla y reporta el tiempo de cada refresco. Con --sin-cache se vacía la caché de
+src/vista/Recursos.py antes de cada refresco, como cuando cada ventana leía sus PNG.
+
+Uso: QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_iconos [--filas 5000] [--repeticiones 5] [--sin-cache]
+'''
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filas', type=int, default=5000)
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--sin-cache', dest='sin_cache', action='store_true')
+    argumentos = parser.parse_args()
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtWidgets import QApplication
+    from src.logica.LogicaMock import LogicaMock
+    from src.vista.Recursos import vaciar_cache
+    from src.vista.VistaListaIngredientesReceta import VistaListaIngredientesReceta
+
+    app = QApplication(sys.argv)
+    interfaz = SimpleNamespace(logica=LogicaMock())
+    filas = [{'ingrediente': 'Ingrediente {}'.format(i), 'unidad': 'gramo', 'cantidad': i % 9 + 1}
+             for i in range(argumentos.filas)]
+    for repeticion in range(argumentos.repeticiones):
+        if argumentos.sin_cache:
+            vaciar_cache()
+        inicio = time.perf_counter()
+        vista = VistaListaIngredientesReceta(interfaz, {'nombre': 'Receta'})
+        vista.mostrar_ing_receta(filas)
+        app.processEvents()
+        vista.grab()
+        # Desplazarse hasta el final pinta otras filas y sus íconos
+        barra = vista.tabla_ingReceta.verticalScrollBar()
+        barra.setValue(barra.maximum())
+        vista.grab()
+        duracion = time.perf_counter() - inicio
+        print('refresco {}: {:>6} filas  {:>8.1f} ms'.format(repeticion + 1, argumentos.filas, duracion * 1000))
+        vista.hide()
+        vista.deleteLater()
+        app.processEvents()
+
+
+if __name__ == '__main__':
+    main()
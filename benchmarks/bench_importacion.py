@@ -0,0 +1,66 @@
+'''
+Benchmark del importador masivo: genera archivos sintéticos y mide filas por segundo.
+
+Uso: python -m benchmarks.bench_importacion [--recetas 20000] [--ingredientes 5000] [--por-receta 10] [--formato csv|jsonl]
+'''
+import argparse
+import csv
+import json
+import os
+import tempfile
+import time
+
+from src.logica.ImportadorRecetario import ImportadorRecetario, leer_filas
+from src.modelo.Declarative_base import configurar_engine
+
+
+def escribir(ruta, filas, campos):
+    with open(ruta, 'w', encoding='utf-8', newline='') as archivo:
+        if ruta.endswith('.csv'):
+            escritor = csv.DictWriter(archivo, fieldnames=campos)
+            escritor.writeheader()
+            escritor.writerows(filas)
+        else:
+            for fila in filas:
+                archivo.write(json.dumps(fila, ensure_ascii=False) + '\n')
+
+
+def generar(directorio, formato, recetas, ingredientes, por_receta):
+    rutas = {tipo: os.path.join(directorio, '{}.{}'.format(tipo, formato))
+             for tipo in ('recetas', 'ingredientes', 'ingredientes_receta')}
+    escribir(rutas['recetas'], ({'nombre': 'Receta {}'.format(i), 'tiempo': 30, 'personas': 4, 'calorias': 250,
+                                 'preparacion': 'Mezclar y hornear.'} for i in range(recetas)),
+             ['nombre', 'tiempo', 'personas', 'calorias', 'preparacion'])
+    escribir(rutas['ingredientes'], ({'nombre': 'Ingrediente {}'.format(i), 'unidad': 'gramo', 'valor': 10 + i % 90,
+                                      'sitioCompra': 'Plaza Concordia'} for i in range(ingredientes)),
+             ['nombre', 'unidad', 'valor', 'sitioCompra'])
+    escribir(rutas['ingredientes_receta'], ({'receta': 'Receta {}'.format(i), 'ingrediente': 'Ingrediente {}'.format((i * 31 + j) % ingredientes),
+                                             'cantidad': 1 + j, 'unidad': ''} for i in range(recetas) for j in range(por_receta)),
+             ['receta', 'ingrediente', 'cantidad', 'unidad'])
+    return rutas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--recetas', type=int, default=20000)
+    parser.add_argument('--ingredientes', type=int, default=5000)
+    parser.add_argument('--por-receta', dest='por_receta', type=int, default=10)
+    parser.add_argument('--formato', choices=['csv', 'jsonl'], default='csv')
+    argumentos = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        rutas = generar(directorio, argumentos.formato, argumentos.recetas, argumentos.ingredientes, argumentos.por_receta)
+        configurar_engine(os.path.join(directorio, 'bench.sqlite'))
+        importador = ImportadorRecetario()
+        for tipo, importar in (('recetas', importador.importar_recetas), ('ingredientes', importador.importar_ingredientes),
+                               ('ingredientes_receta', importador.importar_ingredientes_receta)):
+            inicio = time.perf_counter()
+            resultado = importar(leer_filas(rutas[tipo]))
+            duracion = time.perf_counter() - inicio
+            print('{:<20} {:>9} filas  {:>8.2f} s  {:>10.0f} filas/s  {} errores'.format(
+                tipo, resultado['leidas'], duracion, resultado['leidas'] / duracion, len(resultado['errores'])))
+        configurar_engine(':memory:')
+
+
+if __name__ == '__main__':
+    main()
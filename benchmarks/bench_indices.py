@@ -0,0 +1,58 @@
+'''
+Benchmark de validar_crear_editar_receta con catálogos de distinto tamaño.
+
+Con el índice único sobre Receta.nombreNormalizado la búsqueda de duplicados es O(log n):
+el tiempo por validación debe mantenerse prácticamente constante entre 1k y 100k recetas.
+
+Uso: python -m benchmarks.bench_indices [--tamanos 1000 10000 100000] [--repeticiones 2000]
+'''
+import argparse
+import os
+import tempfile
+import time
+
+from src.logica.LogicaRecetario import LogicaRecetario
+from src.modelo.Declarative_base import configurar_engine, dar_engine
+from src.modelo.Receta import Receta
+
+
+def poblar_recetas(cantidad):
+    ''' Inserta cantidad recetas sintéticas en un solo executemany '''
+    filas = [{'nombre': 'Receta {:07d}'.format(i), 'nombreNormalizado': 'receta {:07d}'.format(i), 'tiempoPreparacion': 30, 'nroPersonasPreparacion': 4,
+              'caloriasPorcion': 250.0, 'instrucciones': 'Preparación...'} for i in range(cantidad)]
+    with dar_engine().begin() as conexion:
+        conexion.execute(Receta.__table__.insert(), filas)
+
+
+def medir(tamano, repeticiones):
+    with tempfile.TemporaryDirectory() as directorio:
+        configurar_engine(os.path.join(directorio, 'bench.sqlite'))
+        logica = LogicaRecetario()
+        poblar_recetas(tamano)
+
+        nombres = ['Receta {:07d}'.format((i * 7919) % tamano) for i in range(repeticiones)]
+        inicio = time.perf_counter()
+        for nombre in nombres:
+            logica.validar_crear_editar_receta(None, nombre, "30", "4", "250", "Preparación...")
+        duracion = time.perf_counter() - inicio
+
+        plan = dar_engine().execute(
+            'EXPLAIN QUERY PLAN SELECT id FROM Receta WHERE "nombreNormalizado" = ?', ('receta 0000001',)).fetchall()
+        configurar_engine(':memory:')
+    return duracion / repeticiones * 1e6, ' | '.join(str(fila[-1]) for fila in plan)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeticiones', type=int, default=2000)
+    argumentos = parser.parse_args()
+
+    print('{:>10}  {:>14}  {}'.format('recetas', 'us/validacion', 'plan'))
+    for tamano in argumentos.tamanos:
+        microsegundos, plan = medir(tamano, argumentos.repeticiones)
+        print('{:>10}  {:>14.1f}  {}'.format(tamano, microsegundos, plan))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+'''
+Benchmark de dar_preparacion para una receta con muchos ingredientes.
+
+Uso: python -m benchmarks.bench_preparacion [--ingredientes 100] [--repeticiones 1000]
+'''
+import argparse
+import os
+import tempfile
+import time
+
+from src.logica.LogicaRecetario import LogicaRecetario
+from src.modelo.Declarative_base import configurar_engine, dar_engine
+
+
+def poblar(ingredientes):
+    with dar_engine().begin() as conexion:
+        conexion.execute('INSERT INTO "Receta" (id, nombre, "tiempoPreparacion", "nroPersonasPreparacion", "caloriasPorcion", '
+                         'instrucciones) VALUES (1, \'Receta grande\', 120, 4, 500, \'...\')')
+        conexion.execute('INSERT INTO "Ingrediente" (id, nombre, "unidadMedida", "valorUnidad", "nombreProveedor") '
+                         'VALUES (?, ?, \'gramo\', ?, \'Plaza Concordia\')',
+                         [(i, 'Ingrediente {}'.format(i), 10 + i) for i in range(1, ingredientes + 1)])
+        conexion.execute('INSERT INTO "IngredienteReceta" ("idReceta", "idIngrediente", cantidad, "unidadMedida") '
+                         'VALUES (1, ?, ?, \'gramo\')', [(i, i % 7 + 1) for i in range(1, ingredientes + 1)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ingredientes', type=int, default=100)
+    parser.add_argument('--repeticiones', type=int, default=1000)
+    argumentos = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        configurar_engine(os.path.join(directorio, 'bench.sqlite'))
+        logica = LogicaRecetario()
+        poblar(argumentos.ingredientes)
+
+        tiempos = []
+        for personas in range(argumentos.repeticiones):
+            inicio = time.perf_counter()
+            logica.dar_preparacion(1, personas % 20 + 1)
+            tiempos.append((time.perf_counter() - inicio) * 1000)
+        configurar_engine(':memory:')
+
+    tiempos.sort()
+    print('dar_preparacion con {} ingredientes ({} llamadas)'.format(argumentos.ingredientes, argumentos.repeticiones))
+    print('p50: {:.3f} ms  p95: {:.3f} ms  p99: {:.3f} ms  max: {:.3f} ms'.format(
+        tiempos[len(tiempos) // 2], tiempos[int(len(tiempos) * 0.95)], tiempos[int(len(tiempos) * 0.99)], tiempos[-1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+'''
+Interfaz de línea de comandos del recetario, sin interfaz gráfica.
+
+Habla directamente con LogicaRecetario y nunca importa PyQt5, por lo que sirve en scripts
+y tareas programadas sin servidor gráfico. Cada comando importa sólo lo que necesita al
+ejecutarse: mostrar la ayuda o validar los argumentos no carga SQLAlchemy ni los modelos.
+
+Uso: python __main__.py listar [--orden nombre] [--limite 20] [--json] [--db recetario.sqlite]
+     python __main__.py ver ID | buscar TEXTO | preparar ID PERSONAS | catalogo
+     python __main__.py importar --recetas recetas.csv ... | exportar directorio ...
+'''
+import argparse
+import json
+import logging
+import os
+import sys
+
+# Comandos que reenvían sus argumentos al importador y al exportador masivos
+COMANDOS_REENVIADOS = ('importar', 'exportar')
+COMANDOS = ('listar', 'ver', 'buscar', 'preparar', 'catalogo') + COMANDOS_REENVIADOS
+
+
+def dar_logica(argumentos):
+    ''' Configura la base de datos indicada y retorna la lógica del recetario '''
+    if argumentos.db:
+        from src.modelo.Declarative_base import configurar_engine
+        configurar_engine(argumentos.db)
+    from src.logica.LogicaRecetario import LogicaRecetario
+    return LogicaRecetario()
+
+
+def imprimir_tabla(filas, columnas):
+    ''' Imprime filas de diccionarios como una tabla de texto alineada
+    Parámetros:
+        filas (list): Los diccionarios a imprimir
+        columnas (list): Tuplas (llave, encabezado) de las columnas a mostrar
+    '''
+    textos = [[formatear(fila[llave]) for llave, _ in columnas] for fila in filas]
+    anchos = [max([len(encabezado)] + [len(texto[indice]) for texto in textos])
+              for indice, (_, encabezado) in enumerate(columnas)]
+    for valores in [[encabezado for _, encabezado in columnas]] + textos:
+        print('  '.join(valor.ljust(ancho) for valor, ancho in zip(valores, anchos)).rstrip())
+
+
+def formatear(valor):
+    if valor is None:
+        return ''
+    if isinstance(valor, float):
+        return '{:g}'.format(round(valor, 2))
+    return str(valor)
+
+
+def imprimir_json(valor):
+    print(json.dumps(valor, ensure_ascii=False, indent=2))
+
+
+def listar(argumentos):
+    recetas = dar_logica(argumentos).dar_recetas(argumentos.desde, argumentos.limite, argumentos.orden)
+    if argumentos.json:
+        imprimir_json(recetas)
+    else:
+        imprimir_tabla(recetas, [('id', 'ID'), ('nombre', 'Nombre'), ('tiempo', 'Tiempo'),
+                                 ('personas', 'Personas'), ('calorias', 'Calorías')])
+    return 0
+
+
+def ver(argumentos):
+    logica = dar_logica(argumentos)
+    receta = logica.dar_receta(argumentos.id_receta)
+    if receta is None:
+        print('La receta no existe', file=sys.stderr)
+        return 1
+    receta['ingredientes'] = logica.dar_ingredientes_receta(argumentos.id_receta)
+    if argumentos.json:
+        imprimir_json(receta)
+        return 0
+    print(receta['nombre'])
+    print('Tiempo: {}  Personas: {}  Calorías por porción: {}'.format(
+        formatear(receta['tiempo']), formatear(receta['personas']), formatear(receta['calorias'])))
+    if receta['ingredientes']:
+        print()
+        imprimir_tabla(receta['ingredientes'], [('ingrediente', 'Ingrediente'), ('cantidad', 'Cantidad'),
+                                                ('unidad', 'Unidad')])
+    print()
+    print(receta['preparacion'])
+    return 0
+
+
+def buscar(argumentos):
+    recetas = dar_logica(argumentos).buscar_recetas(' '.join(argumentos.texto), argumentos.limite)
+    if argumentos.json:
+        imprimir_json(recetas)
+    else:
+        imprimir_tabla(recetas, [('id', 'ID'), ('nombre', 'Nombre'), ('fragmento', 'Fragmento')])
+    return 0
+
+
+def preparar(argumentos):
+    preparacion = dar_logica(argumentos).dar_preparacion(argumentos.id_receta, argumentos.personas)
+    if preparacion is None:
+        print('La receta no existe', file=sys.stderr)
+        return 1
+    if argumentos.json:
+        imprimir_json(preparacion)
+        return 0
+    print('{} para {} personas'.format(preparacion['receta'], preparacion['personas']))
+    print('Tiempo: {}  Calorías por porción: {}  Costo: {}'.format(
+        formatear(preparacion['tiempo_preparacion']), formatear(preparacion['calorias']),
+        formatear(preparacion['costo'])))
+    if preparacion['datos_ingredientes']:
+        print()
+        imprimir_tabla(preparacion['datos_ingredientes'], [('nombre', 'Ingrediente'), ('cantidad', 'Cantidad'),
+                                                           ('unidad', 'Unidad'), ('valor', 'Valor')])
+    return 0
+
+
+def catalogo(argumentos):
+    dar_logica(argumentos)
+    from sqlalchemy import func
+    from src.modelo.Declarative_base import dar_engine, unidad_de_trabajo
+    from src.modelo.Ingrediente import Ingrediente
+    from src.modelo.IngredienteReceta import IngredienteReceta
+    from src.modelo.Migraciones import dar_version
+    from src.modelo.Receta import Receta
+
+    with unidad_de_trabajo() as sesion:
+        resultado = {
+            'base_de_datos': str(dar_engine().url),
+            'version_esquema': dar_version(dar_engine()),
+            'recetas': sesion.query(func.count(Receta.id)).scalar(),
+            'ingredientes': sesion.query(func.count(Ingrediente.id)).scalar(),
+            'ingredientes_receta': sesion.query(func.count(IngredienteReceta.idReceta)).scalar(),
+        }
+    if argumentos.json:
+        imprimir_json(resultado)
+    else:
+        for llave, valor in resultado.items():
+            print('{}: {}'.format(llave, valor))
+    return 0
+
+
+def reenviar(comando, resto):
+    if comando == 'importar':
+        from src.logica.ImportadorRecetario import main as ejecutar
+    else:
+        from src.logica.ExportadorRecetario import main as ejecutar
+    return ejecutar(resto)
+
+
+def crear_parser():
+    comunes = argparse.ArgumentParser(add_help=False)
+    comunes.add_argument('--db', help='Ubicación de la base de datos (por defecto RECETARIO_DB o recetario.sqlite)')
+    comunes.add_argument('--json', action='store_true', help='Imprime el resultado como JSON')
+
+    parser = argparse.ArgumentParser(prog='recetario', description='Consulta del recetario desde la línea de comandos')
+    comandos = parser.add_subparsers(dest='comando', metavar='comando')
+    comandos.required = True
+
+    listado = comandos.add_parser('listar', parents=[comunes], help='Lista las recetas')
+    listado.add_argument('--orden', choices=['id', 'nombre'], default='id')
+    listado.add_argument('--limite', type=int, help='Cantidad máxima de recetas')
+    listado.add_argument('--desde', type=int, help='Id de la última receta de la página anterior')
+    listado.set_defaults(ejecutar=listar)
+
+    detalle = comandos.add_parser('ver', parents=[comunes], help='Muestra una receta con sus ingredientes')
+    detalle.add_argument('id_receta', type=int)
+    detalle.set_defaults(ejecutar=ver)
+
+    busqueda = comandos.add_parser('buscar', parents=[comunes], help='Busca recetas por nombre o instrucciones')
+    busqueda.add_argument('texto', nargs='+')
+    busqueda.add_argument('--limite', type=int, default=20)
+    busqueda.set_defaults(ejecutar=buscar)
+
+    preparacion = comandos.add_parser('preparar', parents=[comunes], help='Calcula la preparación para N personas')
+    preparacion.add_argument('id_receta', type=int)
+    preparacion.add_argument('personas', type=int)
+    preparacion.set_defaults(ejecutar=preparar)
+
+    resumen = comandos.add_parser('catalogo', parents=[comunes], help='Muestra el tamaño del catálogo')
+    resumen.set_defaults(ejecutar=catalogo)
+
+    for comando, ayuda in (('importar', 'Importación masiva (ver ImportadorRecetario --help)'),
+                           ('exportar', 'Exportación en flujo (ver ExportadorRecetario --help)')):
+        comandos.add_parser(comando, add_help=False, help=ayuda)
+    return parser
+
+
+def main(argumentos=None):
+    argumentos = sys.argv[1:] if argumentos is None else list(argumentos)
+    if argumentos and argumentos[0] in COMANDOS_REENVIADOS:
+        return reenviar(argumentos[0], argumentos[1:])
+    argumentos = crear_parser().parse_args(argumentos)
+    if argumentos.comando == 'preparar' and argumentos.personas <= 0:
+        print('La cantidad de personas debe ser mayor que cero', file=sys.stderr)
+        return 2
+    return argumentos.ejecutar(argumentos)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=os.environ.get('RECETARIO_LOG', 'WARNING').upper(),
+                        format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    sys.exit(main())
@@ -0,0 +1,118 @@
+'''
+Exportación en flujo del recetario a archivos JSONL o CSV.
+
+Las filas se recorren con yield_per y se escriben una a una, por lo que la memoria
+usada no depende del tamaño del catálogo. Los archivos generados usan los mismos
+campos que ImportadorRecetario, así que pueden importarse de nuevo.
+
+Uso: python -m src.logica.ExportadorRecetario directorio [--formato jsonl|csv] [--db recetario.sqlite] [--lote 1000]
+'''
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+from src.modelo.Declarative_base import configurar_engine, unidad_de_trabajo
+from src.modelo.Ingrediente import Ingrediente
+from src.modelo.IngredienteReceta import IngredienteReceta
+from src.modelo.Receta import Receta
+
+CAMPOS_RECETA = ['nombre', 'tiempo', 'personas', 'calorias', 'preparacion']
+CAMPOS_INGREDIENTE = ['nombre', 'unidad', 'valor', 'sitioCompra']
+CAMPOS_INGREDIENTE_RECETA = ['receta', 'ingrediente', 'cantidad', 'unidad']
+
+
+class ExportadorRecetario:
+    ''' Recorre las tablas del recetario por lotes y las escribe en flujo '''
+
+    def __init__(self, tamano_lote=1000):
+        self.tamano_lote = tamano_lote
+
+    def dar_recetas(self):
+        ''' Retorna un generador con las recetas en el formato de importación '''
+        with unidad_de_trabajo() as sesion:
+            consulta = sesion.query(Receta.nombre, Receta.tiempoPreparacion, Receta.nroPersonasPreparacion,
+                                    Receta.caloriasPorcion, Receta.instrucciones).order_by(Receta.id)
+            for fila in consulta.yield_per(self.tamano_lote):
+                yield dict(zip(CAMPOS_RECETA, fila))
+
+    def dar_ingredientes(self):
+        ''' Retorna un generador con los ingredientes en el formato de importación '''
+        with unidad_de_trabajo() as sesion:
+            consulta = sesion.query(Ingrediente.nombre, Ingrediente.unidadMedida, Ingrediente.valorUnidad,
+                                    Ingrediente.nombreProveedor).order_by(Ingrediente.id)
+            for fila in consulta.yield_per(self.tamano_lote):
+                yield dict(zip(CAMPOS_INGREDIENTE, fila))
+
+    def dar_ingredientes_receta(self):
+        ''' Retorna un generador con las relaciones receta-ingrediente identificadas por nombre '''
+        with unidad_de_trabajo() as sesion:
+            consulta = sesion.query(Receta.nombre, Ingrediente.nombre, IngredienteReceta.cantidad, IngredienteReceta.unidadMedida) \
+                .join(Receta, IngredienteReceta.idReceta == Receta.id) \
+                .join(Ingrediente, IngredienteReceta.idIngrediente == Ingrediente.id) \
+                .order_by(IngredienteReceta.idReceta, IngredienteReceta.idIngrediente)
+            for fila in consulta.yield_per(self.tamano_lote):
+                yield dict(zip(CAMPOS_INGREDIENTE_RECETA, fila))
+
+    def exportar(self, directorio, formato='jsonl'):
+        ''' Escribe recetas, ingredientes e ingredientes_receta en el directorio indicado
+        Parámetros:
+            directorio (string): Directorio de salida, se crea si no existe
+            formato (string): 'jsonl' o 'csv'
+        Retorna:
+            (dict): Las rutas escritas y la cantidad de filas de cada una, por tipo
+        '''
+        os.makedirs(directorio, exist_ok=True)
+        resultados = {}
+        for tipo, filas, campos in (('recetas', self.dar_recetas(), CAMPOS_RECETA),
+                                    ('ingredientes', self.dar_ingredientes(), CAMPOS_INGREDIENTE),
+                                    ('ingredientes_receta', self.dar_ingredientes_receta(), CAMPOS_INGREDIENTE_RECETA)):
+            ruta = os.path.join(directorio, '{}.{}'.format(tipo, formato))
+            resultados[tipo] = {'ruta': ruta, 'filas': escribir_filas(ruta, filas, campos)}
+        return resultados
+
+
+def escribir_filas(ruta, filas, campos):
+    ''' Escribe las filas en un archivo CSV o JSONL según la extensión de la ruta
+    Retorna:
+        (int): La cantidad de filas escritas
+    '''
+    cantidad = 0
+    with open(ruta, 'w', encoding='utf-8', newline='') as archivo:
+        if ruta.lower().endswith('.csv'):
+            escritor = csv.DictWriter(archivo, fieldnames=campos)
+            escritor.writeheader()
+            for fila in filas:
+                escritor.writerow(fila)
+                cantidad += 1
+        else:
+            for fila in filas:
+                archivo.write(json.dumps(fila, ensure_ascii=False))
+                archivo.write('\n')
+                cantidad += 1
+    return cantidad
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description='Exportación en flujo del recetario a JSONL o CSV')
+    parser.add_argument('directorio', help='Directorio de salida')
+    parser.add_argument('--formato', choices=['jsonl', 'csv'], default='jsonl')
+    parser.add_argument('--db', help='Ubicación de la base de datos (por defecto RECETARIO_DB o recetario.sqlite)')
+    parser.add_argument('--lote', type=int, default=1000, help='Filas leídas por lote')
+    argumentos = parser.parse_args(argumentos)
+    if argumentos.db:
+        configurar_engine(argumentos.db)
+
+    inicio = time.perf_counter()
+    resultados = ExportadorRecetario(argumentos.lote).exportar(argumentos.directorio, argumentos.formato)
+    duracion = time.perf_counter() - inicio
+    for tipo, resultado in resultados.items():
+        print('{}: {} filas en {}'.format(tipo, resultado['filas'], resultado['ruta']))
+    print('Exportación terminada en {:.2f} s'.format(duracion))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
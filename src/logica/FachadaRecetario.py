@@ -3,10 +3,14 @@ Esta clase es la fachada con los métodos a implementar en la lógica
 '''
 class FachadaRecetario:
 
-    def dar_recetas(self):
-        ''' Retorna la lista de recetas registradas en el sistema
+    def dar_recetas(self, desde_id=None, limite=None, orden="id"):
+        ''' Retorna la lista de recetas registradas en el sistema, paginada por llave
+        Parámetros:
+            desde_id (int): Identificador de la última receta de la página anterior, None para empezar
+            limite (int): Cantidad máxima de recetas, None para todas
+            orden (string): 'id' o 'nombre'
         Retorna:
-            (list): La lista con los objetos de recetas
+            (list): La lista con el resumen de las recetas, sin la preparación
         '''
         raise NotImplementedError("Método no implementado")
     
@@ -20,6 +24,17 @@ class FachadaRecetario:
         raise NotImplementedError("Método no implementado")
     
 
+    def buscar_recetas(self, texto, limite=20, desplazamiento=0):
+        ''' Busca recetas por palabras de su nombre o de sus instrucciones, sin distinguir tildes ni mayúsculas
+        Parámetros:
+            texto (string): Las palabras a buscar
+            limite (int): Cantidad máxima de resultados
+            desplazamiento (int): Cantidad de resultados a omitir, para paginar
+        Retorna:
+            (list): Las recetas encontradas ordenadas por relevancia
+        '''
+        raise NotImplementedError("Método no implementado")
+
     def validar_crear_editar_receta(self, id_receta, receta, tiempo, personas, calorias, preparacion):
         ''' Valida que una receta se pueda crear o editar
         Parámetros:
@@ -34,6 +49,15 @@ class FachadaRecetario:
         '''
         raise NotImplementedError("Método no implementado")
     
+    def validar_recetas_lote(self, filas):
+        ''' Valida un lote de recetas en una sola pasada, incluidos los nombres repetidos dentro del lote
+        Parámetros:
+            filas (list): Diccionarios con id (None o "-1" para recetas nuevas), nombre, tiempo, personas, calorias y preparacion
+        Retorna:
+            (list): Los errores encontrados como {'fila': posición desde 1, 'error': mensaje}
+        '''
+        raise NotImplementedError("Método no implementado")
+
     def crear_receta(self,receta, tiempo, personas, calorias, preparacion):
         ''' Crea una nueva receta
         Parámetros:
@@ -64,13 +88,28 @@ class FachadaRecetario:
         raise NotImplementedError("Método no implementado")
     
 
-    def dar_ingredientes(self):
-        ''' Retorna la lista de ingredientes
+    def dar_ingredientes(self, desde_id=None, limite=None, orden="id"):
+        ''' Retorna la lista de ingredientes, paginada por llave
+        Parámetros:
+            desde_id (int): Identificador del último ingrediente de la página anterior, None para empezar
+            limite (int): Cantidad máxima de ingredientes, None para todos
+            orden (string): 'id' o 'nombre'
         Retorna:
             (list): La lista con los dict o los objetos de los ingredientes
         '''
         raise NotImplementedError("Método no implementado")
     
+    def buscar_ingredientes(self, texto, limite=20):
+        ''' Busca ingredientes cuyo nombre contiene el texto, sin distinguir tildes ni mayúsculas
+        Parámetros:
+            texto (string): El texto a buscar; vacío retorna los primeros ingredientes por nombre
+            limite (int): Cantidad máxima de resultados
+        Retorna:
+            (list): Primero los ingredientes cuyo nombre empieza por el texto y luego los que lo
+                contienen, cada grupo ordenado por nombre, con los mismos datos de dar_ingredientes
+        '''
+        raise NotImplementedError("Método no implementado")
+
     def dar_ingrediente(self, id_ingrediente):
         ''' Retorna un ingrediente dado su id
         Retorna:
@@ -78,19 +117,29 @@ class FachadaRecetario:
         '''
         raise NotImplementedError("Método no implementado")
 
-    def validar_crear_editar_ingrediente(self, nombre, unidad, valor, sitioCompra):
+    def validar_crear_editar_ingrediente(self, nombre, unidad, valor, sitioCompra, id_ingrediente=None):
         ''' Valida que un ingrediente se pueda crear o editar
         Parámetros:
             nombre (string): El nombre del ingrediente
             unidad (string): Unidad
             valor (string): Valor del ingrediente para la unidad
             sitioCompra (string): lugar en el que se compra el ingrediente
+            id_ingrediente (int): El identificador del ingrediente que se edita, None si es nuevo
         Retorna:
             (string): El mensaje de error generado al presentarse errores en la
             validación o una cadena de caracteres vacía si no hay errores.
         '''
         raise NotImplementedError("Método no implementado")
 
+    def validar_ingredientes_lote(self, filas):
+        ''' Valida un lote de ingredientes en una sola pasada, incluidos los nombres repetidos dentro del lote
+        Parámetros:
+            filas (list): Diccionarios con id (None o "-1" para ingredientes nuevos), nombre, unidad, valor y sitioCompra
+        Retorna:
+            (list): Los errores encontrados como {'fila': posición desde 1, 'error': mensaje}
+        '''
+        raise NotImplementedError("Método no implementado")
+
 
     def editar_ingrediente(self, id_ingrediente, nombre, unidad, valor, sitioCompras):
         ''' Edita un ingrediente
@@ -162,4 +211,5 @@ class FachadaRecetario:
         Retorna:
             (dic) diccionario con los datos de preparacion de la receta: nombre, cantidad peronas, calorias, costo, tiempo de preparacion},
                   (list) ingredientes de la receta 
+                  None si la receta no existe o la cantidad de personas no es un número mayor que cero
         '''
@@ -0,0 +1,249 @@
+'''
+Importación masiva de recetas, ingredientes y sus relaciones desde archivos CSV o JSONL.
+
+Las filas se leen en flujo, se validan con las mismas reglas de la lógica y se insertan
+por lotes con executemany, un lote por transacción. Los errores se reportan por fila
+sin abortar el resto de la importación.
+
+Uso: python -m src.logica.ImportadorRecetario --recetas recetas.csv --ingredientes ingredientes.jsonl
+         --ingredientes-receta ingredientes_receta.csv [--db recetario.sqlite] [--lote 5000]
+'''
+import argparse
+import csv
+import json
+import sys
+import time
+from contextlib import closing
+
+from src.logica.LogicaRecetario import es_valor_numerico, texto_campo, validar_fila_ingrediente, validar_fila_receta
+from src.modelo.Declarative_base import configurar_engine, dar_engine, unidad_de_trabajo
+from src.modelo.Ingrediente import Ingrediente
+from src.modelo.IngredienteReceta import IngredienteReceta
+from src.modelo.Migraciones import migrar
+from src.modelo.Normalizacion import normalizar_nombre, normalizar_texto
+from src.modelo.Receta import Receta
+
+
+class FilaIlegible:
+    ''' Línea de un archivo JSONL que no se pudo interpretar; se reporta como error de su fila '''
+
+    def __init__(self, error):
+        self.error = error
+
+
+def leer_filas(ruta):
+    ''' Lee en flujo las filas de un archivo CSV (con encabezado) o JSONL
+    Parámetros:
+        ruta (string): Ruta del archivo; el formato se deduce de la extensión
+    Retorna:
+        (generator): Diccionarios con las filas del archivo, o FilaIlegible por cada línea JSON inválida
+    '''
+    with open(ruta, 'r', encoding='utf-8', newline='') as archivo:
+        if ruta.lower().endswith('.csv'):
+            for fila in csv.DictReader(archivo):
+                yield fila
+        else:
+            for linea in archivo:
+                if linea.strip():
+                    try:
+                        yield json.loads(linea)
+                    except ValueError:
+                        yield FilaIlegible("La línea no es un JSON válido")
+
+
+class ImportadorRecetario:
+    ''' Importa filas de recetas, ingredientes e ingredientes de receta por lotes '''
+
+    def __init__(self, tamano_lote=5000):
+        self.tamano_lote = tamano_lote
+        migrar(dar_engine())
+
+    def importar_recetas(self, filas):
+        ''' Importa recetas con los campos nombre, tiempo, personas, calorias y preparacion
+        Parámetros:
+            filas (iterable): Diccionarios con los datos de cada receta
+        Retorna:
+            (dict): leidas, insertadas y la lista de errores {'fila', 'error'}
+        '''
+        nombres = self._dar_nombres(Receta)
+
+        def convertir(fila):
+            fila = dict(fila, id=None, nombre=normalizar_texto(texto_campo(fila.get('nombre'))))
+            error = validar_fila_receta(fila, nombres)
+            if error != "":
+                return None, error
+            nombre = fila['nombre'].strip()
+            return {'nombre': nombre, 'nombreNormalizado': normalizar_nombre(nombre), 'tiempoPreparacion': int(float(fila['tiempo'])),
+                    'nroPersonasPreparacion': int(float(fila['personas'])), 'caloriasPorcion': float(fila['calorias']),
+                    'instrucciones': normalizar_texto(texto_campo(fila.get('preparacion')))}, ""
+
+        return self._insertar_por_lotes(Receta.__table__, filas, convertir)
+
+    def importar_ingredientes(self, filas):
+        ''' Importa ingredientes con los campos nombre, unidad, valor y sitioCompra
+        Parámetros:
+            filas (iterable): Diccionarios con los datos de cada ingrediente
+        Retorna:
+            (dict): leidas, insertadas y la lista de errores {'fila', 'error'}
+        '''
+        nombres = self._dar_nombres(Ingrediente)
+
+        def convertir(fila):
+            fila = dict(fila, id=None)
+            error = validar_fila_ingrediente(fila, nombres)
+            if error != "":
+                return None, error
+            nombre = normalizar_texto(texto_campo(fila['nombre']).strip())
+            return {'nombre': nombre, 'nombreNormalizado': normalizar_nombre(nombre), 'unidadMedida': texto_campo(fila['unidad']).strip(),
+                    'valorUnidad': float(fila['valor']), 'nombreProveedor': texto_campo(fila['sitioCompra']).strip()}, ""
+
+        return self._insertar_por_lotes(Ingrediente.__table__, filas, convertir)
+
+    def importar_ingredientes_receta(self, filas):
+        ''' Importa relaciones con los campos receta, ingrediente, cantidad y unidad (opcional).
+        Las recetas e ingredientes se identifican por nombre, sin distinguir tildes ni mayúsculas,
+        y deben existir previamente.
+        Parámetros:
+            filas (iterable): Diccionarios con los datos de cada relación
+        Retorna:
+            (dict): leidas, insertadas y la lista de errores {'fila', 'error'}
+        '''
+        with unidad_de_trabajo() as sesion:
+            conexion = sesion.connection()
+            recetas = dict(conexion.execute('SELECT "nombreNormalizado", id FROM "Receta"').fetchall())
+            ingredientes = {llave: (id_ingrediente, unidad) for id_ingrediente, llave, unidad
+                            in conexion.execute('SELECT id, "nombreNormalizado", "unidadMedida" FROM "Ingrediente"')}
+
+        def convertir(fila):
+            nombre_receta, nombre_ingrediente = (normalizar_nombre(texto_campo(fila.get(campo))) for campo in ('receta', 'ingrediente'))
+            cantidad = texto_campo(fila.get('cantidad')).strip()
+            if nombre_receta not in recetas:
+                return None, "La receta no existe"
+            if nombre_ingrediente not in ingredientes:
+                return None, "El ingrediente no existe"
+            if cantidad == "":
+                return None, "La cantidad no puede estar vacía"
+            if es_valor_numerico(cantidad) == False:
+                return None, "La cantidad debe ser númerica"
+            id_ingrediente, unidad = ingredientes[nombre_ingrediente]
+            return {'idReceta': recetas[nombre_receta], 'idIngrediente': id_ingrediente, 'cantidad': float(cantidad),
+                    'unidadMedida': texto_campo(fila.get('unidad')).strip() or unidad}, ""
+
+        def descartar_existentes(conexion, lote):
+            ''' Retira del lote las relaciones repetidas en el lote o ya registradas '''
+            ids_recetas = sorted({valores['idReceta'] for _, valores in lote})
+            existentes = set()
+            for inicio in range(0, len(ids_recetas), 500):
+                marcadores = ','.join('?' * len(ids_recetas[inicio:inicio + 500]))
+                existentes.update(tuple(fila) for fila in conexion.execute(
+                    'SELECT "idReceta", "idIngrediente" FROM "IngredienteReceta" WHERE "idReceta" IN ({})'.format(marcadores),
+                    ids_recetas[inicio:inicio + 500]))
+            validas, errores = [], []
+            for numero, valores in lote:
+                par = (valores['idReceta'], valores['idIngrediente'])
+                if par in existentes:
+                    errores.append({'fila': numero, 'error': "El ingrediente ya está en la receta"})
+                else:
+                    existentes.add(par)
+                    validas.append(valores)
+            return validas, errores
+
+        return self._insertar_por_lotes(IngredienteReceta.__table__, filas, convertir, descartar_existentes)
+
+    def importar_archivos(self, recetas=None, ingredientes=None, ingredientes_receta=None):
+        ''' Importa los archivos indicados en el orden recetas, ingredientes, ingredientes de receta
+        Retorna:
+            (dict): El resultado de cada archivo importado, por tipo
+        '''
+        resultados = {}
+        if recetas:
+            resultados['recetas'] = self.importar_recetas(leer_filas(recetas))
+        if ingredientes:
+            resultados['ingredientes'] = self.importar_ingredientes(leer_filas(ingredientes))
+        if ingredientes_receta:
+            resultados['ingredientes_receta'] = self.importar_ingredientes_receta(leer_filas(ingredientes_receta))
+        return resultados
+
+    def _dar_nombres(self, modelo):
+        ''' Carga una sola vez el mapa llave normalizada -> id de todo el catálogo '''
+        with unidad_de_trabajo() as sesion:
+            consulta = 'SELECT "nombreNormalizado", id FROM "{}"'.format(modelo.__tablename__)
+            return dict(sesion.connection().execute(consulta).fetchall())
+
+    def _insertar_por_lotes(self, tabla, filas, convertir, depurar_lote=None):
+        resultado = {'leidas': 0, 'insertadas': 0, 'errores': []}
+        lote = []
+        for numero, fila in enumerate(filas, start=1):
+            resultado['leidas'] += 1
+            if isinstance(fila, FilaIlegible):
+                valores, error = None, fila.error
+            elif not isinstance(fila, dict):
+                valores, error = None, "La fila debe ser un objeto con los campos"
+            else:
+                try:
+                    valores, error = convertir(fila)
+                except (ValueError, OverflowError):
+                    # Valores que pasan la validación pero no se pueden convertir, como 1e400, inf o nan
+                    valores, error = None, "Un valor numérico está fuera de rango"
+            if error != "":
+                resultado['errores'].append({'fila': numero, 'error': error})
+                continue
+            lote.append((numero, valores))
+            if len(lote) >= self.tamano_lote:
+                self._insertar_lote(tabla, lote, depurar_lote, resultado)
+                lote = []
+        if lote:
+            self._insertar_lote(tabla, lote, depurar_lote, resultado)
+        return resultado
+
+    def _insertar_lote(self, tabla, lote, depurar_lote, resultado):
+        # Una unidad de trabajo por lote: la transacción se confirma al salir
+        with unidad_de_trabajo() as sesion:
+            conexion = sesion.connection()
+            if depurar_lote is None:
+                valores = [valores for _, valores in lote]
+            else:
+                valores, errores = depurar_lote(conexion, lote)
+                resultado['errores'].extend(errores)
+            if valores:
+                # executemany directo sobre sqlite3 para evitar el procesamiento de parámetros por fila
+                columnas = list(valores[0].keys())
+                insercion = 'INSERT INTO "{}" ({}) VALUES ({})'.format(
+                    tabla.name, ', '.join('"{}"'.format(columna) for columna in columnas), ', '.join('?' * len(columnas)))
+                with closing(conexion.connection.cursor()) as cursor:
+                    cursor.executemany(insercion, [tuple(fila[columna] for columna in columnas) for fila in valores])
+            resultado['insertadas'] += len(valores)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description='Importación masiva al recetario desde CSV o JSONL')
+    parser.add_argument('--recetas', help='Archivo con recetas')
+    parser.add_argument('--ingredientes', help='Archivo con ingredientes')
+    parser.add_argument('--ingredientes-receta', dest='ingredientes_receta', help='Archivo con ingredientes de receta')
+    parser.add_argument('--db', help='Ubicación de la base de datos (por defecto RECETARIO_DB o recetario.sqlite)')
+    parser.add_argument('--lote', type=int, default=5000, help='Filas por transacción')
+    parser.add_argument('--max-errores', dest='max_errores', type=int, default=20, help='Errores a mostrar por archivo')
+    argumentos = parser.parse_args(argumentos)
+    if not (argumentos.recetas or argumentos.ingredientes or argumentos.ingredientes_receta):
+        parser.error('Debe indicar al menos un archivo a importar')
+    if argumentos.db:
+        configurar_engine(argumentos.db)
+
+    inicio = time.perf_counter()
+    resultados = ImportadorRecetario(argumentos.lote).importar_archivos(
+        argumentos.recetas, argumentos.ingredientes, argumentos.ingredientes_receta)
+    duracion = time.perf_counter() - inicio
+
+    total = 0
+    for tipo, resultado in resultados.items():
+        total += resultado['leidas']
+        print('{}: {} leídas, {} insertadas, {} errores'.format(
+            tipo, resultado['leidas'], resultado['insertadas'], len(resultado['errores'])))
+        for error in resultado['errores'][:argumentos.max_errores]:
+            print('  fila {}: {}'.format(error['fila'], error['error']))
+    print('{} filas en {:.2f} s ({:.0f} filas/s)'.format(total, duracion, total / duracion if duracion else 0))
+    return 1 if any(resultado['errores'] for resultado in resultados.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,176 @@
+'''
+Caché de lectura delante de cualquier implementación de FachadaRecetario.
+
+Sirve desde memoria las listas y consultas por id de recetas e ingredientes. Los métodos
+que modifican datos invalidan sólo las entradas afectadas. El tamaño es acotado con
+desalojo LRU y se llevan contadores de aciertos y fallos.
+'''
+import threading
+from collections import OrderedDict
+
+from src.logica.FachadaRecetario import FachadaRecetario
+
+
+def _copiar(valor):
+    if isinstance(valor, list):
+        return [dict(elemento) if isinstance(elemento, dict) else elemento for elemento in valor]
+    if isinstance(valor, dict):
+        return dict(valor)
+    return valor
+
+
+class LogicaCache(FachadaRecetario):
+
+    def __init__(self, logica, tamano_maximo=256):
+        ''' Parámetros:
+            logica (FachadaRecetario): La lógica a la que se delegan las llamadas
+            tamano_maximo (int): Cantidad máxima de entradas en la caché
+        '''
+        self.logica = logica
+        self.tamano_maximo = tamano_maximo
+        self._entradas = OrderedDict()
+        self._candado = threading.Lock()
+        self._estadisticas = {'aciertos': 0, 'fallos': 0, 'invalidaciones': 0, 'desalojos': 0}
+        # Aumenta con cada invalidación: una lectura que empezó antes no guarda su resultado
+        self._generacion = 0
+
+    def _leer(self, metodo, *argumentos, **opciones):
+        llave = (metodo, argumentos, tuple(sorted(opciones.items())))
+        with self._candado:
+            if llave in self._entradas:
+                self._entradas.move_to_end(llave)
+                self._estadisticas['aciertos'] += 1
+                return _copiar(self._entradas[llave])
+            self._estadisticas['fallos'] += 1
+            generacion = self._generacion
+        valor = getattr(self.logica, metodo)(*argumentos, **opciones)
+        with self._candado:
+            if generacion != self._generacion:
+                # Una escritura invalidó la caché mientras se leía: el valor puede estar desactualizado
+                return valor
+            self._entradas[llave] = _copiar(valor)
+            self._entradas.move_to_end(llave)
+            while len(self._entradas) > self.tamano_maximo:
+                self._entradas.popitem(last=False)
+                self._estadisticas['desalojos'] += 1
+        return valor
+
+    def _invalidar(self, metodo, *argumentos):
+        ''' Retira las entradas del método; si se indican argumentos, sólo las de esa llamada '''
+        with self._candado:
+            self._generacion += 1
+            for llave in [llave for llave in self._entradas
+                          if llave[0] == metodo and (not argumentos or llave[1] == argumentos)]:
+                del self._entradas[llave]
+                self._estadisticas['invalidaciones'] += 1
+
+    def limpiar_cache(self):
+        ''' Retira todas las entradas de la caché '''
+        with self._candado:
+            self._generacion += 1
+            self._estadisticas['invalidaciones'] += len(self._entradas)
+            self._entradas.clear()
+
+    def dar_estadisticas_cache(self):
+        ''' Retorna los contadores de la caché
+        Retorna:
+            (dict): aciertos, fallos, invalidaciones, desalojos, entradas y tasa_aciertos
+        '''
+        with self._candado:
+            estadisticas = dict(self._estadisticas)
+            estadisticas['entradas'] = len(self._entradas)
+        consultas = estadisticas['aciertos'] + estadisticas['fallos']
+        estadisticas['tasa_aciertos'] = estadisticas['aciertos'] / consultas if consultas else 0.0
+        return estadisticas
+
+    def dar_recetas(self, desde_id=None, limite=None, orden="id"):
+        return self._leer('dar_recetas', desde_id, limite, orden)
+
+    def dar_receta(self, id_receta):
+        return self._leer('dar_receta', id_receta)
+
+    def buscar_recetas(self, texto, limite=20, desplazamiento=0):
+        return self.logica.buscar_recetas(texto, limite, desplazamiento)
+
+    def validar_crear_editar_receta(self, id_receta, receta, tiempo, personas, calorias, preparacion):
+        return self.logica.validar_crear_editar_receta(id_receta, receta, tiempo, personas, calorias, preparacion)
+
+    def validar_recetas_lote(self, filas):
+        return self.logica.validar_recetas_lote(filas)
+
+    def crear_receta(self, receta, tiempo, personas, calorias, preparacion):
+        try:
+            return self.logica.crear_receta(receta, tiempo, personas, calorias, preparacion)
+        finally:
+            # Una consulta por id que retornó None deja de ser válida, también si se reutiliza un id borrado
+            self._invalidar('dar_recetas')
+            self._invalidar('dar_receta')
+
+    def editar_receta(self, id_receta, receta, tiempo, personas, calorias, preparacion):
+        try:
+            return self.logica.editar_receta(id_receta, receta, tiempo, personas, calorias, preparacion)
+        finally:
+            self._invalidar('dar_recetas')
+            self._invalidar('dar_receta', id_receta)
+
+    def eliminar_receta(self, id_receta):
+        try:
+            return self.logica.eliminar_receta(id_receta)
+        finally:
+            # Algunas lógicas identifican las recetas por posición: borrar desplaza las demás
+            self._invalidar('dar_recetas')
+            self._invalidar('dar_receta')
+
+    def dar_ingredientes(self, desde_id=None, limite=None, orden="id"):
+        return self._leer('dar_ingredientes', desde_id, limite, orden)
+
+    def buscar_ingredientes(self, texto, limite=20):
+        return self.logica.buscar_ingredientes(texto, limite)
+
+    def dar_ingrediente(self, id_ingrediente):
+        return self._leer('dar_ingrediente', id_ingrediente)
+
+    def validar_crear_editar_ingrediente(self, nombre, unidad, valor, sitioCompra, id_ingrediente=None):
+        return self.logica.validar_crear_editar_ingrediente(nombre, unidad, valor, sitioCompra, id_ingrediente)
+
+    def validar_ingredientes_lote(self, filas):
+        return self.logica.validar_ingredientes_lote(filas)
+
+    def crear_ingrediente(self, nombre, unidad, valor, sitioCompras):
+        try:
+            return self.logica.crear_ingrediente(nombre, unidad, valor, sitioCompras)
+        finally:
+            self._invalidar('dar_ingredientes')
+            self._invalidar('dar_ingrediente')
+
+    def editar_ingrediente(self, id_ingrediente, nombre, unidad, valor, sitioCompras):
+        try:
+            return self.logica.editar_ingrediente(id_ingrediente, nombre, unidad, valor, sitioCompras)
+        finally:
+            self._invalidar('dar_ingredientes')
+            self._invalidar('dar_ingrediente', id_ingrediente)
+
+    def eliminar_ingrediente(self, id_ingrediente):
+        try:
+            return self.logica.eliminar_ingrediente(id_ingrediente)
+        finally:
+            self._invalidar('dar_ingredientes')
+            self._invalidar('dar_ingrediente')
+
+    def dar_ingredientes_receta(self, id_receta):
+        return self.logica.dar_ingredientes_receta(id_receta)
+
+    def agregar_ingrediente_receta(self, receta, ingrediente, cantidad):
+        return self.logica.agregar_ingrediente_receta(receta, ingrediente, cantidad)
+
+    def editar_ingrediente_receta(self, id_ingrediente_receta, receta, ingrediente, cantidad):
+        return self.logica.editar_ingrediente_receta(id_ingrediente_receta, receta, ingrediente, cantidad)
+
+    def validar_crear_editar_ingReceta(self, receta, ingrediente, cantidad):
+        return self.logica.validar_crear_editar_ingReceta(receta, ingrediente, cantidad)
+
+    def eliminar_ingrediente_receta(self, id_ingrediente_receta, receta):
+        return self.logica.eliminar_ingrediente_receta(id_ingrediente_receta, receta)
+
+    def dar_preparacion(self, id_receta, cantidad_personas):
+        return self.logica.dar_preparacion(id_receta, cantidad_personas)
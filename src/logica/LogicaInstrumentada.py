@@ -0,0 +1,202 @@
+'''
+Instrumentación de cualquier implementación de FachadaRecetario.
+
+Cada método de la fachada se mide al delegarlo: cantidad de llamadas y errores, histograma
+de latencia, filas retornadas y sentencias SQL ejecutadas durante la llamada. Las llamadas
+se registran con logging (DEBUG siempre, WARNING si superan el umbral de lentitud) y las
+estadísticas se pueden consultar con dar_estadisticas() o volcar periódicamente a un archivo.
+'''
+import json
+import logging
+import os
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.logica.FachadaRecetario import FachadaRecetario
+
+logger = logging.getLogger(__name__)
+
+# Límites superiores en ms de los intervalos del histograma de latencia; el último es abierto
+LIMITES_HISTOGRAMA_MS = (1, 5, 10, 50, 100, 500, 1000)
+
+# Contadores de sentencias de las llamadas en curso en cada hilo
+_contadores = threading.local()
+_escucha_registrada = False
+_candado_escucha = threading.Lock()
+
+
+def _contar_sentencia(conexion, cursor, sentencia, parametros, contexto, executemany):
+    for contador in getattr(_contadores, 'pila', ()):
+        contador[0] += 1
+
+
+def _registrar_escucha():
+    ''' Cuenta las sentencias de todos los engines, incluidos los creados por configurar_engine '''
+    global _escucha_registrada
+    with _candado_escucha:
+        if not _escucha_registrada:
+            event.listen(Engine, 'before_cursor_execute', _contar_sentencia)
+            _escucha_registrada = True
+
+
+def _contar_filas(valor):
+    if isinstance(valor, list):
+        return len(valor)
+    return 0 if valor is None or isinstance(valor, (bool, str)) else 1
+
+
+def _etiqueta_intervalo(indice):
+    if indice < len(LIMITES_HISTOGRAMA_MS):
+        return '<={}ms'.format(LIMITES_HISTOGRAMA_MS[indice])
+    return '>{}ms'.format(LIMITES_HISTOGRAMA_MS[-1])
+
+
+def _instrumentar(metodo):
+    def medido(self, *argumentos, **opciones):
+        return self._medir(metodo, argumentos, opciones)
+    medido.__name__ = metodo
+    medido.__doc__ = getattr(getattr(FachadaRecetario, metodo, None), '__doc__', None)
+    return medido
+
+
+class LogicaInstrumentada(FachadaRecetario):
+
+    def __init__(self, logica, umbral_lento_ms=200):
+        ''' Parámetros:
+            logica (FachadaRecetario): La lógica a la que se delegan las llamadas
+            umbral_lento_ms (float): Duración a partir de la cual una llamada se registra como WARNING
+        '''
+        self.logica = logica
+        self.umbral_lento_ms = umbral_lento_ms
+        self._estadisticas = {}
+        self._candado = threading.Lock()
+        self._volcado = None
+        _registrar_escucha()
+
+    def __getattr__(self, nombre):
+        # Los métodos propios de la lógica envuelta (p. ej. dar_estadisticas_cache) se delegan sin medir
+        return getattr(self.logica, nombre)
+
+    def _medir(self, metodo, argumentos, opciones):
+        pila = getattr(_contadores, 'pila', None)
+        if pila is None:
+            pila = _contadores.pila = []
+        contador = [0]
+        pila.append(contador)
+        error = False
+        filas = 0
+        inicio = time.perf_counter()
+        try:
+            resultado = getattr(self.logica, metodo)(*argumentos, **opciones)
+            filas = _contar_filas(resultado)
+            return resultado
+        except Exception:
+            error = True
+            raise
+        finally:
+            duracion = (time.perf_counter() - inicio) * 1000
+            pila.pop()
+            self._registrar(metodo, duracion, filas, contador[0], error)
+
+    def _registrar(self, metodo, duracion, filas, sentencias, error):
+        intervalo = next((indice for indice, limite in enumerate(LIMITES_HISTOGRAMA_MS) if duracion <= limite),
+                         len(LIMITES_HISTOGRAMA_MS))
+        with self._candado:
+            estadistica = self._estadisticas.get(metodo)
+            if estadistica is None:
+                estadistica = self._estadisticas[metodo] = {
+                    'llamadas': 0, 'errores': 0, 'filas': 0, 'sentencias': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                    'histograma': [0] * (len(LIMITES_HISTOGRAMA_MS) + 1)}
+            estadistica['llamadas'] += 1
+            estadistica['errores'] += error
+            estadistica['filas'] += filas
+            estadistica['sentencias'] += sentencias
+            estadistica['total_ms'] += duracion
+            estadistica['max_ms'] = max(estadistica['max_ms'], duracion)
+            estadistica['histograma'][intervalo] += 1
+        nivel = logging.WARNING if duracion >= self.umbral_lento_ms else logging.DEBUG
+        logger.log(nivel, '%s: %.2f ms, %d filas, %d sentencias%s', metodo, duracion, filas, sentencias,
+                   ' (error)' if error else '')
+
+    def dar_estadisticas(self):
+        ''' Retorna una copia de las estadísticas acumuladas por método
+        Retorna:
+            (dict): Por método: llamadas, errores, filas, sentencias, total_ms, media_ms, max_ms e histograma
+        '''
+        with self._candado:
+            estadisticas = {}
+            for metodo, estadistica in self._estadisticas.items():
+                copia = dict(estadistica)
+                copia['media_ms'] = copia['total_ms'] / copia['llamadas']
+                copia['histograma'] = {_etiqueta_intervalo(indice): cantidad
+                                       for indice, cantidad in enumerate(estadistica['histograma'])}
+                estadisticas[metodo] = copia
+        return estadisticas
+
+    def reiniciar_estadisticas(self):
+        with self._candado:
+            self._estadisticas.clear()
+
+    def volcar_estadisticas(self, ruta):
+        ''' Escribe las estadísticas en un archivo JSON, reemplazándolo de forma atómica '''
+        temporal = ruta + '.tmp'
+        with open(temporal, 'w', encoding='utf-8') as archivo:
+            json.dump({'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'), 'metodos': self.dar_estadisticas()},
+                      archivo, ensure_ascii=False, indent=2)
+        os.replace(temporal, ruta)
+
+    def iniciar_volcado(self, ruta, intervalo=60):
+        ''' Vuelca las estadísticas en ruta cada intervalo segundos desde un hilo en segundo plano
+        Parámetros:
+            ruta (string): Archivo JSON de destino
+            intervalo (float): Segundos entre volcados
+        '''
+        self.detener_volcado()
+        detener = threading.Event()
+
+        def volcar():
+            while not detener.wait(intervalo):
+                try:
+                    self.volcar_estadisticas(ruta)
+                except OSError:
+                    logger.exception('No se pudieron volcar las estadísticas en %s', ruta)
+
+        hilo = threading.Thread(target=volcar, name='volcado-estadisticas', daemon=True)
+        self._volcado = (detener, hilo, ruta)
+        hilo.start()
+
+    def detener_volcado(self):
+        ''' Detiene el volcado periódico y escribe un último volcado '''
+        if self._volcado is None:
+            return
+        detener, hilo, ruta = self._volcado
+        self._volcado = None
+        detener.set()
+        hilo.join()
+        self.volcar_estadisticas(ruta)
+
+    dar_recetas = _instrumentar('dar_recetas')
+    dar_receta = _instrumentar('dar_receta')
+    buscar_recetas = _instrumentar('buscar_recetas')
+    validar_crear_editar_receta = _instrumentar('validar_crear_editar_receta')
+    validar_recetas_lote = _instrumentar('validar_recetas_lote')
+    crear_receta = _instrumentar('crear_receta')
+    editar_receta = _instrumentar('editar_receta')
+    eliminar_receta = _instrumentar('eliminar_receta')
+    dar_ingredientes = _instrumentar('dar_ingredientes')
+    buscar_ingredientes = _instrumentar('buscar_ingredientes')
+    dar_ingrediente = _instrumentar('dar_ingrediente')
+    validar_crear_editar_ingrediente = _instrumentar('validar_crear_editar_ingrediente')
+    validar_ingredientes_lote = _instrumentar('validar_ingredientes_lote')
+    crear_ingrediente = _instrumentar('crear_ingrediente')
+    editar_ingrediente = _instrumentar('editar_ingrediente')
+    eliminar_ingrediente = _instrumentar('eliminar_ingrediente')
+    dar_ingredientes_receta = _instrumentar('dar_ingredientes_receta')
+    agregar_ingrediente_receta = _instrumentar('agregar_ingrediente_receta')
+    editar_ingrediente_receta = _instrumentar('editar_ingrediente_receta')
+    validar_crear_editar_ingReceta = _instrumentar('validar_crear_editar_ingReceta')
+    eliminar_ingrediente_receta = _instrumentar('eliminar_ingrediente_receta')
+    dar_preparacion = _instrumentar('dar_preparacion')
@@ -0,0 +1,387 @@
+'''
+Implementación completa de FachadaRecetario en memoria, indexada por identificador.
+
+Las recetas e ingredientes se guardan en diccionarios id -> datos, con un índice por llave
+normalizada de nombre y listas ordenadas por id y por nombre para paginar. Las relaciones
+se guardan en un índice receta -> ingredientes y en el índice inverso ingrediente -> recetas,
+de modo que las consultas por id, por nombre y de relaciones son O(1) u O(k) en la cantidad
+de elementos involucrados, y las páginas y las búsquedas por prefijo son O(log n + k). Crear,
+renombrar y eliminar mantienen las listas ordenadas con insort y del, que son O(n) por copiar
+la lista, y la búsqueda de nombres que contienen el texto recorre el catálogo, también O(n).
+Los identificadores y los resultados siguen a LogicaRecetario, por lo que sirve para pruebas
+rápidas, demostraciones y como referencia en los benchmarks.
+'''
+import re
+from bisect import bisect_left, bisect_right, insort
+from itertools import count, islice
+
+from src.logica.FachadaRecetario import FachadaRecetario
+from src.logica.LogicaRecetario import (FIN_PREFIJO, es_cantidad_personas, es_valor_numerico, texto_campo,
+                                       validar_fila_ingrediente, validar_fila_receta)
+from src.modelo.Normalizacion import normalizar_nombre, normalizar_texto
+
+PATRON_PALABRA = re.compile(r"\w+")
+
+# Peso de las coincidencias en el nombre frente a las instrucciones, como en el índice FTS
+PESO_NOMBRE = 10
+
+
+def _numero(valor, tipo):
+    ''' Convierte los valores numéricos al tipo de la columna equivalente; los demás se conservan '''
+    if isinstance(valor, str) and es_valor_numerico(valor):
+        return tipo(float(valor))
+    return valor
+
+
+def _dar_id(valor):
+    ''' Acepta un identificador o el diccionario de una receta o ingrediente con llave id '''
+    return valor.get('id') if isinstance(valor, dict) else valor
+
+
+def _palabras(texto):
+    return PATRON_PALABRA.findall(normalizar_nombre(texto_campo(texto)))
+
+
+class _Catalogo:
+    ''' Elementos id -> datos con índice de nombres normalizados y órdenes para paginar y buscar '''
+
+    def __init__(self):
+        self.elementos = {}
+        self.nombres = {}
+        # Llaves normalizadas ordenadas: las que empiezan por un prefijo forman un rango contiguo
+        self.llaves = []
+        self.ids = []
+        self.por_nombre = []
+        self._siguiente_id = count(1)
+
+    def agregar(self, datos):
+        identificador = next(self._siguiente_id)
+        datos['id'] = identificador
+        self.elementos[identificador] = datos
+        llave = normalizar_nombre(datos['nombre'])
+        self.nombres[llave] = identificador
+        insort(self.llaves, llave)
+        # Los identificadores son crecientes: agregar al final conserva el orden
+        self.ids.append(identificador)
+        insort(self.por_nombre, (datos['nombre'], identificador))
+        return identificador
+
+    def renombrar(self, identificador, nombre):
+        datos = self.elementos[identificador]
+        self._quitar_llave(normalizar_nombre(datos['nombre']))
+        self._quitar_orden_nombre(datos['nombre'], identificador)
+        datos['nombre'] = nombre
+        llave = normalizar_nombre(nombre)
+        self.nombres[llave] = identificador
+        insort(self.llaves, llave)
+        insort(self.por_nombre, (nombre, identificador))
+
+    def quitar(self, identificador):
+        datos = self.elementos.pop(identificador)
+        self._quitar_llave(normalizar_nombre(datos['nombre']))
+        del self.ids[bisect_left(self.ids, identificador)]
+        self._quitar_orden_nombre(datos['nombre'], identificador)
+        return datos
+
+    def _quitar_orden_nombre(self, nombre, identificador):
+        del self.por_nombre[bisect_left(self.por_nombre, (nombre, identificador))]
+
+    def _quitar_llave(self, llave):
+        del self.nombres[llave]
+        del self.llaves[bisect_left(self.llaves, llave)]
+
+    def dar_id(self, nombre):
+        ''' Retorna el id del elemento con el mismo nombre normalizado o None '''
+        return self.nombres.get(normalizar_nombre(texto_campo(nombre)))
+
+    def dar_ids_por_nombre(self, nombres):
+        ''' Equivalente en memoria de dar_ids_por_nombre: llave normalizada -> id de los registrados '''
+        llaves = {normalizar_nombre(texto_campo(nombre)) for nombre in nombres}
+        return {llave: self.nombres[llave] for llave in llaves if llave in self.nombres}
+
+    def buscar(self, texto, limite):
+        ''' Retorna los ids de los elementos cuyo nombre empieza por el texto y luego de los que lo
+        contienen, con la misma semántica de buscar_ingredientes en LogicaRecetario '''
+        clave = normalizar_nombre(texto_campo(texto)) or ""
+        inicio = bisect_left(self.llaves, clave)
+        fin = bisect_left(self.llaves, clave + FIN_PREFIJO, inicio, min(inicio + limite, len(self.llaves)))
+        encontradas = self.llaves[inicio:fin]
+        if clave != "" and len(encontradas) < limite:
+            encontradas += islice((llave for llave in self.llaves if llave.find(clave) > 0), limite - len(encontradas))
+        return [self.nombres[llave] for llave in encontradas]
+
+    def paginar(self, desde_id, limite, orden):
+        ''' Retorna los ids de la página con la misma semántica de paginar en LogicaRecetario '''
+        if orden not in ("id", "nombre"):
+            raise ValueError("Orden no soportado: {}".format(orden))
+        if orden == "id":
+            llaves = self.ids
+            inicio = 0 if desde_id is None else bisect_right(self.ids, desde_id)
+        else:
+            llaves = self.por_nombre
+            if desde_id is None:
+                inicio = 0
+            elif desde_id in self.elementos:
+                inicio = bisect_right(self.por_nombre, (self.elementos[desde_id]['nombre'], desde_id))
+            else:
+                return []
+        fin = len(llaves) if limite is None else inicio + limite
+        return [llave if orden == "id" else llave[1] for llave in llaves[inicio:fin]]
+
+
+class LogicaMemoria(FachadaRecetario):
+
+    def __init__(self):
+        self.recetas = _Catalogo()
+        self.ingredientes = _Catalogo()
+        # id_receta -> {id_ingrediente: {'cantidad', 'unidad'}}, en orden de inserción
+        self.ingredientes_por_receta = {}
+        # id_ingrediente -> ids de las recetas que lo usan
+        self.recetas_por_ingrediente = {}
+        # palabra normalizada -> ids de las recetas que la contienen, y las palabras ordenadas para buscar por prefijo
+        self.recetas_por_palabra = {}
+        self.palabras = []
+
+    def dar_recetas(self, desde_id=None, limite=None, orden="id"):
+        return [self._resumen_receta(self.recetas.elementos[id_receta])
+                for id_receta in self.recetas.paginar(desde_id, limite, orden)]
+
+    def dar_receta(self, id_receta):
+        receta = self.recetas.elementos.get(id_receta)
+        return None if receta is None else dict(receta)
+
+    def buscar_recetas(self, texto, limite=20, desplazamiento=0):
+        terminos = _palabras(texto)
+        if not terminos:
+            return []
+        encontradas = None
+        for termino in terminos:
+            ids = set()
+            for palabra in self._palabras_con_prefijo(termino):
+                ids |= self.recetas_por_palabra[palabra]
+            encontradas = ids if encontradas is None else encontradas & ids
+            if not encontradas:
+                return []
+
+        def relevancia(id_receta):
+            receta = self.recetas.elementos[id_receta]
+            nombre = _palabras(receta['nombre'])
+            preparacion = _palabras(receta['preparacion'])
+            puntaje = sum(PESO_NOMBRE * sum(palabra.startswith(termino) for palabra in nombre)
+                          + sum(palabra.startswith(termino) for palabra in preparacion) for termino in terminos)
+            return -puntaje, id_receta
+
+        resultado = []
+        for id_receta in sorted(encontradas, key=relevancia)[desplazamiento:desplazamiento + limite]:
+            receta = self.recetas.elementos[id_receta]
+            encontrada = self._resumen_receta(receta)
+            encontrada['fragmento'] = self._fragmento(receta['preparacion'], terminos)
+            resultado.append(encontrada)
+        return resultado
+
+    def validar_crear_editar_receta(self, id_receta, receta, tiempo, personas, calorias, preparacion):
+        errores = self.validar_recetas_lote([{"id": id_receta, "nombre": receta, "tiempo": tiempo, "personas": personas,
+                                              "calorias": calorias, "preparacion": preparacion}])
+        return errores[0]["error"] if errores else ""
+
+    def validar_recetas_lote(self, filas):
+        nombres = self.recetas.dar_ids_por_nombre(fila.get("nombre") for fila in filas)
+        return [{"fila": posicion, "error": error}
+                for posicion, error in enumerate((validar_fila_receta(fila, nombres) for fila in filas), start=1)
+                if error != ""]
+
+    def crear_receta(self, receta, tiempo, personas, calorias, preparacion):
+        # Las mismas validaciones de LogicaRecetario: un nombre vacío o repetido no se guarda
+        if self.validar_crear_editar_receta(None, receta, tiempo, personas, calorias, preparacion) != "":
+            return False
+        id_receta = self.recetas.agregar({'nombre': normalizar_texto(receta), 'tiempo': _numero(tiempo, int),
+                                          'personas': _numero(personas, int), 'calorias': _numero(calorias, float),
+                                          'preparacion': normalizar_texto(preparacion)})
+        self.ingredientes_por_receta[id_receta] = {}
+        self._indexar_palabras(id_receta)
+        return True
+
+    def editar_receta(self, id_receta, receta, tiempo, personas, calorias, preparacion):
+        if id_receta not in self.recetas.elementos or \
+                self.validar_crear_editar_receta(id_receta, receta, tiempo, personas, calorias, preparacion) != "":
+            return False
+        self._desindexar_palabras(id_receta)
+        self.recetas.renombrar(id_receta, normalizar_texto(receta))
+        self.recetas.elementos[id_receta].update({'tiempo': _numero(tiempo, int), 'personas': _numero(personas, int),
+                                                  'calorias': _numero(calorias, float),
+                                                  'preparacion': normalizar_texto(preparacion)})
+        self._indexar_palabras(id_receta)
+        return True
+
+    def eliminar_receta(self, id_receta):
+        if id_receta not in self.recetas.elementos:
+            return False
+        self._desindexar_palabras(id_receta)
+        for id_ingrediente in self.ingredientes_por_receta.pop(id_receta):
+            self.recetas_por_ingrediente[id_ingrediente].discard(id_receta)
+        self.recetas.quitar(id_receta)
+        return True
+
+    def dar_ingredientes(self, desde_id=None, limite=None, orden="id"):
+        return [dict(self.ingredientes.elementos[id_ingrediente])
+                for id_ingrediente in self.ingredientes.paginar(desde_id, limite, orden)]
+
+    def buscar_ingredientes(self, texto, limite=20):
+        return [dict(self.ingredientes.elementos[id_ingrediente])
+                for id_ingrediente in self.ingredientes.buscar(texto, limite)]
+
+    def dar_ingrediente(self, id_ingrediente):
+        ingrediente = self.ingredientes.elementos.get(id_ingrediente)
+        return None if ingrediente is None else dict(ingrediente)
+
+    def validar_crear_editar_ingrediente(self, nombre, unidad, valor, sitioCompra, id_ingrediente=None):
+        errores = self.validar_ingredientes_lote([{"id": id_ingrediente, "nombre": nombre, "unidad": unidad,
+                                                   "valor": valor, "sitioCompra": sitioCompra}])
+        return errores[0]["error"] if errores else ""
+
+    def validar_ingredientes_lote(self, filas):
+        nombres = self.ingredientes.dar_ids_por_nombre(fila.get("nombre") for fila in filas)
+        return [{"fila": posicion, "error": error}
+                for posicion, error in enumerate((validar_fila_ingrediente(fila, nombres) for fila in filas), start=1)
+                if error != ""]
+
+    def crear_ingrediente(self, nombre, unidad, valor, sitioCompras):
+        if self.validar_crear_editar_ingrediente(nombre, unidad, valor, sitioCompras) != "":
+            return False
+        id_ingrediente = self.ingredientes.agregar({'nombre': normalizar_texto(nombre), 'unidad': unidad,
+                                                    'valor': _numero(valor, float), 'sitioCompra': sitioCompras})
+        self.recetas_por_ingrediente[id_ingrediente] = set()
+        return True
+
+    def editar_ingrediente(self, id_ingrediente, nombre, unidad, valor, sitioCompras):
+        if id_ingrediente not in self.ingredientes.elementos or \
+                self.validar_crear_editar_ingrediente(nombre, unidad, valor, sitioCompras, id_ingrediente) != "":
+            return False
+        self.ingredientes.renombrar(id_ingrediente, normalizar_texto(nombre))
+        self.ingredientes.elementos[id_ingrediente].update({'unidad': unidad, 'valor': _numero(valor, float),
+                                                            'sitioCompra': sitioCompras})
+        return True
+
+    def eliminar_ingrediente(self, id_ingrediente):
+        if id_ingrediente not in self.ingredientes.elementos:
+            return False
+        # El índice inverso evita recorrer todas las recetas
+        for id_receta in self.recetas_por_ingrediente.pop(id_ingrediente):
+            del self.ingredientes_por_receta[id_receta][id_ingrediente]
+        self.ingredientes.quitar(id_ingrediente)
+        return True
+
+    def dar_ingredientes_receta(self, id_receta):
+        return [{"ingrediente": self.ingredientes.elementos[id_ingrediente]['nombre'],
+                 "unidad": relacion['unidad'],
+                 "cantidad": relacion['cantidad']}
+                for id_ingrediente, relacion in self.ingredientes_por_receta.get(id_receta, {}).items()]
+
+    def agregar_ingrediente_receta(self, receta, ingrediente, cantidad):
+        id_receta, id_ingrediente = _dar_id(receta), _dar_id(ingrediente)
+        if id_receta not in self.recetas.elementos or id_ingrediente not in self.ingredientes.elementos:
+            return False
+        relaciones = self.ingredientes_por_receta[id_receta]
+        if id_ingrediente in relaciones:
+            return False
+        relaciones[id_ingrediente] = {'cantidad': _numero(cantidad, float),
+                                      'unidad': self.ingredientes.elementos[id_ingrediente]['unidad']}
+        self.recetas_por_ingrediente[id_ingrediente].add(id_receta)
+        return True
+
+    def editar_ingrediente_receta(self, id_ingrediente_receta, receta, ingrediente, cantidad):
+        ''' Como en la tabla IngredienteReceta, id_ingrediente_receta es el id del ingrediente dentro de la receta '''
+        id_receta, id_ingrediente = _dar_id(receta), _dar_id(ingrediente)
+        relaciones = self.ingredientes_por_receta.get(id_receta, {})
+        if id_ingrediente_receta not in relaciones or id_ingrediente not in self.ingredientes.elementos:
+            return False
+        if id_ingrediente != id_ingrediente_receta:
+            if id_ingrediente in relaciones:
+                return False
+            del relaciones[id_ingrediente_receta]
+            self.recetas_por_ingrediente[id_ingrediente_receta].discard(id_receta)
+            self.recetas_por_ingrediente[id_ingrediente].add(id_receta)
+        relaciones[id_ingrediente] = {'cantidad': _numero(cantidad, float),
+                                      'unidad': self.ingredientes.elementos[id_ingrediente]['unidad']}
+        return True
+
+    def validar_crear_editar_ingReceta(self, receta, ingrediente, cantidad):
+        if _dar_id(receta) not in self.recetas.elementos:
+            return "La receta no existe"
+        if _dar_id(ingrediente) not in self.ingredientes.elementos:
+            return "El ingrediente no existe"
+        cantidad = texto_campo(cantidad).strip()
+        if cantidad == "":
+            return "La cantidad no puede estar vacía"
+        if es_valor_numerico(cantidad) == False:
+            return "La cantidad debe ser númerica"
+        return ""
+
+    def eliminar_ingrediente_receta(self, id_ingrediente_receta, receta):
+        id_receta = _dar_id(receta)
+        relaciones = self.ingredientes_por_receta.get(id_receta, {})
+        if id_ingrediente_receta not in relaciones:
+            return False
+        del relaciones[id_ingrediente_receta]
+        self.recetas_por_ingrediente[id_ingrediente_receta].discard(id_receta)
+        return True
+
+    def dar_preparacion(self, id_receta, cantidad_personas):
+        receta = self.recetas.elementos.get(id_receta)
+        if receta is None or not es_cantidad_personas(cantidad_personas):
+            return None
+        personas = float(cantidad_personas)
+        factor = personas / (receta['personas'] or personas or 1)
+        datos_ingredientes = []
+        for id_ingrediente, relacion in self.ingredientes_por_receta[id_receta].items():
+            ingrediente = self.ingredientes.elementos[id_ingrediente]
+            cantidad = relacion['cantidad'] * factor
+            datos_ingredientes.append({"nombre": ingrediente['nombre'], "unidad": relacion['unidad'],
+                                       "cantidad": cantidad, "valor": cantidad * ingrediente['valor']})
+        datos_ingredientes.sort(key=lambda datos: datos['nombre'])
+        return {
+            "receta": receta['nombre'],
+            "personas": cantidad_personas,
+            "calorias": receta['calorias'],
+            "costo": sum(datos['valor'] for datos in datos_ingredientes),
+            "tiempo_preparacion": receta['tiempo'],
+            "datos_ingredientes": datos_ingredientes
+        }
+
+    def _resumen_receta(self, receta):
+        return {"id": receta['id'], "nombre": receta['nombre'], "tiempo": receta['tiempo'],
+                "personas": receta['personas'], "calorias": receta['calorias']}
+
+    def _palabras_receta(self, id_receta):
+        receta = self.recetas.elementos[id_receta]
+        return set(_palabras(receta['nombre'])) | set(_palabras(receta['preparacion']))
+
+    def _indexar_palabras(self, id_receta):
+        for palabra in self._palabras_receta(id_receta):
+            if palabra not in self.recetas_por_palabra:
+                self.recetas_por_palabra[palabra] = set()
+                insort(self.palabras, palabra)
+            self.recetas_por_palabra[palabra].add(id_receta)
+
+    def _desindexar_palabras(self, id_receta):
+        for palabra in self._palabras_receta(id_receta):
+            recetas = self.recetas_por_palabra[palabra]
+            recetas.discard(id_receta)
+            if not recetas:
+                del self.recetas_por_palabra[palabra]
+                del self.palabras[bisect_left(self.palabras, palabra)]
+
+    def _palabras_con_prefijo(self, prefijo):
+        for indice in range(bisect_left(self.palabras, prefijo), len(self.palabras)):
+            if not self.palabras[indice].startswith(prefijo):
+                break
+            yield self.palabras[indice]
+
+    def _fragmento(self, preparacion, terminos, tamano=12):
+        ''' Hasta tamano palabras de la preparación alrededor de la primera coincidencia '''
+        palabras = texto_campo(preparacion).split()
+        posicion = next((indice for indice, palabra in enumerate(palabras)
+                         if any(normalizada.startswith(termino) for normalizada in _palabras(palabra) for termino in terminos)), 0)
+        inicio = max(0, min(posicion - tamano // 2, len(palabras) - tamano))
+        fragmento = " ".join(palabras[inicio:inicio + tamano])
+        return ("..." if inicio > 0 else "") + fragmento + ("..." if inicio + tamano < len(palabras) else "")
@@ -1,6 +1,8 @@
 '''
 Esta clase es tan sólo un mock con datos para probar la interfaz
 '''
+import unicodedata
+
 from src.logica.FachadaRecetario import FachadaRecetario
 
 
@@ -35,14 +37,36 @@ class LogicaMock(FachadaRecetario):
 
 
 
-    def dar_recetas(self):
-        return self.recetas.copy()
+    def dar_recetas(self, desde_id=None, limite=None, orden="id"):
+        #Como en LogicaRecetario, la lista no incluye la preparación; sólo la retorna dar_receta
+        return [{llave: valor for llave, valor in receta.items() if llave != 'preparacion'}
+                for receta in self.paginar(self.recetas, desde_id, limite, orden)]
     
     def dar_receta(self, id_receta):
         return self.recetas[id_receta].copy()
     
+    def simplificar(self, cadena):
+        descompuesta = unicodedata.normalize("NFD", cadena.casefold())
+        return "".join(c for c in descompuesta if not unicodedata.combining(c))
+
+    def buscar_recetas(self, texto, limite=20, desplazamiento=0):
+        palabras = self.simplificar(texto or "").split()
+        if not palabras:
+            return []
+        resultado = []
+        for id_receta, receta in enumerate(self.recetas):
+            contenido = self.simplificar(receta['nombre'] + " " + receta['preparacion'])
+            if all(palabra in contenido for palabra in palabras):
+                encontrada = receta.copy()
+                encontrada['id'] = id_receta
+                resultado.append(encontrada)
+        return resultado[desplazamiento:desplazamiento + limite]
+
     def validar_crear_editar_receta(self, id_receta, receta, tiempo, personas, calorias, preparacion):
         return ""
+
+    def validar_recetas_lote(self, filas):
+        return []
     
     def crear_receta(self, receta, tiempo, personas, calorias, preparacion):
         self.recetas.append({'nombre': receta, 'tiempo': tiempo, 'personas': personas, 'calorias': calorias, 'preparacion': preparacion})
@@ -58,14 +82,24 @@ class LogicaMock(FachadaRecetario):
         del self.recetas[id_receta]
 
 
-    def dar_ingredientes(self):
-        return self.ingredientes.copy()
+    def dar_ingredientes(self, desde_id=None, limite=None, orden="id"):
+        return self.paginar(self.ingredientes, desde_id, limite, orden)
     
+    def buscar_ingredientes(self, texto, limite=20):
+        clave = self.simplificar(texto or "")
+        llaves = sorted((self.simplificar(ingrediente['nombre']), posicion) for posicion, ingrediente in enumerate(self.ingredientes))
+        prefijos = [posicion for llave, posicion in llaves if llave.startswith(clave)]
+        contenidos = [posicion for llave, posicion in llaves if llave.find(clave) > 0]
+        return [dict(self.ingredientes[posicion], id=posicion) for posicion in (prefijos + contenidos)[:limite]]
+
     def dar_ingrediente(self, id_ingrediente):
         return self.ingredientes[id_ingrediente].copy()
 
-    def validar_crear_editar_ingrediente(self, nombre, unidad, valor, sitioCompra):
+    def validar_crear_editar_ingrediente(self, nombre, unidad, valor, sitioCompra, id_ingrediente=None):
         return ""
+
+    def validar_ingredientes_lote(self, filas):
+        return []
 		
     def crear_ingrediente(self, nombre, unidad, valor, sitioCompras):
         self.ingredientes.append({'nombre': nombre, 'unidad': unidad, 'valor': valor, 'sitioCompra': sitioCompras})
@@ -111,3 +145,13 @@ class LogicaMock(FachadaRecetario):
     def dar_preparacion(self, id_receta,cantidad_personas):
         return self.preparacion
 
+    def paginar(self, lista, desde_id, limite, orden):
+        #En el mock el identificador es la posición en la lista
+        if orden not in ("id", "nombre"):
+            raise ValueError("Orden no soportado: {}".format(orden))
+        posiciones = list(range(len(lista)))
+        if orden == "nombre":
+            posiciones.sort(key=lambda posicion: lista[posicion]['nombre'])
+        inicio = 0 if desde_id is None else posiciones.index(desde_id) + 1
+        fin = None if limite is None else inicio + limite
+        return [dict(lista[posicion], id=posicion) for posicion in posiciones[inicio:fin]]
@@ -1,94 +1,171 @@
+import logging
+import math
+import re
+
+from sqlalchemy import Float, func, literal, select, text
+from sqlalchemy.orm import undefer
+
 from src.logica.FachadaRecetario import FachadaRecetario
-from src.modelo.Declarative_base import Base, engine, session
+from src.modelo.Declarative_base import dar_engine, unidad_de_trabajo
+from src.modelo.Migraciones import migrar
+from src.modelo.Normalizacion import construir_consulta_fts, normalizar_nombre
 from src.modelo.Receta import Receta
 from src.modelo.Ingrediente import Ingrediente
 from src.modelo.IngredienteReceta import IngredienteReceta
+
+logger = logging.getLogger(__name__)
+
+
 class LogicaRecetario(FachadaRecetario):
 
     def __init__(self):
-        Base.metadata.create_all(engine)
+        migrar(dar_engine())
 
-    def dar_recetas(self):
-        recetas = session.query(Receta).all()
+    def dar_recetas(self, desde_id=None, limite=None, orden="id"):
+        # Proyección liviana: las instrucciones sólo se cargan en dar_receta
+        with unidad_de_trabajo() as sesion:
+            consulta = sesion.query(Receta.id, Receta.nombre, Receta.tiempoPreparacion,
+                                    Receta.nroPersonasPreparacion, Receta.caloriasPorcion)
+            recetas = paginar(consulta, Receta, desde_id, limite, orden).all()
         resultado = []
-        for receta in recetas:
+        for id_receta, nombre, tiempo, personas, calorias in recetas:
             resultado.append({
+                "id": id_receta,
+                "nombre": nombre,
+                "tiempo": tiempo,
+                "personas": personas,
+                "calorias": calorias
+            })
+        logger.debug("dar_recetas: %d recetas", len(resultado))
+        return resultado
+    
+    def dar_receta(self, id_receta):
+        with unidad_de_trabajo() as sesion:
+            receta = sesion.query(Receta).options(undefer(Receta.instrucciones)).filter(Receta.id == id_receta).first()
+            if receta is None:
+                return None
+            return {
                 "id": receta.id,
                 "nombre": receta.nombre,
                 "tiempo": receta.tiempoPreparacion,
                 "personas": receta.nroPersonasPreparacion,
                 "calorias": receta.caloriasPorcion,
                 "preparacion": receta.instrucciones
-            })
-        print(resultado)
-        return resultado
-    
-    def dar_receta(self, id_receta):
-        raise NotImplementedError("Método no implementado")
-    
+            }
+
+    def buscar_recetas(self, texto, limite=20, desplazamiento=0):
+        consulta = construir_consulta_fts(texto)
+        if consulta == "":
+            return []
+        with unidad_de_trabajo() as sesion:
+            filas = sesion.execute(text('''
+                SELECT r.id, r.nombre, r."tiempoPreparacion", r."nroPersonasPreparacion", r."caloriasPorcion",
+                       snippet("RecetaBusqueda", 1, '', '', '...', 12)
+                FROM "RecetaBusqueda" JOIN "Receta" r ON r.id = "RecetaBusqueda".rowid
+                WHERE "RecetaBusqueda" MATCH :consulta
+                ORDER BY bm25("RecetaBusqueda", 10.0, 1.0)
+                LIMIT :limite OFFSET :desplazamiento'''),
+                {"consulta": consulta, "limite": limite, "desplazamiento": desplazamiento}).fetchall()
+        return [{
+            "id": fila[0],
+            "nombre": fila[1],
+            "tiempo": fila[2],
+            "personas": fila[3],
+            "calorias": fila[4],
+            "fragmento": fila[5]
+        } for fila in filas]
+
     def validar_crear_editar_receta(self, id_receta, receta, tiempo, personas, calorias, preparacion):
-        # Validaciones
-        if not receta or receta.strip() == "":
-            return "El nombre de la receta no puede estar vacío"
-        if not tiempo or tiempo.strip() == "":
-            return "El tiempo de preparación no puede estar vacío"
-        if self.es_valor_numerico(tiempo) == False:
-            return "El tiempo debe ser númerico"
-        if not personas or personas.strip() == "":
-            return "El número de personas no puede estar vacio"
-        if self.es_valor_numerico(personas) == False:
-            return "El número de personas debe ser númerico"
-        if not calorias or calorias.strip() == "":
-            return "Las el número de calorías no puede estar vacio"
-        if self.es_valor_numerico(calorias) == False:
-            return "Las calorías deben ser númericas"
-        # Consultar si existe otra receta con ese nombre
-        busqueda = session.query(Receta).filter(Receta.nombre == receta).first()
-        if id_receta is None or id_receta == "-1":
-            if busqueda:
-                return "La receta ya existe"
-        else:
-            if busqueda and busqueda.id != int(id_receta):
-                return "La receta ya existe"
-        return ""
+        errores = self.validar_recetas_lote([{"id": id_receta, "nombre": receta, "tiempo": tiempo, "personas": personas,
+                                              "calorias": calorias, "preparacion": preparacion}])
+        return errores[0]["error"] if errores else ""
+
+    def validar_recetas_lote(self, filas):
+        ''' Valida un lote de recetas con una sola consulta de nombres a la base de datos
+        Parámetros:
+            filas (list): Diccionarios con id (None o "-1" para recetas nuevas), nombre, tiempo, personas, calorias y preparacion
+        Retorna:
+            (list): Los errores encontrados como {'fila': posición desde 1, 'error': mensaje}
+        '''
+        nombres = dar_ids_por_nombre(Receta, [fila.get("nombre") for fila in filas])
+        return [{"fila": posicion, "error": error}
+                for posicion, error in enumerate((validar_fila_receta(fila, nombres) for fila in filas), start=1)
+                if error != ""]
     
     def crear_receta(self, receta, tiempo, personas, calorias, preparacion):
-        busqueda = session.query(Receta).filter(Receta.nombre == receta).first()
-        if not busqueda:
-            nuevaReceta = Receta(nombre = receta, tiempoPreparacion = tiempo, nroPersonasPreparacion = personas, caloriasPorcion = calorias, instrucciones = preparacion)
-            session.add(nuevaReceta)
-            session.commit()
-            return True
-        else:
-            return False
+        with unidad_de_trabajo() as sesion:
+            busqueda = sesion.query(Receta.id).filter(Receta.nombreNormalizado == normalizar_nombre(receta)).first()
+            if not busqueda:
+                nuevaReceta = Receta(nombre = receta, tiempoPreparacion = tiempo, nroPersonasPreparacion = personas, caloriasPorcion = calorias, instrucciones = preparacion)
+                sesion.add(nuevaReceta)
+                return True
+            else:
+                return False
         
     def editar_receta(self, id_receta, receta, tiempo, personas, calorias, preparacion):
-        print("This is to be implemented in MAIN after actions")
         raise NotImplementedError("Método no implementado")
 
     def eliminar_receta(self, id_receta):
         
         raise NotImplementedError("Método no implementado")
 
-    def dar_ingredientes(self):
-        ingredientes = session.query(Ingrediente).all()
+    def dar_ingredientes(self, desde_id=None, limite=None, orden="id"):
+        with unidad_de_trabajo() as sesion:
+            consulta = sesion.query(Ingrediente.id, Ingrediente.nombre, Ingrediente.unidadMedida,
+                                    Ingrediente.valorUnidad, Ingrediente.nombreProveedor)
+            ingredientes = paginar(consulta, Ingrediente, desde_id, limite, orden).all()
         resultado = []
-        for ingrediente in ingredientes:
+        for id_ingrediente, nombre, unidad, valor, sitio in ingredientes:
             resultado.append({
-                "id": ingrediente.id,
-                "nombre": ingrediente.nombre,
-                "unidad": ingrediente.unidadMedida,
-                "valor": ingrediente.valorUnidad,
-                "sitioCompra": ingrediente.nombreProveedor
+                "id": id_ingrediente,
+                "nombre": nombre,
+                "unidad": unidad,
+                "valor": valor,
+                "sitioCompra": sitio
             })
-        print(resultado)
+        logger.debug("dar_ingredientes: %d ingredientes", len(resultado))
         return resultado
 
+    def buscar_ingredientes(self, texto, limite=20):
+        # El prefijo es un rango sobre el índice de nombreNormalizado; si no alcanza el límite
+        # se completa con los que contienen el texto más adelante en el nombre
+        clave = normalizar_nombre(texto or "")
+        with unidad_de_trabajo() as sesion:
+            consulta = sesion.query(Ingrediente.id, Ingrediente.nombre, Ingrediente.unidadMedida,
+                                    Ingrediente.valorUnidad, Ingrediente.nombreProveedor) \
+                .order_by(Ingrediente.nombreNormalizado)
+            ingredientes = consulta.filter(Ingrediente.nombreNormalizado >= clave,
+                                           Ingrediente.nombreNormalizado < clave + FIN_PREFIJO).limit(limite).all()
+            if clave != "" and len(ingredientes) < limite:
+                ingredientes += consulta.filter(func.instr(Ingrediente.nombreNormalizado, clave) > 1) \
+                    .limit(limite - len(ingredientes)).all()
+        return [{
+            "id": id_ingrediente,
+            "nombre": nombre,
+            "unidad": unidad,
+            "valor": valor,
+            "sitioCompra": sitio
+        } for id_ingrediente, nombre, unidad, valor, sitio in ingredientes]
+
     def dar_ingrediente(self, id_ingrediente):
         raise NotImplementedError("Método no implementado")
 
-    def validar_crear_editar_ingrediente(self, nombre, unidad, valor, sitioCompra):
-        raise NotImplementedError("Método no implementado")
+    def validar_crear_editar_ingrediente(self, nombre, unidad, valor, sitioCompra, id_ingrediente=None):
+        errores = self.validar_ingredientes_lote([{"id": id_ingrediente, "nombre": nombre, "unidad": unidad,
+                                                   "valor": valor, "sitioCompra": sitioCompra}])
+        return errores[0]["error"] if errores else ""
+
+    def validar_ingredientes_lote(self, filas):
+        ''' Valida un lote de ingredientes con una sola consulta de nombres a la base de datos
+        Parámetros:
+            filas (list): Diccionarios con id (None o "-1" para ingredientes nuevos), nombre, unidad, valor y sitioCompra
+        Retorna:
+            (list): Los errores encontrados como {'fila': posición desde 1, 'error': mensaje}
+        '''
+        nombres = dar_ids_por_nombre(Ingrediente, [fila.get("nombre") for fila in filas])
+        return [{"fila": posicion, "error": error}
+                for posicion, error in enumerate((validar_fila_ingrediente(fila, nombres) for fila in filas), start=1)
+                if error != ""]
 		
     def crear_ingrediente(self, nombre, unidad, valor, sitioCompras):
         raise NotImplementedError("Método no implementado")
@@ -99,31 +176,34 @@ class LogicaRecetario(FachadaRecetario):
     def eliminar_ingrediente(self, id_ingrediente):
         raise NotImplementedError("Método no implementado")
 
-    def dar_ingredientes_receta(self, id_receta): 
-        print(id_receta) 
-        ingredientes_receta = session.query(Receta).filter_by(id= id_receta).first() 
-        print(ingredientes_receta) 
-        resultado = [] 
-        for relacion in ingredientes_receta.ingredientes: 
-            resultado.append({ 
-                "ingrediente": relacion.ingrediente.nombre, 
-                "unidad": relacion.unidadMedida, 
-                "cantidad": relacion.cantidad 
-            }) 
+    def dar_ingredientes_receta(self, id_receta):
+        # Proyección directa: una sola consulta sin cargar relaciones por cada ingrediente
+        with unidad_de_trabajo() as sesion:
+            filas = sesion.query(Ingrediente.nombre, IngredienteReceta.unidadMedida, IngredienteReceta.cantidad) \
+                .join(Ingrediente, Ingrediente.id == IngredienteReceta.idIngrediente) \
+                .filter(IngredienteReceta.idReceta == id_receta) \
+                .all()
+        resultado = []
+        for nombre, unidad, cantidad in filas:
+            resultado.append({
+                "ingrediente": nombre,
+                "unidad": unidad,
+                "cantidad": cantidad
+            })
         return resultado
 
     def agregar_ingrediente_receta(self, receta, ingrediente, cantidad):
-        receta_obj = session.query(Receta).filter_by(id=receta).first()
-        ingrediente_obj = session.query(Ingrediente).filter_by(id=ingrediente).first()
-        if not receta_obj or not ingrediente_obj:
-            return False
-        relacion_existente = session.query(IngredienteReceta).filter_by(idReceta=receta, idIngrediente=ingrediente).first()
-        if relacion_existente:
-            return False
-        nueva_relacion = IngredienteReceta(receta=receta_obj, ingrediente=ingrediente_obj, cantidad=cantidad, unidadMedida=ingrediente_obj.unidadMedida)
-        session.add(nueva_relacion)
-        session.commit()
-        return True
+        with unidad_de_trabajo() as sesion:
+            receta_obj = sesion.query(Receta).filter_by(id=receta).first()
+            ingrediente_obj = sesion.query(Ingrediente).filter_by(id=ingrediente).first()
+            if not receta_obj or not ingrediente_obj:
+                return False
+            relacion_existente = sesion.query(IngredienteReceta).filter_by(idReceta=receta, idIngrediente=ingrediente).first()
+            if relacion_existente:
+                return False
+            nueva_relacion = IngredienteReceta(receta=receta_obj, ingrediente=ingrediente_obj, cantidad=cantidad, unidadMedida=ingrediente_obj.unidadMedida)
+            sesion.add(nueva_relacion)
+            return True
 
     def editar_ingrediente_receta(self, id_ingrediente_receta, receta, ingrediente, cantidad):
         raise NotImplementedError("Método no implementado")
@@ -135,11 +215,200 @@ class LogicaRecetario(FachadaRecetario):
         raise NotImplementedError("Método no implementado")
 
     def dar_preparacion(self, id_receta,cantidad_personas):
-        raise NotImplementedError("Método no implementado")
+        if not es_cantidad_personas(cantidad_personas):
+            return None
+        # Una sola consulta: cantidades escaladas por ingrediente y el costo total como ventana
+        personas = literal(float(cantidad_personas), Float)
+        factor = personas / func.coalesce(func.nullif(Receta.nroPersonasPreparacion, 0), personas)
+        cantidad = IngredienteReceta.cantidad * factor
+        valor = cantidad * Ingrediente.valorUnidad
+        with unidad_de_trabajo() as sesion:
+            filas = sesion.query(Receta.nombre, Receta.caloriasPorcion, Receta.tiempoPreparacion,
+                                 Ingrediente.nombre, IngredienteReceta.unidadMedida,
+                                 cantidad, valor, func.coalesce(func.sum(valor).over(), 0)) \
+                .outerjoin(IngredienteReceta, IngredienteReceta.idReceta == Receta.id) \
+                .outerjoin(Ingrediente, Ingrediente.id == IngredienteReceta.idIngrediente) \
+                .filter(Receta.id == id_receta) \
+                .order_by(Ingrediente.nombre) \
+                .all()
+        if not filas:
+            return None
+        nombre, calorias, tiempo = filas[0][0:3]
+        return {
+            "receta": nombre,
+            "personas": cantidad_personas,
+            "calorias": calorias,
+            "costo": filas[0][7],
+            "tiempo_preparacion": tiempo,
+            "datos_ingredientes": [{
+                "nombre": fila[3],
+                "unidad": fila[4],
+                "cantidad": fila[5],
+                "valor": fila[6]
+            } for fila in filas if fila[3] is not None]
+        }
 
     def es_valor_numerico(self, valor):
-        try:
-            float(valor)
-            return True
-        except ValueError:
-            return False
+        return es_valor_numerico(valor)
+
+
+# Mayor punto de código: toda cadena que empieza por un prefijo es menor que prefijo + FIN_PREFIJO
+FIN_PREFIJO = "\U0010ffff"
+
+PATRON_NUMERICO = re.compile(r"\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*")
+PATRON_ENTERO = re.compile(r"\s*[-+]?[0-9]+\s*")
+
+
+def paginar(consulta, modelo, desde_id, limite, orden):
+    ''' Aplica paginación por llave (keyset) sobre una columna indexada del modelo
+    Parámetros:
+        consulta (Query): La consulta a paginar
+        modelo: Receta o Ingrediente
+        desde_id (int): Identificador del último elemento de la página anterior o None
+        limite (int): Cantidad máxima de elementos o None para todos
+        orden (string): 'id' o 'nombre'
+    Retorna:
+        (Query): La consulta filtrada, ordenada y limitada
+    '''
+    if orden not in ("id", "nombre"):
+        raise ValueError("Orden no soportado: {}".format(orden))
+    columna = getattr(modelo, orden)
+    if desde_id is not None:
+        if orden == "id":
+            consulta = consulta.filter(modelo.id > desde_id)
+        else:
+            ancla = select([columna]).where(modelo.id == desde_id).as_scalar()
+            consulta = consulta.filter(columna > ancla)
+    consulta = consulta.order_by(columna)
+    if limite is not None:
+        consulta = consulta.limit(limite)
+    return consulta
+
+
+def es_valor_numerico(valor):
+    # Se reconoce el número con una expresión regular en lugar de capturar el ValueError de float()
+    if isinstance(valor, (int, float)):
+        return True
+    return isinstance(valor, str) and PATRON_NUMERICO.fullmatch(valor) is not None
+
+
+def es_cantidad_personas(valor):
+    ''' Indica si el valor es una cantidad de personas válida: un número finito mayor que cero '''
+    return es_valor_numerico(valor) and 0 < float(valor) < math.inf
+
+
+def texto_campo(valor):
+    ''' Convierte el valor de un campo en texto; None se convierte en cadena vacía '''
+    return "" if valor is None else str(valor)
+
+
+def es_nuevo(identificador):
+    return identificador is None or str(identificador) == "-1"
+
+
+def dar_ids_por_nombre(modelo, nombres):
+    ''' Consulta los identificadores de los nombres indicados que ya existen, comparando por la
+    llave normalizada (sin tildes, mayúsculas ni espacios repetidos)
+    Parámetros:
+        modelo: Receta o Ingrediente
+        nombres (list): Los nombres a buscar
+    Retorna:
+        (dict): llave normalizada -> id de los nombres registrados
+    '''
+    buscados = sorted({normalizar_nombre(texto_campo(nombre)) for nombre in nombres} - {""})
+    encontrados = {}
+    with unidad_de_trabajo() as sesion:
+        for inicio in range(0, len(buscados), 500):
+            encontrados.update(sesion.query(modelo.nombreNormalizado, modelo.id)
+                               .filter(modelo.nombreNormalizado.in_(buscados[inicio:inicio + 500])).all())
+    return encontrados
+
+
+def validar_fila_receta(fila, nombres):
+    ''' Valida una receta contra los nombres conocidos y registra su nombre si es válida
+    Parámetros:
+        fila (dict): id, nombre, tiempo, personas y calorias de la receta
+        nombres (dict): llave normalizada -> id (None para las recetas nuevas del lote)
+    Retorna:
+        (string): El mensaje de error o una cadena vacía si no hay errores
+    '''
+    nombre = texto_campo(fila.get("nombre"))
+    error = validar_campos_receta(nombre, texto_campo(fila.get("tiempo")), texto_campo(fila.get("personas")),
+                                  texto_campo(fila.get("calorias")))
+    if error != "":
+        return error
+    return registrar_nombre(nombre.strip(), fila.get("id"), nombres, "La receta ya existe")
+
+
+def validar_fila_ingrediente(fila, nombres):
+    ''' Valida un ingrediente contra los nombres conocidos y registra su nombre si es válido
+    Parámetros:
+        fila (dict): id, nombre, unidad, valor y sitioCompra del ingrediente
+        nombres (dict): llave normalizada -> id (None para los ingredientes nuevos del lote)
+    Retorna:
+        (string): El mensaje de error o una cadena vacía si no hay errores
+    '''
+    nombre = texto_campo(fila.get("nombre"))
+    error = validar_campos_ingrediente(nombre, texto_campo(fila.get("unidad")), texto_campo(fila.get("valor")),
+                                       texto_campo(fila.get("sitioCompra")))
+    if error != "":
+        return error
+    return registrar_nombre(nombre.strip(), fila.get("id"), nombres, "El ingrediente ya existe")
+
+
+def dar_identificador(identificador):
+    ''' Convierte a int los identificadores enteros escritos como texto (los de un CSV o un formulario);
+    los demás se conservan, y un id no numérico simplemente no coincide con ningún registro '''
+    if isinstance(identificador, str) and PATRON_ENTERO.fullmatch(identificador):
+        return int(identificador)
+    return identificador
+
+
+def registrar_nombre(nombre, identificador, nombres, mensaje):
+    llave = normalizar_nombre(nombre)
+    if llave in nombres:
+        existente = nombres[llave]
+        if es_nuevo(identificador) or existente is None or existente != dar_identificador(identificador):
+            return mensaje
+    nombres[llave] = None if es_nuevo(identificador) else dar_identificador(identificador)
+    return ""
+
+
+def validar_campos_receta(receta, tiempo, personas, calorias):
+    ''' Valida los campos de una receta sin consultar la base de datos
+    Retorna:
+        (string): El mensaje de error o una cadena vacía si no hay errores
+    '''
+    if not receta or receta.strip() == "":
+        return "El nombre de la receta no puede estar vacío"
+    if not tiempo or tiempo.strip() == "":
+        return "El tiempo de preparación no puede estar vacío"
+    if es_valor_numerico(tiempo) == False:
+        return "El tiempo debe ser númerico"
+    if not personas or personas.strip() == "":
+        return "El número de personas no puede estar vacio"
+    if es_valor_numerico(personas) == False:
+        return "El número de personas debe ser númerico"
+    if not calorias or calorias.strip() == "":
+        return "Las el número de calorías no puede estar vacio"
+    if es_valor_numerico(calorias) == False:
+        return "Las calorías deben ser númericas"
+    return ""
+
+
+def validar_campos_ingrediente(nombre, unidad, valor, sitioCompra):
+    ''' Valida los campos de un ingrediente sin consultar la base de datos
+    Retorna:
+        (string): El mensaje de error o una cadena vacía si no hay errores
+    '''
+    if not nombre or nombre.strip() == "":
+        return "El nombre del ingrediente no puede estar vacío"
+    if not unidad or unidad.strip() == "":
+        return "La unidad de medida no puede estar vacía"
+    if not valor or valor.strip() == "":
+        return "El valor por unidad no puede estar vacío"
+    if es_valor_numerico(valor) == False:
+        return "El valor por unidad debe ser númerico"
+    if not sitioCompra or sitioCompra.strip() == "":
+        return "El sitio de compra no puede estar vacío"
+    return ""
@@ -1,10 +1,148 @@
-from sqlalchemy import create_engine
+import os
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+
+# Variable de entorno con la ubicación de la base de datos: una URL de SQLAlchemy,
+# la ruta de un archivo SQLite o ':memory:'
+VARIABLE_ENTORNO_BD = 'RECETARIO_DB'
+
+RUTA_BD_POR_DEFECTO = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'recetario.sqlite')
+
+# Pragmas aplicados a cada conexión nueva. journal_mode sólo aplica a bases en archivo.
+PRAGMAS_SQLITE = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'mmap_size': 268435456,
+    'cache_size': -20000,
+}
+
+
+def resolver_url(ubicacion=None):
+    ''' Construye la URL de la base de datos
+    Parámetros:
+        ubicacion (string): URL de SQLAlchemy, ruta de archivo o ':memory:'. Si es None
+            se usa la variable de entorno RECETARIO_DB o el archivo recetario.sqlite del proyecto
+    Retorna:
+        (string): La URL de SQLAlchemy
+    '''
+    if ubicacion is None:
+        ubicacion = os.environ.get(VARIABLE_ENTORNO_BD) or RUTA_BD_POR_DEFECTO
+    if '://' in ubicacion:
+        return ubicacion
+    if ubicacion == ':memory:':
+        return 'sqlite://'
+    return 'sqlite:///' + os.path.abspath(ubicacion)
+
+
+def es_memoria(url):
+    ''' Indica si la URL corresponde a una base SQLite en memoria '''
+    return url in ('sqlite://', 'sqlite:///:memory:')
+
+
+def crear_engine(ubicacion=None, pragmas=None, tamano_pool=5, desborde_pool=10, transacciones_explicitas=False):
+    ''' Crea un engine de SQLite con los pragmas y el pool configurados
+    Parámetros:
+        ubicacion (string): URL, ruta de archivo o ':memory:' (ver resolver_url)
+        pragmas (dict): Pragmas a aplicar en cada conexión, por defecto PRAGMAS_SQLITE
+        tamano_pool (int): Conexiones persistentes del pool para bases en archivo
+        desborde_pool (int): Conexiones adicionales permitidas bajo carga
+        transacciones_explicitas (bool): Si SQLAlchemy emite BEGIN en lugar de pysqlite, necesario
+            para que los SAVEPOINT funcionen (p. ej. al revertir cada prueba)
+    Retorna:
+        (Engine): El engine configurado
+    '''
+    url = resolver_url(ubicacion)
+    pragmas = dict(PRAGMAS_SQLITE if pragmas is None else pragmas)
+
+    if es_memoria(url):
+        # Una sola conexión compartida: cada conexión nueva a ':memory:' es una base vacía.
+        # No se revierte al devolverla al pool porque eso revertiría la transacción de otro usuario
+        pragmas.pop('journal_mode', None)
+        engine = create_engine(url, connect_args={'check_same_thread': False}, poolclass=StaticPool,
+                               pool_reset_on_return=None)
+    else:
+        engine = create_engine(url, connect_args={'check_same_thread': False}, poolclass=QueuePool,
+                               pool_size=tamano_pool, max_overflow=desborde_pool)
 
-engine = create_engine('sqlite:///recetario.sqlite')
+    @event.listens_for(engine, 'connect')
+    def aplicar_pragmas(conexion_dbapi, registro_conexion):
+        cursor = conexion_dbapi.cursor()
+        for nombre, valor in pragmas.items():
+            cursor.execute('PRAGMA {} = {}'.format(nombre, valor))
+        cursor.close()
+        if transacciones_explicitas:
+            conexion_dbapi.isolation_level = None
+
+    if transacciones_explicitas:
+        @event.listens_for(engine, 'begin')
+        def iniciar_transaccion(conexion):
+            conexion.execute('BEGIN')
+
+    return engine
+
+
+def configurar_engine(ubicacion=None, **opciones):
+    ''' Reemplaza el engine del módulo y enlaza Session y session al nuevo engine
+    Parámetros:
+        ubicacion (string): URL, ruta de archivo o ':memory:' (ver resolver_url)
+        opciones: Argumentos adicionales para crear_engine
+    Retorna:
+        (Engine): El nuevo engine
+    '''
+    global engine
+    anterior = engine
+    engine = crear_engine(ubicacion, **opciones)
+    Session.configure(bind=engine)
+    sesion_contextual.remove()
+    session.close()
+    session.bind = engine
+    anterior.dispose()
+    return engine
+
+
+def dar_engine():
+    ''' Retorna el engine configurado actualmente '''
+    return engine
+
+
+@contextmanager
+def unidad_de_trabajo(expirar_al_confirmar=False):
+    ''' Abre una sesión para una unidad de trabajo del hilo actual
+    Confirma la transacción al salir sin errores, la revierte si hay una excepción y
+    cierra la sesión en ambos casos, de modo que su mapa de identidad no crece entre llamadas.
+    Si el hilo ya tiene una unidad de trabajo abierta se reutiliza su sesión.
+    Parámetros:
+        expirar_al_confirmar (bool): Si los objetos se expiran tras el commit
+    Retorna:
+        (Session): La sesión de la unidad de trabajo
+    '''
+    if sesion_contextual.registry.has():
+        yield sesion_contextual()
+        return
+    sesion = sesion_contextual(expire_on_commit=expirar_al_confirmar)
+    try:
+        yield sesion
+        sesion.commit()
+    except Exception:
+        sesion.rollback()
+        raise
+    finally:
+        sesion_contextual.remove()
+
+
+engine = crear_engine()
 Session = sessionmaker(bind=engine)
 
+# Sesiones por hilo usadas por las unidades de trabajo
+sesion_contextual = scoped_session(Session)
+
+# Sesión global heredada; la lógica usa unidad_de_trabajo
 session = Session()
 
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
@@ -1,12 +1,20 @@
 from sqlalchemy import Column, Integer, String, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from .Declarative_base import Base
+from .Normalizacion import normalizar_nombre, normalizar_texto
 
 class Ingrediente(Base):
     __tablename__ = 'Ingrediente'
     id = Column(Integer, primary_key = True)
-    nombre = Column(String)
+    nombre = Column(String, unique = True, index = True)
+    # Llave para detectar duplicados sin distinguir tildes, mayúsculas ni espacios
+    nombreNormalizado = Column(String, unique = True, index = True)
     unidadMedida = Column(String)
     valorUnidad = Column(Float)
     nombreProveedor = Column(String)
-    recetas = relationship("IngredienteReceta", back_populates="ingrediente")
\ No newline at end of file
+    recetas = relationship("IngredienteReceta", back_populates="ingrediente")
+
+    @validates('nombre')
+    def validar_nombre(self, clave, valor):
+        self.nombreNormalizado = normalizar_nombre(valor)
+        return normalizar_texto(valor)
@@ -5,9 +5,9 @@ from .Declarative_base import Base
 class IngredienteReceta(Base):
     __tablename__ = 'IngredienteReceta'
     idReceta = Column(Integer, ForeignKey('Receta.id'), primary_key = True)
-    idIngrediente = Column(Integer, ForeignKey('Ingrediente.id'), primary_key = True)
+    idIngrediente = Column(Integer, ForeignKey('Ingrediente.id'), primary_key = True, index = True)
     cantidad = Column(Float)
     unidadMedida = Column(String)
 
     receta = relationship("Receta", back_populates="ingredientes")
-    ingrediente = relationship("Ingrediente", back_populates="recetas")
\ No newline at end of file
+    ingrediente = relationship("Ingrediente", back_populates="recetas", lazy="joined")
\ No newline at end of file
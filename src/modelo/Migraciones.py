@@ -0,0 +1,168 @@
+'''
+Migraciones versionadas del esquema del recetario.
+
+Cada migración es un paso ordenado que recibe un cursor de sqlite3 dentro de una
+transacción. La versión aplicada se registra en la tabla schema_version, de modo
+que al iniciar basta con una lectura de su llave primaria para saber si el esquema
+está al día.
+'''
+from sqlalchemy.exc import OperationalError
+
+from .Normalizacion import normalizar_nombre
+
+
+def _v1_esquema_inicial(cursor):
+    ''' Crea las tablas originales del recetario si aún no existen '''
+    cursor.execute('''CREATE TABLE IF NOT EXISTS "Receta" (
+        id INTEGER NOT NULL,
+        nombre VARCHAR,
+        "tiempoPreparacion" INTEGER,
+        "nroPersonasPreparacion" INTEGER,
+        "caloriasPorcion" FLOAT,
+        instrucciones VARCHAR,
+        PRIMARY KEY (id)
+    )''')
+    cursor.execute('''CREATE TABLE IF NOT EXISTS "Ingrediente" (
+        id INTEGER NOT NULL,
+        nombre VARCHAR,
+        "unidadMedida" VARCHAR,
+        "valorUnidad" FLOAT,
+        "nombreProveedor" VARCHAR,
+        PRIMARY KEY (id)
+    )''')
+    cursor.execute('''CREATE TABLE IF NOT EXISTS "IngredienteReceta" (
+        "idReceta" INTEGER NOT NULL,
+        "idIngrediente" INTEGER NOT NULL,
+        cantidad FLOAT,
+        "unidadMedida" VARCHAR,
+        PRIMARY KEY ("idReceta", "idIngrediente"),
+        FOREIGN KEY("idReceta") REFERENCES "Receta" (id),
+        FOREIGN KEY("idIngrediente") REFERENCES "Ingrediente" (id)
+    )''')
+
+
+def _v2_indices(cursor):
+    ''' Índices únicos sobre los nombres e índice secundario sobre IngredienteReceta.idIngrediente.
+    El esquema original permitía nombres repetidos: antes de indexar, cada repetición más
+    reciente recibe el sufijo #id para no perder datos '''
+    for tabla in ("Receta", "Ingrediente"):
+        usados = set()
+        renombrados = []
+        for identificador, nombre in cursor.execute(
+                'SELECT id, nombre FROM "{}" WHERE nombre IS NOT NULL ORDER BY id'.format(tabla)).fetchall():
+            if nombre in usados:
+                renombrados.append(("{}#{}".format(nombre, identificador), identificador))
+            usados.add(nombre)
+        cursor.executemany('UPDATE "{}" SET nombre = ? WHERE id = ?'.format(tabla), renombrados)
+    cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS "ix_Receta_nombre" ON "Receta" (nombre)')
+    cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS "ix_Ingrediente_nombre" ON "Ingrediente" (nombre)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS "ix_IngredienteReceta_idIngrediente" '
+                   'ON "IngredienteReceta" ("idIngrediente")')
+
+
+def _v3_busqueda_recetas(cursor):
+    ''' Índice FTS5 sobre nombre e instrucciones de Receta, sincronizado por triggers.
+    unicode61 con remove_diacritics ignora tildes y mayúsculas sobre textos en NFC '''
+    cursor.execute('''CREATE VIRTUAL TABLE IF NOT EXISTS "RecetaBusqueda" USING fts5(
+        nombre, instrucciones, content='Receta', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )''')
+    cursor.execute('''CREATE TRIGGER IF NOT EXISTS "Receta_busqueda_insertar" AFTER INSERT ON "Receta" BEGIN
+        INSERT INTO "RecetaBusqueda" (rowid, nombre, instrucciones) VALUES (new.id, new.nombre, new.instrucciones);
+    END''')
+    cursor.execute('''CREATE TRIGGER IF NOT EXISTS "Receta_busqueda_borrar" AFTER DELETE ON "Receta" BEGIN
+        INSERT INTO "RecetaBusqueda" ("RecetaBusqueda", rowid, nombre, instrucciones)
+        VALUES ('delete', old.id, old.nombre, old.instrucciones);
+    END''')
+    cursor.execute('''CREATE TRIGGER IF NOT EXISTS "Receta_busqueda_actualizar" AFTER UPDATE ON "Receta" BEGIN
+        INSERT INTO "RecetaBusqueda" ("RecetaBusqueda", rowid, nombre, instrucciones)
+        VALUES ('delete', old.id, old.nombre, old.instrucciones);
+        INSERT INTO "RecetaBusqueda" (rowid, nombre, instrucciones) VALUES (new.id, new.nombre, new.instrucciones);
+    END''')
+    cursor.execute('''INSERT INTO "RecetaBusqueda" ("RecetaBusqueda") VALUES ('rebuild')''')
+
+
+def _v4_nombres_normalizados(cursor):
+    ''' Agrega la llave normalizada de nombre a Receta e Ingrediente, la calcula para los datos
+    existentes y la indexa como única. Si dos nombres antiguos comparten llave, el más reciente
+    recibe el sufijo #id para no perder datos '''
+    for tabla in ("Receta", "Ingrediente"):
+        cursor.execute('ALTER TABLE "{}" ADD COLUMN "nombreNormalizado" VARCHAR'.format(tabla))
+        usadas = set()
+        llaves = []
+        for identificador, nombre in cursor.execute('SELECT id, nombre FROM "{}" ORDER BY id'.format(tabla)).fetchall():
+            llave = normalizar_nombre(nombre)
+            # Un nombre NULL queda sin llave: el índice único admite varios NULL
+            if llave is not None:
+                if llave in usadas:
+                    llave = "{}#{}".format(llave, identificador)
+                usadas.add(llave)
+            llaves.append((llave, identificador))
+        cursor.executemany('UPDATE "{}" SET "nombreNormalizado" = ? WHERE id = ?'.format(tabla), llaves)
+        cursor.execute('CREATE UNIQUE INDEX "ix_{0}_nombreNormalizado" ON "{0}" ("nombreNormalizado")'.format(tabla))
+
+
+# Lista ordenada de migraciones: (versión, descripción, función)
+MIGRACIONES = [
+    (1, 'Esquema inicial', _v1_esquema_inicial),
+    (2, 'Índices de nombres y llaves foráneas', _v2_indices),
+    (3, 'Búsqueda de texto completo en recetas', _v3_busqueda_recetas),
+    (4, 'Llave normalizada de nombres', _v4_nombres_normalizados),
+]
+
+ULTIMA_VERSION = MIGRACIONES[-1][0]
+
+
+def dar_version(engine):
+    ''' Retorna la versión del esquema de la base de datos
+    Parámetros:
+        engine (Engine): El engine de la base de datos
+    Retorna:
+        (int): La versión aplicada o 0 si la base no tiene schema_version
+    '''
+    try:
+        version = engine.execute('SELECT MAX(version) FROM schema_version').scalar()
+    except OperationalError:
+        return 0
+    return version or 0
+
+
+def migrar(engine):
+    ''' Aplica las migraciones pendientes. Si el esquema está al día sólo hace una lectura
+    Parámetros:
+        engine (Engine): El engine de la base de datos
+    Retorna:
+        (int): La versión del esquema tras migrar
+    '''
+    if dar_version(engine) >= ULTIMA_VERSION:
+        return ULTIMA_VERSION
+
+    conexion = engine.raw_connection()
+    conexion_dbapi = conexion.connection
+    nivel_aislamiento = conexion_dbapi.isolation_level
+    # Se controla la transacción a mano: sqlite3 no abre transacciones implícitas para DDL
+    conexion_dbapi.isolation_level = None
+    cursor = conexion_dbapi.cursor()
+    try:
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            cursor.execute('''CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER NOT NULL PRIMARY KEY,
+                descripcion VARCHAR NOT NULL,
+                aplicada TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )''')
+            # Otro proceso pudo migrar mientras se esperaba el bloqueo
+            version = cursor.execute('SELECT MAX(version) FROM schema_version').fetchone()[0] or 0
+            for numero, descripcion, aplicar in MIGRACIONES:
+                if numero > version:
+                    aplicar(cursor)
+                    cursor.execute('INSERT INTO schema_version (version, descripcion) VALUES (?, ?)',
+                                   (numero, descripcion))
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+    finally:
+        cursor.close()
+        conexion_dbapi.isolation_level = nivel_aislamiento
+        conexion.close()
+    return ULTIMA_VERSION
@@ -0,0 +1,43 @@
+'''
+Normalización de textos del recetario.
+'''
+import re
+import unicodedata
+
+
+def normalizar_texto(texto):
+    ''' Normaliza a NFC para que la "ó" se compare de forma consistente
+    Parámetros:
+        texto (string): El texto a normalizar, puede ser None
+    Retorna:
+        (string): El texto en NFC o None si no había texto
+    '''
+    if texto is None:
+        return None
+    return unicodedata.normalize("NFC", texto)
+
+
+def normalizar_nombre(nombre):
+    ''' Calcula la llave con la que se comparan los nombres: NFC, sin tildes, en minúsculas
+    (casefold) y con los espacios colapsados. "Ajiaco", "ajiaco " y "AJÍACO" tienen la misma llave
+    Parámetros:
+        nombre (string): El nombre a normalizar, puede ser None
+    Retorna:
+        (string): La llave normalizada o None si no había nombre
+    '''
+    if nombre is None:
+        return None
+    descompuesto = unicodedata.normalize("NFD", normalizar_texto(nombre).casefold())
+    sin_tildes = "".join(caracter for caracter in descompuesto if not unicodedata.combining(caracter))
+    return unicodedata.normalize("NFC", " ".join(sin_tildes.split()))
+
+
+def construir_consulta_fts(texto):
+    ''' Convierte el texto de búsqueda en una consulta FTS5 de prefijos unidos por AND
+    Parámetros:
+        texto (string): Las palabras digitadas por el usuario
+    Retorna:
+        (string): La expresión para MATCH o una cadena vacía si no hay palabras
+    '''
+    palabras = re.findall(r"\w+", normalizar_texto(texto or ""))
+    return " ".join('"{}"*'.format(palabra) for palabra in palabras)
@@ -1,14 +1,27 @@
 from sqlalchemy import Column, Integer, String, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship, validates
 from .Declarative_base import Base
+from .Normalizacion import normalizar_nombre, normalizar_texto
 
 class Receta(Base):
     
     __tablename__ = 'Receta'
     id = Column(Integer, primary_key = True)
-    nombre = Column(String)
+    nombre = Column(String, unique = True, index = True)
+    # Llave para detectar duplicados sin distinguir tildes, mayúsculas ni espacios
+    nombreNormalizado = Column(String, unique = True, index = True)
     tiempoPreparacion = Column(Integer)
     nroPersonasPreparacion = Column(Integer)
     caloriasPorcion = Column(Float)
-    instrucciones = Column(String)
-    ingredientes = relationship("IngredienteReceta", back_populates="receta")
\ No newline at end of file
+    # Texto potencialmente largo: sólo se carga cuando se pide la receta completa
+    instrucciones = deferred(Column(String))
+    # Carga perezosa: cargar la colección con cada receta multiplicaría las listas.
+    # Quien la recorra para varias recetas debe usar selectinload
+    ingredientes = relationship("IngredienteReceta", back_populates="receta")
+
+    @validates('nombre', 'instrucciones')
+    def validar_texto(self, clave, valor):
+        # El índice de búsqueda asume textos en NFC
+        if clave == 'nombre':
+            self.nombreNormalizado = normalizar_nombre(valor)
+        return normalizar_texto(valor)
@@ -0,0 +1,169 @@
+'''
+Registro de las sentencias SQL ejecutadas, basado en los eventos de SQLAlchemy.
+
+RegistroSentencias guarda las sentencias del hilo actual mientras está activo y agrupa las
+que tienen la misma forma (la misma sentencia sin sus valores) para detectar patrones N+1,
+como recorrer una lista y cargar una relación perezosa por cada elemento. assert_max_queries
+lo usa en las pruebas. activar_registro_lento registra, en modo de depuración, las sentencias
+que superan un umbral de duración junto con su EXPLAIN QUERY PLAN.
+'''
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Cantidad de repeticiones de una misma forma a partir de la cual se considera un patrón N+1
+UMBRAL_N_MAS_1 = 5
+
+_PATRON_CADENA = re.compile(r"'(?:[^']|'')*'")
+_PATRON_NUMERO = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PATRON_LISTA = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_PATRON_ESPACIOS = re.compile(r"\s+")
+
+
+def dar_forma(sentencia):
+    ''' Retorna la forma de una sentencia: sin literales, con las listas IN colapsadas y los espacios normalizados
+    Parámetros:
+        sentencia (string): La sentencia SQL
+    Retorna:
+        (string): La forma de la sentencia
+    '''
+    forma = _PATRON_CADENA.sub("?", sentencia)
+    forma = _PATRON_NUMERO.sub("?", forma)
+    forma = _PATRON_LISTA.sub("(?...)", forma)
+    return _PATRON_ESPACIOS.sub(" ", forma).strip()
+
+
+def escuchar_sentencias(objetivo, al_terminar):
+    ''' Llama al_terminar(conexion, sentencia, parametros, executemany, duracion_ms) tras cada sentencia
+    Parámetros:
+        objetivo: Un Engine o la clase Engine para observar todos los engines
+        al_terminar (function): La función a llamar con cada sentencia ejecutada
+    Retorna:
+        (function): Una función sin parámetros que deja de escuchar
+    '''
+    # Las sentencias de una conexión son secuenciales: basta un inicio por conexión y escucha
+    clave = ('inicio_sentencia', object())
+
+    def antes(conexion, cursor, sentencia, parametros, contexto, executemany):
+        conexion.info[clave] = time.perf_counter()
+
+    def despues(conexion, cursor, sentencia, parametros, contexto, executemany):
+        inicio = conexion.info.pop(clave, None)
+        duracion = 0.0 if inicio is None else (time.perf_counter() - inicio) * 1000
+        al_terminar(conexion, sentencia, parametros, executemany, duracion)
+
+    event.listen(objetivo, 'before_cursor_execute', antes)
+    event.listen(objetivo, 'after_cursor_execute', despues)
+
+    def dejar_de_escuchar():
+        event.remove(objetivo, 'after_cursor_execute', despues)
+        event.remove(objetivo, 'before_cursor_execute', antes)
+    return dejar_de_escuchar
+
+
+class RegistroSentencias:
+    ''' Registra las sentencias ejecutadas por el hilo actual mientras está activo.
+    Se usa como administrador de contexto: with RegistroSentencias() as registro: ... '''
+
+    def __init__(self, engine=None):
+        ''' Parámetros:
+            engine (Engine): El engine a observar; por defecto todos los engines
+        '''
+        self.objetivo = Engine if engine is None else engine
+        self.sentencias = []
+        self._hilo = None
+        self._dejar_de_escuchar = None
+
+    def __enter__(self):
+        self._hilo = threading.get_ident()
+        self._dejar_de_escuchar = escuchar_sentencias(self.objetivo, self._registrar)
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self._dejar_de_escuchar()
+        return False
+
+    def _registrar(self, conexion, sentencia, parametros, executemany, duracion):
+        if threading.get_ident() == self._hilo:
+            self.sentencias.append({'sentencia': sentencia, 'parametros': parametros, 'duracion_ms': duracion})
+
+    @property
+    def cantidad(self):
+        return len(self.sentencias)
+
+    def dar_formas(self):
+        ''' Retorna cuántas veces se ejecutó cada forma de sentencia '''
+        return Counter(dar_forma(registro['sentencia']) for registro in self.sentencias)
+
+    def detectar_n_mas_1(self, umbral=UMBRAL_N_MAS_1):
+        ''' Retorna las formas ejecutadas al menos umbral veces, de la más a la menos repetida
+        Retorna:
+            (list): Tuplas (forma, repeticiones)
+        '''
+        return [(forma, veces) for forma, veces in self.dar_formas().most_common() if veces >= umbral]
+
+    def describir(self):
+        return "\n".join("  {}. {}".format(numero, dar_forma(registro['sentencia']))
+                         for numero, registro in enumerate(self.sentencias, start=1))
+
+
+@contextmanager
+def assert_max_queries(maximo, engine=None, umbral_n_mas_1=None):
+    ''' Falla si el bloque ejecuta más de maximo sentencias, o si se indica umbral_n_mas_1,
+    si alguna forma de sentencia se repite al menos ese número de veces
+    Parámetros:
+        maximo (int): Cantidad máxima de sentencias permitidas
+        engine (Engine): El engine a observar; por defecto todos los engines
+        umbral_n_mas_1 (int): Repeticiones de una forma que se consideran un patrón N+1
+    Retorna:
+        (RegistroSentencias): El registro de las sentencias del bloque
+    '''
+    with RegistroSentencias(engine) as registro:
+        yield registro
+    if registro.cantidad > maximo:
+        raise AssertionError("Se ejecutaron {} sentencias, se esperaban máximo {}:\n{}".format(
+            registro.cantidad, maximo, registro.describir()))
+    if umbral_n_mas_1 is not None:
+        repetidas = registro.detectar_n_mas_1(umbral_n_mas_1)
+        if repetidas:
+            raise AssertionError("Posible patrón N+1:\n{}".format(
+                "\n".join("  {} veces: {}".format(veces, forma) for forma, veces in repetidas)))
+
+
+def _explicar(conexion, sentencia, parametros):
+    cursor = conexion.connection.cursor()
+    try:
+        filas = cursor.execute('EXPLAIN QUERY PLAN ' + sentencia, parametros).fetchall()
+    finally:
+        cursor.close()
+    return "\n".join("    " + fila[-1] for fila in filas)
+
+
+def activar_registro_lento(umbral_ms=100, engine=None):
+    ''' Registra como WARNING las sentencias que tardan al menos umbral_ms, con su plan de ejecución
+    Parámetros:
+        umbral_ms (float): Duración mínima en milisegundos de las sentencias registradas
+        engine (Engine): El engine a observar; por defecto todos los engines
+    Retorna:
+        (function): Una función sin parámetros que desactiva el registro
+    '''
+    def registrar(conexion, sentencia, parametros, executemany, duracion):
+        if duracion < umbral_ms:
+            return
+        plan = ""
+        if not executemany and sentencia.lstrip().upper().startswith(("SELECT", "WITH")):
+            try:
+                plan = "\n" + _explicar(conexion, sentencia, parametros)
+            except Exception:
+                logger.debug("No se pudo obtener el plan de la sentencia", exc_info=True)
+        logger.warning("Sentencia lenta (%.1f ms): %s%s", duracion, _PATRON_ESPACIOS.sub(" ", sentencia).strip(), plan)
+
+    return escuchar_sentencias(Engine if engine is None else engine, registrar)
@@ -0,0 +1,82 @@
+'''
+Delegado que pinta botones de acción dentro de una celda de una vista de ítems.
+
+En lugar de crear un QPushButton por fila, los botones se dibujan con el estilo actual al
+pintar cada celda visible y los clics se resuelven por posición, de modo que el costo de la
+lista depende de las filas que se ven y no de la cantidad de filas del modelo.
+'''
+from PyQt5.QtCore import QEvent, QModelIndex, QRect, QSize, Qt, pyqtSignal
+from PyQt5.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton, QToolTip
+
+from .Recursos import dar_icono
+
+
+class DelegadoAcciones(QStyledItemDelegate):
+    ''' Pinta una fila de botones con ícono en cada celda de su columna
+    y emite accion_solicitada(accion, indice) cuando se hace clic en uno de ellos '''
+
+    accion_solicitada = pyqtSignal(str, QModelIndex)
+
+    def __init__(self, acciones, tamano_boton=40, separacion=8, parent=None):
+        ''' Parámetros:
+            acciones (list): Tuplas (accion, icono, texto_ayuda) en el orden en que se muestran; icono es
+                el nombre del archivo en src/recursos
+            tamano_boton (int): Ancho y alto de cada botón en píxeles
+            separacion (int): Espacio entre botones en píxeles
+        '''
+        super().__init__(parent)
+        # Los íconos vienen de la caché de recursos y se comparten entre todas las filas y ventanas
+        self.acciones = [(accion, dar_icono(icono), ayuda) for accion, icono, ayuda in acciones]
+        self.tamano_boton = tamano_boton
+        self.separacion = separacion
+
+    def dar_ancho(self):
+        ''' Retorna el ancho que ocupan los botones, con un margen a cada lado '''
+        return len(self.acciones) * (self.tamano_boton + self.separacion) + self.separacion
+
+    def rectangulos(self, celda):
+        ''' Retorna el rectángulo de cada botón dentro de la celda, centrados '''
+        cantidad = len(self.acciones)
+        ancho = cantidad * self.tamano_boton + (cantidad - 1) * self.separacion
+        x = celda.x() + (celda.width() - ancho) // 2
+        y = celda.y() + (celda.height() - self.tamano_boton) // 2
+        return [QRect(x + numero * (self.tamano_boton + self.separacion), y, self.tamano_boton, self.tamano_boton)
+                for numero in range(cantidad)]
+
+    def accion_en(self, celda, posicion):
+        ''' Retorna la acción y el texto de ayuda del botón en la posición dada, o (None, None) '''
+        for (accion, _, ayuda), rectangulo in zip(self.acciones, self.rectangulos(celda)):
+            if rectangulo.contains(posicion):
+                return accion, ayuda
+        return None, None
+
+    def paint(self, painter, opcion, indice):
+        estilo = opcion.widget.style() if opcion.widget is not None else QApplication.style()
+        if opcion.state & QStyle.State_Selected:
+            painter.fillRect(opcion.rect, opcion.palette.highlight())
+        for (_, icono, _), rectangulo in zip(self.acciones, self.rectangulos(opcion.rect)):
+            boton = QStyleOptionButton()
+            boton.rect = rectangulo
+            boton.icon = icono
+            boton.iconSize = QSize(self.tamano_boton // 2, self.tamano_boton // 2)
+            boton.state = QStyle.State_Enabled | QStyle.State_Raised
+            estilo.drawControl(QStyle.CE_PushButton, boton, painter, opcion.widget)
+
+    def sizeHint(self, opcion, indice):
+        return QSize(self.dar_ancho(), self.tamano_boton + self.separacion)
+
+    def editorEvent(self, evento, modelo, opcion, indice):
+        if evento.type() == QEvent.MouseButtonRelease and evento.button() == Qt.LeftButton:
+            accion, _ = self.accion_en(opcion.rect, evento.pos())
+            if accion is not None:
+                self.accion_solicitada.emit(accion, indice)
+                return True
+        return super().editorEvent(evento, modelo, opcion, indice)
+
+    def helpEvent(self, evento, vista, opcion, indice):
+        if evento.type() == QEvent.ToolTip:
+            _, ayuda = self.accion_en(opcion.rect, evento.pos())
+            if ayuda is not None:
+                QToolTip.showText(evento.globalPos(), ayuda, vista)
+                return True
+        return super().helpEvent(evento, vista, opcion, indice)
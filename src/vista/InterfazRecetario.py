@@ -1,11 +1,24 @@
-from PyQt5.QtWidgets import QApplication
-from .VistaListaRecetas import VistaListaRecetas
-from .VistaReceta import VistaReceta
-from .VistaListaIngredientes import VistaListaIngredientes
-from .VistaListaRecetas import VistaListaRecetas
-#from .VistaPersonasPreparacion import VistaPersonasPreparacion
-from .VistaPreparacion import VistaPreparacion
-from .VistaListaIngredientesReceta import VistaListaIngredientesReceta
+from PyQt5.QtWidgets import QApplication, QMessageBox
+
+from .Trabajadores import Despachador
+
+# Los módulos de las vistas se importan en el método que construye cada ventana, la primera
+# vez que se usa: al arrancar sólo se carga la lista de recetas
+
+# Las llamadas a la lógica corren en el hilo del despachador y cada resultado se entrega a la
+# ventana con al_terminar. Las validaciones también: la fachada no es segura para varios hilos,
+# así que la validación y la escritura que depende de ella corren juntas en el despachador
+
+
+def validar_y_escribir(validar, argumentos_validacion, escribir, argumentos):
+    """
+    Ejecuta escribir(*argumentos) sólo si validar(*argumentos_validacion) no retorna errores.
+    Retorna el mensaje de la validación, "" si se escribió
+    """
+    validacion = validar(*argumentos_validacion)
+    if validacion == "":
+        escribir(*argumentos)
+    return validacion
 
 
 class App_Recetario(QApplication):
@@ -20,14 +33,39 @@ class App_Recetario(QApplication):
         super(App_Recetario, self).__init__(sys_argv)
 
         self.logica = logica
+        self.despachador = Despachador(self)
+        self.despachador.fallo.connect(self.mostrar_fallo)
         self.mostrar_vista_lista_recetas()
 
+    def mostrar_fallo(self, operacion, error):
+        """
+        Esta función informa que una llamada a la lógica en segundo plano falló
+        """
+        mensaje_error = QMessageBox()
+        mensaje_error.setIcon(QMessageBox.Warning)
+        mensaje_error.setText("No se pudo {}: {}".format(operacion, error))
+        mensaje_error.setWindowTitle("Error")
+        mensaje_error.exec_()
+
+    def refrescar_recetas(self, resultado=None):
+        """
+        Esta función vuelve a cargar la lista de recetas después de una escritura
+        """
+        self.vista_lista_recetas.mostrar_recetas()
+
+    def refrescar_ingredientes(self, resultado=None):
+        """
+        Esta función vuelve a cargar la lista de ingredientes después de una escritura
+        """
+        self.vista_lista_ingredientes.mostrar_ingredientes()
+
     def mostrar_vista_lista_recetas(self):
         """
         Esta función inicializa la ventana de lista de recetas
         """
+        from .VistaListaRecetas import VistaListaRecetas
+        # La tabla pide la primera página de recetas cuando se pinta, con la ventana ya visible
         self.vista_lista_recetas = VistaListaRecetas(self)
-        self.vista_lista_recetas.mostrar_recetas(self.logica.dar_recetas())
 
     def crear_receta(self):
         """
@@ -41,7 +79,8 @@ class App_Recetario(QApplication):
         """
         self.receta_actual = id_receta
         if id_receta != -1:
-            self.mostrar_ventana_receta(self.logica.dar_receta(self.receta_actual))
+            self.despachador.ejecutar(self.logica.dar_receta, self.receta_actual, descripcion="abrir la receta",
+                                      al_terminar=self.mostrar_ventana_receta, agrupar=True)
         else:
             self.mostrar_ventana_receta(None)
     
@@ -49,56 +88,64 @@ class App_Recetario(QApplication):
         """
         Esta función permite eliminar una receta
         """
-        self.logica.eliminar_receta(indice)
-        self.vista_lista_recetas.mostrar_recetas(self.logica.dar_recetas())
+        self.despachador.ejecutar(self.logica.eliminar_receta, indice, descripcion="eliminar la receta",
+                                  al_terminar=self.refrescar_recetas)
 		
     def mostrar_ventana_receta(self, receta):
         """
         Esta función muestra la ventana con la información de una receta
         """
+        from .VistaReceta import VistaReceta
         self.vistaReceta = VistaReceta(self)
         self.vistaReceta.mostrar_receta(receta)
 
 
-    def guardar_receta(self, receta, tiempo, personas, calorias, preparacion):
+    def guardar_receta(self, receta, tiempo, personas, calorias, preparacion, al_terminar=None):
         """
-        Esta función permite crear una nueva receta o los cambios sobre una existente
+        Esta función permite crear una nueva receta o los cambios sobre una existente. al_terminar
+        recibe el mensaje de la validación, "" si la receta se guardó
         """
-        validacion = self.logica.validar_crear_editar_receta(self.receta_actual, receta, tiempo, personas, calorias, preparacion)
-        if validacion == "":
-            if self.receta_actual == -1:
-                self.logica.crear_receta(receta, tiempo, personas, calorias, preparacion)
-            else:
-                self.logica.editar_receta(self.receta_actual, receta, tiempo, personas, calorias, preparacion)
-            self.vista_lista_recetas.mostrar_recetas(self.logica.dar_recetas())
-        return validacion
+        if self.receta_actual == -1:
+            escribir, argumentos = self.logica.crear_receta, (receta, tiempo, personas, calorias, preparacion)
+        else:
+            escribir, argumentos = self.logica.editar_receta, (self.receta_actual, receta, tiempo, personas,
+                                                               calorias, preparacion)
+        self.despachador.ejecutar(validar_y_escribir, self.logica.validar_crear_editar_receta,
+                                  (self.receta_actual, receta, tiempo, personas, calorias, preparacion),
+                                  escribir, argumentos, descripcion="guardar la receta", al_terminar=al_terminar)
     
     def mostrar_ingredientes(self):
         """
         Esta función muestra la ventana con la lista de ingredientes
         """
+        from .VistaListaIngredientes import VistaListaIngredientes
         self.vista_lista_ingredientes=VistaListaIngredientes(self)
-        self.vista_lista_ingredientes.mostrar_ingredientes(self.logica.dar_ingredientes())
+        self.vista_lista_ingredientes.mostrar_ingredientes()
 
     def crear_ingrediente(self, nombre, unidad, valor, sitioCompra):
         """
         Esta función permite crear un nuevo ingrediente
         """
-        validacion = self.logica.validar_crear_editar_ingrediente(nombre, unidad, valor, sitioCompra)
-        if validacion == "":
-            self.logica.crear_ingrediente(nombre, unidad, valor, sitioCompra)
-        else:
-            self.vista_lista_ingredientes.error(validacion)
-        self.vista_lista_ingredientes.mostrar_ingredientes(self.logica.dar_ingredientes())
-        return validacion
+        self.despachador.ejecutar(validar_y_escribir, self.logica.validar_crear_editar_ingrediente,
+                                  (nombre, unidad, valor, sitioCompra),
+                                  self.logica.crear_ingrediente, (nombre, unidad, valor, sitioCompra),
+                                  descripcion="crear el ingrediente", al_terminar=self.ingrediente_guardado)
 
     def editar_ingrediente(self, id, nombre, unidad, valor, sitioCompra):
         """
         Esta función permite editar un ingrediente
         """
-        validacion = self.logica.validar_crear_editar_ingrediente(nombre, unidad, valor, sitioCompra)
+        self.despachador.ejecutar(validar_y_escribir, self.logica.validar_crear_editar_ingrediente,
+                                  (nombre, unidad, valor, sitioCompra, id),
+                                  self.logica.editar_ingrediente, (id, nombre, unidad, valor, sitioCompra),
+                                  descripcion="editar el ingrediente", al_terminar=self.ingrediente_guardado)
+
+    def ingrediente_guardado(self, validacion):
+        """
+        Esta función recarga la lista de ingredientes o muestra el error de la validación
+        """
         if validacion == "":
-            self.logica.editar_ingrediente(id, nombre, unidad, valor, sitioCompra)
+            self.refrescar_ingredientes()
         else:
             self.vista_lista_ingredientes.error(validacion)
 
@@ -106,20 +153,18 @@ class App_Recetario(QApplication):
         """
         Esta función permite eliminar un ingrediente
         """
-        self.logica.eliminar_ingrediente(indice)
-        self.vista_lista_ingredientes.mostrar_ingredientes(self.logica.dar_ingredientes())
+        self.despachador.ejecutar(self.logica.eliminar_ingrediente, indice, descripcion="eliminar el ingrediente",
+                                  al_terminar=self.refrescar_ingredientes)
 
 
     def agregar_ingrediente_receta(self, receta, ingrediente, cantidad):
         """
         Esta función permite registrar un ingrediente a una receta especifica
         """
-
-        validacion = self.logica.validar_crear_editar_ingReceta(receta, ingrediente, cantidad)
-        if validacion == "":
-            self.logica.agregar_ingrediente_receta(receta, ingrediente, cantidad)
-        else:
-            self.vista_lista_ingReceta.error(validacion)
+        self.despachador.ejecutar(validar_y_escribir, self.logica.validar_crear_editar_ingReceta,
+                                  (receta, ingrediente, cantidad),
+                                  self.logica.agregar_ingrediente_receta, (receta, ingrediente, cantidad),
+                                  descripcion="agregar el ingrediente a la receta", al_terminar=self.ingrediente_receta_guardado)
 
 
     
@@ -127,10 +172,17 @@ class App_Recetario(QApplication):
         """
         Esta función permite registrar un ingrediente de una receta especifica
         """
-        validacion = self.logica.validar_crear_editar_ingReceta(receta, ingrediente, cantidad)
-        if validacion == "":
-            self.logica.editar_ingrediente_receta(id_ingrediente_receta,receta, ingrediente, cantidad)
-        else:
+        self.despachador.ejecutar(validar_y_escribir, self.logica.validar_crear_editar_ingReceta,
+                                  (receta, ingrediente, cantidad),
+                                  self.logica.editar_ingrediente_receta,
+                                  (id_ingrediente_receta, receta, ingrediente, cantidad),
+                                  descripcion="editar el ingrediente de la receta", al_terminar=self.ingrediente_receta_guardado)
+
+    def ingrediente_receta_guardado(self, validacion):
+        """
+        Esta función muestra el error de la validación de un ingrediente de la receta, si lo hay
+        """
+        if validacion != "":
             self.vista_lista_ingReceta.error(validacion)
 
 			
@@ -138,23 +190,42 @@ class App_Recetario(QApplication):
         """
         Esta función permite eliminar un ingrediente de una receta especifica
         """
-        self.logica.eliminar_ingrediente_receta(indice, receta)
+        self.despachador.ejecutar(self.logica.eliminar_ingrediente_receta, indice, receta,
+                                  descripcion="eliminar el ingrediente de la receta")
 		
 
     def mostrar_ingredientes_receta(self, receta):
         """
         Esta función muestra la ventana con la lista de ingredientes de una receta
         """
-        ingredientes = self.logica.dar_ingredientes()
-        self.vista_lista_ingReceta = VistaListaIngredientesReceta(self, receta, ingredientes)
-        self.vista_lista_ingReceta.mostrar_ing_receta(self.logica.dar_ingredientes_receta(self.receta_actual))
+        from .VistaListaIngredientesReceta import VistaListaIngredientesReceta
+        self.vista_lista_ingReceta = VistaListaIngredientesReceta(self, receta)
+        #Se encola después de las escrituras pendientes de la receta, así que ya las incluye
+        self.despachador.ejecutar(self.logica.dar_ingredientes_receta, self.receta_actual,
+                                  descripcion="cargar los ingredientes de la receta", al_terminar=self.vista_lista_ingReceta.mostrar_ing_receta, agrupar=True)
 
 
     def mostrar_preparacion(self, id_receta, cantidad_personas):
         """
         Esta función muestra la preparacieon de una receta para un número de personas
         """
-        self.datos_preparacion = self.logica.dar_preparacion(id_receta, cantidad_personas)
+        self.despachador.ejecutar(self.logica.dar_preparacion, id_receta, cantidad_personas,
+                                  descripcion="calcular la preparación", al_terminar=self.mostrar_ventana_preparacion, agrupar=True)
+
+    def mostrar_ventana_preparacion(self, datos_preparacion):
+        """
+        Esta función muestra la ventana con la preparación calculada de una receta
+        """
+        if datos_preparacion is None:
+            mensaje_error = QMessageBox()
+            mensaje_error.setIcon(QMessageBox.Warning)
+            mensaje_error.setText("No se pudo calcular la preparación de la receta")
+            mensaje_error.setWindowTitle("Error")
+            mensaje_error.exec_()
+            self.mostrar_vista_lista_recetas()
+            return
+        from .VistaPreparacion import VistaPreparacion
+        self.datos_preparacion = datos_preparacion
         self.vista_reporte = VistaPreparacion( self, self.datos_preparacion['receta'])
         self.vista_reporte.mostrar_datos(self.datos_preparacion)
 
@@ -0,0 +1,33 @@
+'''
+Modelo de la lista de ingredientes para QTableView.
+
+Sin filtro los ingredientes se piden por páginas en orden de nombre; con filtro el modelo
+muestra el resultado de buscar_ingredientes, que la vista calcula fuera del hilo de la interfaz.
+'''
+from .ModeloTabla import TAMANO_PAGINA, ModeloTablaPaginada
+
+# Llave de cada columna en los diccionarios de dar_ingredientes; la última columna es la de opciones
+COLUMNAS = [('nombre', 'Ingrediente'), ('unidad', 'Unidad'), ('valor', 'Valor por unidad'),
+            ('sitioCompra', 'Sitio compra'), (None, 'Opciones')]
+COLUMNA_NOMBRE = 0
+COLUMNA_OPCIONES = len(COLUMNAS) - 1
+
+
+class ModeloListaIngredientes(ModeloTablaPaginada):
+    ''' Expone los ingredientes de la lógica por páginas, ordenados por nombre '''
+
+    def __init__(self, logica, tamano_pagina=TAMANO_PAGINA, parent=None, despachador=None):
+        ''' Parámetros:
+            logica (FachadaRecetario): La lógica de la que se leen los ingredientes
+            tamano_pagina (int): Cantidad de ingredientes pedidos en cada página
+            despachador (Despachador): Si se indica, las páginas se piden en segundo plano
+        '''
+        super().__init__(COLUMNAS, self.dar_pagina_por_nombre, tamano_pagina, parent, despachador)
+        self.logica = logica
+
+    def dar_pagina_por_nombre(self, desde_id, limite):
+        return self.logica.dar_ingredientes(desde_id, limite, "nombre")
+
+    def dar_ingrediente(self, fila):
+        ''' Retorna el diccionario del ingrediente en la fila indicada del modelo '''
+        return self.dar_fila(fila)
@@ -0,0 +1,50 @@
+'''
+Modelo de la lista de recetas para QTableView, cargado por páginas.
+
+Las recetas se piden a la lógica con dar_recetas paginado por llave: la vista llama a
+fetchMore mientras la última fila cargada sea visible, así que abrir la lista sólo consulta
+las páginas que caben en pantalla, sin importar el tamaño del catálogo. El proxy ordena y
+filtra las filas ya cargadas; al filtrar, la vista sigue pidiendo páginas hasta llenarse.
+'''
+from PyQt5.QtCore import QSortFilterProxyModel, Qt
+
+from .ModeloTabla import TAMANO_PAGINA, ModeloTablaPaginada
+
+# Llave de cada columna en los diccionarios de dar_recetas; la última columna es la de opciones
+COLUMNAS = [('nombre', 'Nombre'), ('tiempo', 'Tiempo'), ('personas', 'Personas'), ('calorias', 'Calorías'),
+            (None, 'Opciones')]
+COLUMNA_NOMBRE = 0
+COLUMNA_OPCIONES = len(COLUMNAS) - 1
+
+
+class ModeloListaRecetas(ModeloTablaPaginada):
+    ''' Expone las recetas de la lógica por páginas '''
+
+    def __init__(self, logica, tamano_pagina=TAMANO_PAGINA, parent=None, despachador=None):
+        ''' Parámetros:
+            logica (FachadaRecetario): La lógica de la que se leen las recetas
+            tamano_pagina (int): Cantidad de recetas pedidas en cada página
+            despachador (Despachador): Si se indica, las páginas se piden en segundo plano
+        '''
+        super().__init__(COLUMNAS, logica.dar_recetas, tamano_pagina, parent, despachador)
+        self.logica = logica
+
+    def dar_receta(self, fila):
+        ''' Retorna el diccionario de la receta en la fila indicada del modelo '''
+        return self.dar_fila(fila)
+
+
+class ProxyListaRecetas(QSortFilterProxyModel):
+    ''' Ordena por cualquier columna y filtra por nombre, sin distinguir mayúsculas '''
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSortRole(Qt.UserRole)
+        self.setSortCaseSensitivity(Qt.CaseInsensitive)
+        self.setSortLocaleAware(True)
+        self.setFilterKeyColumn(COLUMNA_NOMBRE)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+    def sort(self, columna, orden=Qt.AscendingOrder):
+        # La columna de opciones no tiene valores: ordenar por ella vuelve al orden de carga
+        super().sort(-1 if columna == COLUMNA_OPCIONES else columna, orden)
@@ -0,0 +1,124 @@
+'''
+Modelo de tabla para QTableView cargado por páginas desde la lógica.
+
+Las filas son los diccionarios que retorna la lógica y cada columna muestra una de sus
+llaves. La vista llama a fetchMore mientras la última fila cargada sea visible, así que
+abrir una lista sólo consulta las páginas que caben en pantalla, sin importar el tamaño
+del catálogo. Con un despachador las páginas se piden fuera del hilo de la interfaz y se
+agregan cuando llegan. También puede mostrar una lista ya calculada, como un resultado de búsqueda.
+'''
+from functools import partial
+
+from PyQt5 import sip
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# Filas pedidas a la lógica en cada llamada a fetchMore
+TAMANO_PAGINA = 100
+
+
+class ModeloTablaPaginada(QAbstractTableModel):
+    ''' Expone filas de diccionarios por páginas. Qt.UserRole retorna el valor sin formato,
+    que es el que usan los proxies para ordenar. Las columnas con llave None no tienen datos
+    y se pintan con un delegado '''
+
+    def __init__(self, columnas, dar_pagina, tamano_pagina=TAMANO_PAGINA, parent=None, despachador=None):
+        ''' Parámetros:
+            columnas (list): Tuplas (llave, encabezado); la primera columna se alinea a la izquierda
+            dar_pagina (function): Recibe el id de la última fila cargada (o None) y la cantidad
+                de filas, y retorna la página siguiente. None para una lista fija dada con asignar
+            tamano_pagina (int): Cantidad de filas pedidas en cada página
+            despachador (Despachador): Si se indica, las páginas se piden en segundo plano
+        '''
+        super().__init__(parent)
+        self.columnas = columnas
+        self.dar_pagina = dar_pagina
+        self.tamano_pagina = tamano_pagina
+        self.despachador = despachador
+        self.filas = []
+        self.completo = dar_pagina is None
+        # Página pedida y aún no recibida; las que llegan después de reiniciar se descartan
+        self.cargando = False
+        self.generacion = 0
+
+    def reiniciar(self):
+        ''' Descarta las filas cargadas; la vista vuelve a pedir la primera página '''
+        self.beginResetModel()
+        self.filas = []
+        self.completo = self.dar_pagina is None
+        self.cargando = False
+        self.generacion += 1
+        self.endResetModel()
+
+    def asignar(self, filas):
+        ''' Muestra una lista ya calculada, sin pedir más páginas '''
+        self.beginResetModel()
+        self.filas = list(filas)
+        self.completo = True
+        self.cargando = False
+        self.generacion += 1
+        self.endResetModel()
+
+    def dar_fila(self, fila):
+        ''' Retorna el diccionario de la fila indicada del modelo '''
+        return self.filas[fila]
+
+    def rowCount(self, padre=QModelIndex()):
+        return 0 if padre.isValid() else len(self.filas)
+
+    def columnCount(self, padre=QModelIndex()):
+        return 0 if padre.isValid() else len(self.columnas)
+
+    def data(self, indice, rol=Qt.DisplayRole):
+        if not indice.isValid():
+            return None
+        llave = self.columnas[indice.column()][0]
+        if llave is None:
+            return None
+        valor = self.filas[indice.row()].get(llave)
+        if rol == Qt.DisplayRole:
+            return '' if valor is None else str(valor)
+        if rol == Qt.UserRole:
+            return valor
+        if rol == Qt.ToolTipRole and indice.column() == 0:
+            return valor
+        if rol == Qt.TextAlignmentRole and indice.column() != 0:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, seccion, orientacion, rol=Qt.DisplayRole):
+        if orientacion == Qt.Horizontal and rol == Qt.DisplayRole:
+            return self.columnas[seccion][1]
+        return None
+
+    def canFetchMore(self, padre=QModelIndex()):
+        return not padre.isValid() and not self.completo and not self.cargando
+
+    def fetchMore(self, padre=QModelIndex()):
+        if not self.canFetchMore(padre):
+            return
+        desde_id = self.filas[-1]['id'] if self.filas else None
+        if self.despachador is None:
+            self.agregar_pagina(self.generacion, self.dar_pagina(desde_id, self.tamano_pagina))
+        else:
+            self.cargando = True
+            self.despachador.ejecutar(self.dar_pagina, desde_id, self.tamano_pagina, descripcion="cargar la lista",
+                                      al_terminar=partial(self.agregar_pagina, self.generacion),
+                                      al_fallar=partial(self.pagina_fallida, self.generacion), agrupar=True)
+
+    def agregar_pagina(self, generacion, pagina):
+        ''' Agrega al final la página recibida, si el modelo no se reinició desde que se pidió '''
+        # La ventana dueña del modelo pudo cerrarse y destruirse mientras la página llegaba
+        if sip.isdeleted(self) or generacion != self.generacion:
+            return
+        self.cargando = False
+        self.completo = len(pagina) < self.tamano_pagina
+        if pagina:
+            self.beginInsertRows(QModelIndex(), len(self.filas), len(self.filas) + len(pagina) - 1)
+            self.filas.extend(pagina)
+            self.endInsertRows()
+
+    def pagina_fallida(self, generacion, error):
+        ''' Deja de esperar la página pedida, para que la vista pueda volver a pedirla '''
+        if sip.isdeleted(self) or generacion != self.generacion:
+            return
+        self.cargando = False
@@ -0,0 +1,56 @@
+'''
+Caché de los íconos e imágenes de src/recursos.
+
+Cada archivo se lee y se decodifica una sola vez por proceso y todas las ventanas reciben la
+misma instancia. Así, reconstruir una ventana o pintar sus filas no vuelve a leer el PNG
+del disco. Las rutas se resuelven respecto al paquete y no al directorio de trabajo.
+'''
+import os
+from functools import lru_cache
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QIcon, QPixmap
+
+RUTA_RECURSOS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'recursos')
+
+# Ícono de todas las ventanas y logo del encabezado
+LOGO = "RecetarioLogo.png"
+
+
+def ruta_recurso(nombre):
+    ''' Retorna la ruta absoluta de un archivo de src/recursos '''
+    return os.path.join(RUTA_RECURSOS, nombre)
+
+
+@lru_cache(maxsize=None)
+def dar_pixmap(nombre, ancho=None, alto=None):
+    ''' Retorna la imagen decodificada, escalada conservando la proporción si se indica el tamaño
+    Parámetros:
+        nombre (string): Nombre del archivo en src/recursos
+        ancho (int): Ancho máximo o None para el tamaño original
+        alto (int): Alto máximo o None para el tamaño original
+    Retorna:
+        (QPixmap): La instancia compartida de la imagen
+    '''
+    pixmap = QPixmap(ruta_recurso(nombre))
+    if ancho is not None and alto is not None:
+        pixmap = pixmap.scaled(ancho, alto, Qt.KeepAspectRatio)
+    return pixmap
+
+
+@lru_cache(maxsize=None)
+def dar_icono(nombre):
+    ''' Retorna el ícono compartido de un archivo de src/recursos. Se construye desde la imagen ya
+    decodificada, así que las versiones escaladas que Qt genera al pintar también se comparten
+    Parámetros:
+        nombre (string): Nombre del archivo en src/recursos
+    Retorna:
+        (QIcon): La instancia compartida del ícono
+    '''
+    return QIcon(dar_pixmap(nombre))
+
+
+def vaciar_cache():
+    ''' Descarta los íconos e imágenes cargados; el siguiente uso los vuelve a leer del disco '''
+    dar_icono.cache_clear()
+    dar_pixmap.cache_clear()
@@ -0,0 +1,204 @@
+'''
+Ejecución de llamadas a la lógica fuera del hilo de la interfaz.
+
+Trabajo corre una función en un QThreadPool y entrega su resultado con señales, que Qt
+encola hacia el hilo de la interfaz. Despachador ejecuta las llamadas a la fachada en un
+único hilo de trabajo, en el orden en que se piden, y muestra el cursor de espera mientras
+haya alguna en curso. BusquedaDiferida busca mientras se escribe: espera una pausa en la
+escritura, mantiene a lo sumo una consulta en curso y descarta las respuestas viejas.
+'''
+import logging
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtWidgets import QApplication
+
+logger = logging.getLogger(__name__)
+
+# Pausa en la escritura, en milisegundos, antes de lanzar una búsqueda
+ESPERA_BUSQUEDA_MS = 250
+
+
+class SenalesTrabajo(QObject):
+    ''' Señales de un Trabajo; QRunnable no es un QObject y no puede declararlas '''
+    terminado = pyqtSignal(object, object)
+    fallido = pyqtSignal(object, object)
+
+
+class Trabajo(QRunnable):
+    ''' Ejecuta funcion(*argumentos) en un hilo del pool. Emite terminado(etiqueta, resultado)
+    o fallido(etiqueta, excepcion); la etiqueta permite reconocer respuestas viejas '''
+
+    def __init__(self, funcion, *argumentos, etiqueta=None):
+        super().__init__()
+        self.funcion = funcion
+        self.argumentos = argumentos
+        self.etiqueta = etiqueta
+        # El objeto sigue siendo de Python: el pool no lo destruye al terminar run
+        self.setAutoDelete(False)
+        # Se crean en el hilo de la interfaz: las señales emitidas desde el pool llegan encoladas
+        self.senales = SenalesTrabajo()
+
+    def run(self):
+        try:
+            resultado = self.funcion(*self.argumentos)
+        except Exception as error:
+            logger.exception('Error en %s', getattr(self.funcion, '__name__', self.funcion))
+            self.senales.fallido.emit(self.etiqueta, error)
+        else:
+            self.senales.terminado.emit(self.etiqueta, resultado)
+
+
+class Despachador(QObject):
+    ''' Ejecuta llamadas a la lógica fuera del hilo de la interfaz y entrega cada resultado a
+    su función al_terminar en el hilo de la interfaz. Las implementaciones de la fachada no
+    son seguras para varios hilos, así que el pool tiene un solo hilo: las llamadas corren una
+    a la vez y en orden, y una lectura pedida después de una escritura ve sus cambios '''
+
+    ocupado = pyqtSignal(bool)
+    fallo = pyqtSignal(str, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        # Llamadas que se pueden agrupar y aún no terminan, por (nombre, argumentos)
+        self.en_curso = {}
+        self.trabajos = set()
+        self.ultima_clave = None
+
+    def ejecutar(self, funcion, *argumentos, descripcion=None, al_terminar=None, al_fallar=None, agrupar=False):
+        ''' Encola funcion(*argumentos)
+        Parámetros:
+            funcion (function): El método de la lógica a ejecutar
+            descripcion (str): La operación como se le muestra al usuario si falla, por ejemplo
+                "guardar la receta"; por defecto el nombre de la función
+            al_terminar (function): Recibe el resultado, en el hilo de la interfaz
+            al_fallar (function): Recibe la excepción si la llamada falla, en el hilo de la interfaz
+            agrupar (bool): Para lecturas; si la última llamada encolada es idéntica y no ha
+                terminado, no se repite y su resultado se entrega también a esta
+        '''
+        clave = (getattr(funcion, '__name__', repr(funcion)), argumentos) if agrupar else None
+        try:
+            hash(clave)
+        except TypeError:
+            clave = None
+        if clave is not None and clave == self.ultima_clave and clave in self.en_curso:
+            self.en_curso[clave].al_terminar.append(al_terminar)
+            self.en_curso[clave].al_fallar.append(al_fallar)
+            return
+        self.ultima_clave = clave
+        trabajo = Trabajo(funcion, *argumentos)
+        # La etiqueta es el propio trabajo: así se reconoce al recibir su resultado
+        trabajo.etiqueta = trabajo
+        trabajo.clave = clave
+        trabajo.descripcion = getattr(funcion, '__name__', repr(funcion)) if descripcion is None else descripcion
+        trabajo.al_terminar = [al_terminar]
+        trabajo.al_fallar = [al_fallar]
+        trabajo.senales.terminado.connect(self._entregar)
+        trabajo.senales.fallido.connect(self._fallar)
+        if clave is not None:
+            self.en_curso[clave] = trabajo
+        if not self.trabajos:
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            self.ocupado.emit(True)
+        self.trabajos.add(trabajo)
+        self.pool.start(trabajo)
+
+    def esperar(self, milisegundos=-1):
+        ''' Espera a que terminen las llamadas encoladas; los resultados se entregan con el ciclo de eventos '''
+        return self.pool.waitForDone(milisegundos)
+
+    @pyqtSlot(object, object)
+    def _entregar(self, trabajo, resultado):
+        self._terminar(trabajo)
+        for al_terminar in trabajo.al_terminar:
+            if al_terminar is not None:
+                al_terminar(resultado)
+
+    @pyqtSlot(object, object)
+    def _fallar(self, trabajo, error):
+        self._terminar(trabajo)
+        for al_fallar in trabajo.al_fallar:
+            if al_fallar is not None:
+                al_fallar(error)
+        self.fallo.emit(trabajo.descripcion, error)
+
+    def _terminar(self, trabajo):
+        self.trabajos.discard(trabajo)
+        if self.en_curso.get(trabajo.clave) is trabajo:
+            del self.en_curso[trabajo.clave]
+        if not self.trabajos:
+            QApplication.restoreOverrideCursor()
+            self.ocupado.emit(False)
+
+
+class BusquedaDiferida(QObject):
+    ''' Lanza buscar(texto) en segundo plano cuando se deja de escribir y emite
+    resultados(texto, resultado) sólo para el último texto pedido '''
+
+    resultados = pyqtSignal(str, object)
+    ocupada = pyqtSignal(bool)
+
+    def __init__(self, buscar, espera_ms=ESPERA_BUSQUEDA_MS, pool=None, parent=None):
+        ''' Parámetros:
+            buscar (function): Función que recibe el texto y retorna los resultados
+            espera_ms (int): Pausa en la escritura antes de buscar
+            pool (QThreadPool): Pool donde corren las búsquedas, por defecto el global
+        '''
+        super().__init__(parent)
+        self.buscar = buscar
+        self.pool = QThreadPool.globalInstance() if pool is None else pool
+        self.temporizador = QTimer(self)
+        self.temporizador.setSingleShot(True)
+        self.temporizador.setInterval(espera_ms)
+        self.temporizador.timeout.connect(self._lanzar)
+        # Cada pedido incrementa la generación; las respuestas de generaciones anteriores se descartan
+        self.generacion = 0
+        self.texto = ""
+        self.en_curso = None
+        self.pendiente = False
+
+    def solicitar(self, texto):
+        ''' Registra el texto a buscar y reinicia la espera '''
+        self.generacion += 1
+        self.texto = texto
+        self.temporizador.start()
+
+    def cancelar(self):
+        ''' Descarta la búsqueda pendiente y la respuesta de la que esté en curso '''
+        self.generacion += 1
+        self.pendiente = False
+        self.temporizador.stop()
+        if self.en_curso is None:
+            self.ocupada.emit(False)
+
+    def _lanzar(self):
+        if self.en_curso is not None:
+            # Sólo una consulta a la vez: la más reciente se lanza cuando termine la actual
+            self.pendiente = True
+            return
+        self.pendiente = False
+        trabajo = Trabajo(self.buscar, self.texto, etiqueta=(self.generacion, self.texto))
+        trabajo.senales.terminado.connect(self._entregar)
+        trabajo.senales.fallido.connect(self._fallar)
+        self.en_curso = trabajo
+        self.ocupada.emit(True)
+        self.pool.start(trabajo)
+
+    @pyqtSlot(object, object)
+    def _entregar(self, etiqueta, resultado):
+        generacion, texto = etiqueta
+        if generacion == self.generacion:
+            self.resultados.emit(texto, resultado)
+        self._terminar()
+
+    @pyqtSlot(object, object)
+    def _fallar(self, etiqueta, error):
+        self._terminar()
+
+    def _terminar(self):
+        self.en_curso = None
+        if self.pendiente:
+            self._lanzar()
+        elif not self.temporizador.isActive():
+            self.ocupada.emit(False)
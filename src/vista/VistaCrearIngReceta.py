@@ -4,23 +4,40 @@ from PyQt5 import QtCore
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
 
+from .Recursos import LOGO, dar_icono
+from .Trabajadores import BusquedaDiferida
+
+from src.modelo.Normalizacion import normalizar_nombre
+
+# Cantidad de sugerencias pedidas a la lógica por cada búsqueda
+LIMITE_SUGERENCIAS = 20
+
+
+def describir_ingrediente(ingrediente):
+    """
+    Retorna el texto con el que se muestra un ingrediente en el selector
+    """
+    return ingrediente["nombre"] + "[" + ingrediente["unidad"] + "]"
+
 
 class VistaCrearIngReceta(QDialog):
     # Diálogo para crear o editar un ingrediente de una receta
 
-    def __init__(self, ingredienteReceta, interfaz, ingredientes):
+    def __init__(self, ingredienteReceta, interfaz):
         """
         Constructor del diálogo
         """
         super().__init__()
 
         self.interfaz = interfaz
-        self.ingredientes = ingredientes
+        #Sugerencias mostradas, por su etiqueta; el catálogo completo nunca se carga en el diálogo
+        self.sugerencias = {}
 
         self.setFixedSize(400, 300)
-        self.setWindowIcon(QIcon("src/recursos/RecetarioLogo.png"))
+        self.setWindowIcon(dar_icono(LOGO))
 
         self.resultado = ""
+        self.ingrediente = None
 
         self.widget_dialogo = QListWidget()
 
@@ -42,11 +59,21 @@ class VistaCrearIngReceta(QDialog):
         etiqueta_ingrediente = QLabel("Ingrediente")
         distribuidor_dialogo.addWidget(etiqueta_ingrediente, numero_fila, 0)
 
-        self.combobox_ingredientes = QComboBox(self)
-        for ingrediente in self.ingredientes:
-            self.combobox_ingredientes.addItem(ingrediente["nombre"] + "[" + ingrediente["unidad"]+"]")
-        self.combobox_ingredientes.setCurrentIndex(0)
-        distribuidor_dialogo.addWidget(self.combobox_ingredientes, numero_fila, 1, 1, 2)
+        #Selector con autocompletado: al dejar de escribir se piden a la lógica las primeras
+        #coincidencias por prefijo, en el hilo del despachador, y llegan al completador al terminar
+        self.texto_ingrediente = QLineEdit(self)
+        self.texto_ingrediente.setPlaceholderText("Escriba para buscar")
+        self.modelo_sugerencias = QtCore.QStringListModel(self)
+        self.completador = QCompleter(self.modelo_sugerencias, self)
+        self.completador.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.completador.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.texto_ingrediente.setCompleter(self.completador)
+        self.busqueda = BusquedaDiferida(
+            lambda texto: self.interfaz.logica.buscar_ingredientes(texto, LIMITE_SUGERENCIAS),
+            pool=self.interfaz.despachador.pool, parent=self)
+        self.busqueda.resultados.connect(self.sugerir)
+        self.texto_ingrediente.textEdited.connect(self.busqueda.solicitar)
+        distribuidor_dialogo.addWidget(self.texto_ingrediente, numero_fila, 1, 1, 2)
         numero_fila = numero_fila + 1
 
         etiqueta_cantidad = QLabel("Cantidad")
@@ -76,14 +103,73 @@ class VistaCrearIngReceta(QDialog):
 
         # Si el diálogo se va a usar para editar, se pone la información correspondiente en los campos de texto
         if (ingredienteReceta != None):
-            indice_ingrediente_receta = self.combobox_ingredientes.findText(ingredienteReceta["ingrediente"] + "[" + ingredienteReceta["unidad"]+"]")
-            self.combobox_ingredientes.setCurrentIndex(indice_ingrediente_receta)
+            self.texto_ingrediente.setText(describir_ingrediente({"nombre": ingredienteReceta["ingrediente"],
+                                                                  "unidad": ingredienteReceta["unidad"]}))
             self.texto_cantidad.setText(str(ingredienteReceta["cantidad"]))
 
+    def sugerir(self, texto, ingredientes):
+        """
+        Esta función actualiza las sugerencias del selector con las coincidencias del texto
+        """
+        self.sugerencias = {describir_ingrediente(ingrediente): ingrediente for ingrediente in ingredientes}
+        self.modelo_sugerencias.setStringList(list(self.sugerencias))
+        if self.texto_ingrediente.hasFocus():
+            self.completador.complete()
+
+    def dar_nombre(self):
+        """
+        Esta función retorna el nombre del ingrediente escrito en el selector, sin la unidad
+        """
+        return self.texto_ingrediente.text().strip().rsplit("[", 1)[0].strip()
+
+    def dar_ingrediente(self, ingredientes):
+        """
+        Esta función retorna el ingrediente de la lista cuyo nombre es el escrito en el selector,
+        o None si no corresponde a ninguno
+        """
+        nombre = normalizar_nombre(self.dar_nombre())
+        coincidencias = [ingrediente for ingrediente in ingredientes
+                         if normalizar_nombre(ingrediente["nombre"]) == nombre]
+        return coincidencias[0] if len(coincidencias) == 1 else None
+
     def guardar(self):
         """
         Esta función envía la información de la solicitud de guardar los cambios
         """
+        texto = self.texto_ingrediente.text().strip()
+        if texto in self.sugerencias:
+            self.ingrediente_elegido(self.sugerencias[texto])
+            return
+        #El texto no se eligió de las sugerencias (por ejemplo, al editar): se busca por su nombre
+        self.btn_guardar.setEnabled(False)
+        self.interfaz.despachador.ejecutar(self.interfaz.logica.buscar_ingredientes, self.dar_nombre(),
+                                           LIMITE_SUGERENCIAS, descripcion="buscar el ingrediente",
+                                           al_terminar=self.ingredientes_encontrados,
+                                           al_fallar=lambda error: self.btn_guardar.setEnabled(True),
+                                           agrupar=True)
+
+    def ingredientes_encontrados(self, ingredientes):
+        """
+        Esta función elige, entre los ingredientes encontrados, el que tiene el nombre escrito
+        """
+        self.ingrediente_elegido(self.dar_ingrediente(ingredientes))
+
+    def ingrediente_elegido(self, ingrediente):
+        """
+        Esta función cierra el diálogo con el ingrediente elegido, o avisa si no se encontró
+        """
+        self.btn_guardar.setEnabled(True)
+        if self.resultado == 0:
+            #El diálogo se canceló mientras se buscaba el ingrediente
+            return
+        self.ingrediente = ingrediente
+        if self.ingrediente is None:
+            mensaje_error = QMessageBox()
+            mensaje_error.setIcon(QMessageBox.Warning)
+            mensaje_error.setText("Seleccione un ingrediente de la lista")
+            mensaje_error.setWindowTitle("Ingrediente no encontrado")
+            mensaje_error.exec_()
+            return
         self.resultado = 1
         self.close()
         return self.resultado
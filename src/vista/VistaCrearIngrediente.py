@@ -2,6 +2,8 @@
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
 
+from .Recursos import LOGO, dar_icono
+
 
 class VistaCrearIngrediente(QDialog):
     # Diálogo para crear o editar un ingrediente
@@ -15,7 +17,7 @@ class VistaCrearIngrediente(QDialog):
         self.interfaz = interfaz
 
         self.setFixedSize(400, 300)
-        self.setWindowIcon(QIcon("src/recursos/RecetarioLogo.png"))
+        self.setWindowIcon(dar_icono(LOGO))
 
         self.resultado = ""
 
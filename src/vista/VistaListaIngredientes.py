@@ -2,9 +2,13 @@ from PyQt5.QtWidgets import *
 from PyQt5.QtGui import * 
 from PyQt5.QtCore import *
 
-from functools import partial
+from .DelegadoAcciones import DelegadoAcciones
+from .ModeloListaIngredientes import COLUMNA_NOMBRE, COLUMNA_OPCIONES, ModeloListaIngredientes
+from .Recursos import LOGO, dar_icono
+from .Trabajadores import BusquedaDiferida
 
-from  .VistaCrearIngrediente import VistaCrearIngrediente
+# Cantidad máxima de ingredientes mostrados para un filtro
+LIMITE_BUSQUEDA = 200
 
 
 class VistaListaIngredientes(QWidget):
@@ -30,7 +34,7 @@ class VistaListaIngredientes(QWidget):
         # inicializamos la ventana
         self.setWindowTitle(self.titulo)
         self.setFixedSize(self.width, self.height)
-        self.setWindowIcon(QIcon("src/recursos/RecetarioLogo.png"))
+        self.setWindowIcon(dar_icono(LOGO))
          
         self.distribuidor_base = QVBoxLayout(self)        
 
@@ -42,13 +46,13 @@ class VistaListaIngredientes(QWidget):
         self.btn_agregar_ingrediente=QPushButton("Agregar ingrediente", self)
         self.btn_agregar_ingrediente.setFixedSize(170, 40)
         self.btn_agregar_ingrediente.setToolTip("Agregar ingrediente")
-        self.btn_agregar_ingrediente.setIcon(QIcon("src/recursos/006-add.png"))
+        self.btn_agregar_ingrediente.setIcon(dar_icono("006-add.png"))
         self.btn_agregar_ingrediente.clicked.connect(self.mostrar_dialogo_agregar_ingrediente)
 
         self.btn_volver = QPushButton("Volver", self)
         self.btn_volver.setFixedSize(170, 40)
         self.btn_volver.setToolTip("Volver")
-        self.btn_volver.setIcon(QIcon("src/recursos/007-back-button.png"))
+        self.btn_volver.setIcon(dar_icono("007-back-button.png"))
         self.btn_volver.clicked.connect(self.volver)
 
 
@@ -58,57 +62,57 @@ class VistaListaIngredientes(QWidget):
         self.contenedor_tabla.setTitle('Ingredientes')
         self.distribuidor_base.addWidget(self.contenedor_tabla)
 
-        #Creación de la tabla con la lista de ingredientes
-        self.tabla_ingredientes = QScrollArea(self)
-        self.tabla_ingredientes.setWidgetResizable(True)
-        self.tabla_ingredientes.setStyleSheet('QScrollArea{border:none}')
-        self.tabla_ingredientes.setFixedSize(700, 300)
-        self.widget_tabla_ingredientes = QWidget()
-        self.distribuidor_tabla_ingredientes = QGridLayout(self.widget_tabla_ingredientes)
-        self.tabla_ingredientes.setWidget(self.widget_tabla_ingredientes)
+        #Creación del filtro. Cada pulsación reinicia la espera y la búsqueda corre en el hilo
+        #del despachador, así que escribir no bloquea la ventana mientras la lógica responde
+        distribuidor_filtro = QHBoxLayout()
+        self.texto_filtro = QLineEdit(self)
+        self.texto_filtro.setPlaceholderText("Buscar ingrediente")
+        self.texto_filtro.setClearButtonEnabled(True)
+        self.texto_filtro.textChanged.connect(self.filtrar)
+        distribuidor_filtro.addWidget(self.texto_filtro)
+        self.etiqueta_buscando = QLabel("Buscando...", self)
+        self.etiqueta_buscando.setFixedWidth(80)
+        self.etiqueta_buscando.setVisible(False)
+        distribuidor_filtro.addWidget(self.etiqueta_buscando)
+        self.distribuidor_base.insertLayout(0, distribuidor_filtro)
+
+        self.busqueda = BusquedaDiferida(
+            lambda texto: self.interfaz.logica.buscar_ingredientes(texto, LIMITE_BUSQUEDA),
+            pool=self.interfaz.despachador.pool, parent=self)
+        self.busqueda.resultados.connect(self.mostrar_resultados)
+        self.busqueda.ocupada.connect(self.etiqueta_buscando.setVisible)
+
+        #Creación de la tabla con la lista de ingredientes. Sin filtro el modelo pide los
+        #ingredientes por páginas a medida que se desplaza
+        self.modelo_ingredientes = ModeloListaIngredientes(self.interfaz.logica, parent=self,
+                                                           despachador=self.interfaz.despachador)
+
+        self.delegado_opciones = DelegadoAcciones([
+            ('editar', "004-edit-button.png", "Editar"),
+            ('eliminar', "005-delete.png", "Borrar")], parent=self)
+        self.delegado_opciones.accion_solicitada.connect(self.ejecutar_accion)
+
+        self.tabla_ingredientes = QTableView(self)
+        self.tabla_ingredientes.setFixedSize(740, 340)
+        self.tabla_ingredientes.setModel(self.modelo_ingredientes)
+        self.tabla_ingredientes.setItemDelegateForColumn(COLUMNA_OPCIONES, self.delegado_opciones)
+        self.tabla_ingredientes.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tabla_ingredientes.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.tabla_ingredientes.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tabla_ingredientes.setMouseTracking(True)
+        self.tabla_ingredientes.verticalHeader().hide()
+        self.tabla_ingredientes.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.tabla_ingredientes.verticalHeader().setDefaultSectionSize(48)
+        encabezado = self.tabla_ingredientes.horizontalHeader()
+        encabezado.setFont(QFont("Times",weight=QFont.Bold))
+        encabezado.setSectionResizeMode(QHeaderView.Fixed)
+        encabezado.setSectionResizeMode(COLUMNA_NOMBRE, QHeaderView.Stretch)
+        for columna in range(1, COLUMNA_OPCIONES):
+            self.tabla_ingredientes.setColumnWidth(columna, 110)
+        self.tabla_ingredientes.setColumnWidth(COLUMNA_OPCIONES, self.delegado_opciones.dar_ancho())
+        self.tabla_ingredientes.doubleClicked.connect(lambda indice: self.ejecutar_accion('editar', indice))
         self.contenedor_tabla.layout().addWidget(self.tabla_ingredientes)
 
-        self.distribuidor_tabla_ingredientes.setColumnStretch(0, 1)
-        self.distribuidor_tabla_ingredientes.setColumnStretch(1, 1)
-        self.distribuidor_tabla_ingredientes.setColumnStretch(2, 1)
-        self.distribuidor_tabla_ingredientes.setColumnStretch(3, 1)
-        self.distribuidor_tabla_ingredientes.setColumnStretch(4, 1)
-        self.distribuidor_tabla_ingredientes.setColumnStretch(5, 1)
-
-        self.distribuidor_tabla_ingredientes.setSpacing(0)
-
-        #Creación de las etiquetas de encabezado
-        etiqueta_nombre = QLabel("Ingrediente")
-        etiqueta_nombre.setFixedSize(180,40)
-        etiqueta_nombre.setFont(QFont("Times",weight=QFont.Bold)) 
-        self.distribuidor_tabla_ingredientes.addWidget(etiqueta_nombre, 0, 0, Qt.AlignTop)
-
-        etiqueta_unidad = QLabel("Unidad")
-        etiqueta_unidad.setFixedSize(80,40)
-        etiqueta_unidad.setFont(QFont("Times",weight=QFont.Bold)) 
-        etiqueta_unidad.setAlignment(Qt.AlignCenter)
-        self.distribuidor_tabla_ingredientes.addWidget(etiqueta_unidad, 0, 1, Qt.AlignTop)
-        
-        etiqueta_valor = QLabel("Valor \n por unidad")
-        etiqueta_valor.setFixedSize(100,60)
-        etiqueta_valor.setFont(QFont("Times",weight=QFont.Bold)) 
-        etiqueta_valor.setAlignment(Qt.AlignCenter)
-        self.distribuidor_tabla_ingredientes.addWidget(etiqueta_valor, 0, 2, Qt.AlignTop)
-
-        etiqueta_sitio = QLabel("Sitio \n compra")
-        etiqueta_sitio.setFixedSize(180,60)
-        etiqueta_sitio.setFont(QFont("Times",weight=QFont.Bold)) 
-        etiqueta_sitio.setAlignment(Qt.AlignCenter)
-        self.distribuidor_tabla_ingredientes.addWidget(etiqueta_sitio, 0, 3, Qt.AlignTop)
-
-
-
-        etiqueta_accion = QLabel("Opciones")
-        etiqueta_accion.setFixedSize(60,40)
-        etiqueta_accion.setFont(QFont("Times",weight=QFont.Bold)) 
-        etiqueta_accion.setAlignment(Qt.AlignCenter)
-        self.distribuidor_tabla_ingredientes.addWidget(etiqueta_accion, 0, 4, 0, 2, Qt.AlignTop | Qt.AlignCenter)
-
         #Se añaden los botones a la caja de botones
         caja_botones.layout().addWidget(self.btn_agregar_ingrediente)
         caja_botones.layout().addWidget(self.btn_volver)
@@ -117,80 +121,60 @@ class VistaListaIngredientes(QWidget):
         caja_botones.setStyleSheet("#MyBox{border:3px}")
         self.distribuidor_base.addWidget(caja_botones)
 
-    def mostrar_ingredientes(self, lista_ingredientes):
+    def mostrar_ingredientes(self):
         """
-        Esta función muestra la lista de ingredientes
+        Esta función vuelve a cargar la lista de ingredientes, respetando el filtro escrito
         """
-        self.ingredientes = lista_ingredientes
-
-        #Ciclo para poblar la tabla
-        numero_fila = 0
-        for ingrediente in self.ingredientes:
-
-            etiqueta_nombre=QLabel(ingrediente["nombre"])
-            etiqueta_nombre.setWordWrap(True)
-            etiqueta_nombre.setFixedSize(180,40)
-            self.distribuidor_tabla_ingredientes.addWidget(etiqueta_nombre, numero_fila + 1, 0, Qt.AlignTop)
-
-            etiqueta_unidad=QLabel(ingrediente["unidad"])
-            etiqueta_unidad.setWordWrap(True)
-            etiqueta_unidad.setFixedSize(80,40)
-            etiqueta_unidad.setAlignment(Qt.AlignCenter)
-            self.distribuidor_tabla_ingredientes.addWidget(etiqueta_unidad, numero_fila + 1, 1, Qt.AlignTop)
-
-            etiqueta_valor=QLabel(str(ingrediente["valor"]))
-            etiqueta_valor.setWordWrap(True)
-            etiqueta_valor.setFixedSize(120,40)
-            etiqueta_valor.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.distribuidor_tabla_ingredientes.addWidget(etiqueta_valor, numero_fila + 1, 2, Qt.AlignHCenter)
-
-            etiqueta_sitioCompras=QLabel(ingrediente["sitioCompra"])
-            etiqueta_sitioCompras.setWordWrap(True)
-            etiqueta_sitioCompras.setFixedSize(180,40)
-            etiqueta_sitioCompras.setAlignment(Qt.AlignCenter)
-            self.distribuidor_tabla_ingredientes.addWidget(etiqueta_sitioCompras, numero_fila + 1, 3, Qt.AlignTop)
-
-            boton_editar=QPushButton("",self)
-            boton_editar.setToolTip("Editar")
-            boton_editar.setFixedSize(40,40)
-            boton_editar.setIcon(QIcon("src/recursos/004-edit-button.png"))
-            boton_editar.clicked.connect(partial(self.mostrar_dialogo_editar_ingrediente, numero_fila))
-            self.distribuidor_tabla_ingredientes.addWidget(boton_editar, numero_fila + 1, 4, Qt.AlignTop)
+        self.filtrar(self.texto_filtro.text())
 
-            etiqueta_eliminar=QPushButton("",self)
-            etiqueta_eliminar.setToolTip("Borrar")
-            etiqueta_eliminar.setFixedSize(40,40)
-            etiqueta_eliminar.setIcon(QIcon("src/recursos/005-delete.png"))
-            etiqueta_eliminar.clicked.connect(partial(self.eliminar_ingrediente, numero_fila))
-            self.distribuidor_tabla_ingredientes.addWidget(etiqueta_eliminar, numero_fila + 1, 5, Qt.AlignTop)
+    def filtrar(self, texto):
+        """
+        Esta función pide la búsqueda del texto, o vuelve a la lista paginada si está vacío
+        """
+        if texto.strip():
+            self.busqueda.solicitar(texto)
+        else:
+            self.busqueda.cancelar()
+            self.modelo_ingredientes.reiniciar()
 
-            numero_fila=numero_fila+1
+    def mostrar_resultados(self, texto, ingredientes):
+        """
+        Esta función muestra los ingredientes encontrados para el último texto buscado
+        """
+        self.modelo_ingredientes.asignar(ingredientes)
 
-            #para ajustar la forma de la tabla (y evitar que queden muy espaciados)
-            self.distribuidor_tabla_ingredientes.layout().setRowStretch(numero_fila + 1, 1)
+    def ejecutar_accion(self, accion, indice):
+        """
+        Esta función ejecuta la acción de un botón de opciones sobre el ingrediente de la fila indicada
+        """
+        ingrediente = self.modelo_ingredientes.dar_ingrediente(indice.row())
+        if accion == 'editar':
+            self.mostrar_dialogo_editar_ingrediente(ingrediente)
+        elif accion == 'eliminar':
+            self.eliminar_ingrediente(ingrediente['id'])
 
     def mostrar_dialogo_agregar_ingrediente(self):
         """
         Esta función ejecuta el diálogo para crear un nuevo ingrediente
         """
+        from .VistaCrearIngrediente import VistaCrearIngrediente
         dialogo=VistaCrearIngrediente(None, self.interfaz)
         dialogo.exec_()
         if dialogo.resultado==1:
             self.interfaz.crear_ingrediente(dialogo.texto_nombre.text(), dialogo.texto_unidad.text(), dialogo.texto_valor.text(),
                                           dialogo.texto_sitioCompra.text())
 
-    def mostrar_dialogo_editar_ingrediente(self, id_ingrediente):
+    def mostrar_dialogo_editar_ingrediente(self, ingrediente):
         """
         Esta función ejecuta el diálogo para editar un ingrediente
         """    
-        dialogo=VistaCrearIngrediente(self.ingredientes[id_ingrediente], self.interfaz)
+        from .VistaCrearIngrediente import VistaCrearIngrediente
+        dialogo=VistaCrearIngrediente(ingrediente, self.interfaz)
         dialogo.exec_()
         if dialogo.resultado==1:  
-            self.interfaz.editar_ingrediente(id_ingrediente, dialogo.texto_nombre.text(), dialogo.texto_unidad.text(),dialogo.texto_valor.text(), dialogo.texto_sitioCompra.text())
-            self.hide()
-            self.interfaz.mostrar_ingredientes()
+            self.interfaz.editar_ingrediente(ingrediente['id'], dialogo.texto_nombre.text(), dialogo.texto_unidad.text(),dialogo.texto_valor.text(), dialogo.texto_sitioCompra.text())
 
-    def eliminar_ingrediente(self, indice_ingrediente):
+    def eliminar_ingrediente(self, id_ingrediente):
         """
         Esta función informa a la interfaz el ingrediente a eliminar
         """    
@@ -198,13 +182,11 @@ class VistaListaIngredientes(QWidget):
         mensaje_confirmacion.setIcon(QMessageBox.Question)
         mensaje_confirmacion.setText("¿Esta seguro de que desea eliminar este ingrediente?\nRecuerde que esta acción es irreversible")
         mensaje_confirmacion.setWindowTitle("¿Desea borrar este ingrediente?")
-        mensaje_confirmacion.setWindowIcon(QIcon("src/recursos/RecetarioLogo.png"))
+        mensaje_confirmacion.setWindowIcon(dar_icono(LOGO))
         mensaje_confirmacion.setStandardButtons(QMessageBox.Yes | QMessageBox.No ) 
         respuesta=mensaje_confirmacion.exec_()
         if respuesta == QMessageBox.Yes:
-            self.interfaz.eliminar_ingrediente(indice_ingrediente)
-            self.hide()
-            self.interfaz.mostrar_ingredientes()
+            self.interfaz.eliminar_ingrediente(id_ingrediente)
 
     def volver(self):
         """
@@ -218,7 +200,7 @@ class VistaListaIngredientes(QWidget):
             mensaje_error.setIcon(QMessageBox.Question)
             mensaje_error.setText("Error : " + error)
             mensaje_error.setWindowTitle("Error al guardar ingrediente")
-            mensaje_error.setWindowIcon(QIcon("src/recursos/RecetarioLogo.png"))
+            mensaje_error.setWindowIcon(dar_icono(LOGO))
             mensaje_error.setStandardButtons(QMessageBox.Ok ) 
             respuesta=mensaje_error.exec_()
 
@@ -1,8 +1,10 @@
 from PyQt5.QtWidgets import * 
 from PyQt5.QtGui import * 
 from PyQt5.QtCore import *
-from functools import partial
-from .VistaPersonasPreparacion import VistaPersonasPreparacion
+
+from .DelegadoAcciones import DelegadoAcciones
+from .ModeloListaRecetas import COLUMNA_NOMBRE, COLUMNA_OPCIONES, ModeloListaRecetas, ProxyListaRecetas
+from .Recursos import LOGO, dar_icono, dar_pixmap
 
 
 class VistaListaRecetas(QWidget):
@@ -27,14 +29,13 @@ class VistaListaRecetas(QWidget):
         #inicializamos la ventana
         self.setWindowTitle(self.title)
         self.setFixedSize(self.width, self.height)
-        self.setWindowIcon(QIcon("src/recursos/RecetarioLogo.png"))
+        self.setWindowIcon(dar_icono(LOGO))
          
         self.distribuidor_base = QVBoxLayout(self)
 
         #Creación del logo de encabezado
         self.logo=QLabel(self)
-        self.pixmap = QPixmap("src/recursos/RecetarioLogo.png")
-        self.pixmap = self.pixmap.scaled(488,158, Qt.KeepAspectRatio)
+        self.pixmap = dar_pixmap(LOGO, 488, 158)
         self.logo.setPixmap(self.pixmap)
         self.logo.setAlignment(Qt.AlignCenter)
         self.distribuidor_base.addWidget(self.logo,alignment=Qt.AlignCenter)
@@ -53,7 +54,7 @@ class VistaListaRecetas(QWidget):
         self.btn_crear_receta=QPushButton("Crear receta",self)
         self.btn_crear_receta.setFixedSize(288,48)
         self.btn_crear_receta.setToolTip("Crear receta")
-        self.btn_crear_receta.setIcon(QIcon("src/recursos/006-add.png"))
+        self.btn_crear_receta.setIcon(dar_icono("006-add.png"))
         self.btn_crear_receta.setIconSize(QSize(120,120))
         self.distribuidor_botones.addWidget(self.btn_crear_receta,0,1,Qt.AlignLeft)
         self.btn_crear_receta.clicked.connect(self.crear_receta)
@@ -61,97 +62,77 @@ class VistaListaRecetas(QWidget):
         self.btn_ver_ingredientes=QPushButton("Ingredientes",self)
         self.btn_ver_ingredientes.setFixedSize(288,48)
         self.btn_ver_ingredientes.setToolTip("Ingredientes")
-        self.btn_ver_ingredientes.setIcon(QIcon("src/recursos/010-ingredientes.png"))
+        self.btn_ver_ingredientes.setIcon(dar_icono("010-ingredientes.png"))
         self.btn_ver_ingredientes.setIconSize(QSize(30,30))
         self.distribuidor_botones.addWidget(self.btn_ver_ingredientes,0,2,Qt.AlignRight)
         self.distribuidor_base.addWidget(self.widget_botones,Qt.AlignCenter)
         self.btn_ver_ingredientes.clicked.connect(self.mostrar_ingredientes)
 
-        #Creación del área con la información de las recetas
-        self.tabla_recetas = QScrollArea(self)
-        self.tabla_recetas.setWidgetResizable(True)
-        self.tabla_recetas.setFixedSize(840, 400)
-        self.widget_tabla_recetas = QWidget()
-        self.distribuidor_tabla_recetas = QGridLayout()
-        self.widget_tabla_recetas.setLayout(self.distribuidor_tabla_recetas);
-        self.tabla_recetas.setWidget(self.widget_tabla_recetas)
+        #Creación del filtro y de la tabla de recetas. La tabla sólo pinta las filas visibles
+        #y el modelo pide las recetas a la lógica por páginas a medida que se desplaza
+        self.texto_filtro = QLineEdit(self)
+        self.texto_filtro.setPlaceholderText("Filtrar por nombre")
+        self.texto_filtro.setFixedWidth(840)
+        self.texto_filtro.setClearButtonEnabled(True)
+        self.distribuidor_base.addWidget(self.texto_filtro)
+
+        self.modelo_recetas = ModeloListaRecetas(self.interfaz.logica, parent=self, despachador=self.interfaz.despachador)
+        self.proxy_recetas = ProxyListaRecetas(self)
+        self.proxy_recetas.setSourceModel(self.modelo_recetas)
+        self.texto_filtro.textChanged.connect(self.proxy_recetas.setFilterFixedString)
+
+        self.delegado_opciones = DelegadoAcciones([
+            ('editar', "004-edit-button.png", "Editar"),
+            ('eliminar', "005-delete.png", "Borrar"),
+            ('preparar', "002-preparar.png", "Preparar")], parent=self)
+        self.delegado_opciones.accion_solicitada.connect(self.ejecutar_accion)
+
+        self.tabla_recetas = QTableView(self)
+        self.tabla_recetas.setFixedSize(840, 360)
+        self.tabla_recetas.setModel(self.proxy_recetas)
+        self.tabla_recetas.setItemDelegateForColumn(COLUMNA_OPCIONES, self.delegado_opciones)
+        self.tabla_recetas.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tabla_recetas.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.tabla_recetas.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tabla_recetas.setMouseTracking(True)
+        self.tabla_recetas.verticalHeader().hide()
+        #Filas de alto fijo: la tabla no tiene que medir el contenido de cada fila
+        self.tabla_recetas.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.tabla_recetas.verticalHeader().setDefaultSectionSize(48)
+        encabezado = self.tabla_recetas.horizontalHeader()
+        encabezado.setFont(QFont("Times",weight=QFont.Bold))
+        encabezado.setSectionResizeMode(QHeaderView.Fixed)
+        encabezado.setSectionResizeMode(COLUMNA_NOMBRE, QHeaderView.Stretch)
+        for columna in range(1, COLUMNA_OPCIONES):
+            self.tabla_recetas.setColumnWidth(columna, 90)
+        self.tabla_recetas.setColumnWidth(COLUMNA_OPCIONES, self.delegado_opciones.dar_ancho())
+        #Sin indicador de orden las recetas se muestran en el orden en que se cargan
+        encabezado.setSortIndicator(-1, Qt.AscendingOrder)
+        self.tabla_recetas.setSortingEnabled(True)
+        self.tabla_recetas.doubleClicked.connect(lambda indice: self.ejecutar_accion('editar', indice))
         self.distribuidor_base.addWidget(self.tabla_recetas)
 
         #Hacemos la ventana visible
         self.show()
 
 
-    def mostrar_recetas(self, lista_recetas):
+    def mostrar_recetas(self):
         """
-        Esta función puebla la tabla con las recetas
+        Esta función descarta las recetas cargadas para que la tabla vuelva a pedirlas a la lógica
         """
-        self.recetas = lista_recetas
-        numero_fila=0
-
-        self.distribuidor_tabla_recetas.setColumnStretch(0,1)
-        self.distribuidor_tabla_recetas.setColumnStretch(1,1)
-        self.distribuidor_tabla_recetas.setColumnStretch(2,0)
-        self.distribuidor_tabla_recetas.setColumnStretch(3,0)
-        self.distribuidor_tabla_recetas.setColumnStretch(4,0)
-        self.distribuidor_tabla_recetas.setColumnStretch(5,0)
-
-        #Ciclo para llenar la tabla
-        if (self.recetas!= None and len(self.recetas)>0) :
-            self.tabla_recetas.setVisible(True)
-
-            #Creación de las etiquetas
-            etiqueta_nombre=QLabel("Nombre")
-            etiqueta_nombre.setMinimumSize(QSize(0,0))
-            etiqueta_nombre.setMaximumSize(QSize(65525,65525))
-            etiqueta_nombre.setAlignment(Qt.AlignCenter)
-            etiqueta_nombre.setFont(QFont("Times",weight=QFont.Bold)) 
-            self.distribuidor_tabla_recetas.addWidget(etiqueta_nombre, 0,0, Qt.AlignLeft)
-
-            etiqueta_acciones=QLabel("Opciones")                      
-            etiqueta_acciones.setMinimumSize(QSize(0,0))
-            etiqueta_acciones.setMaximumSize(QSize(65525,65525))
-            etiqueta_acciones.setAlignment(Qt.AlignCenter)
-            etiqueta_acciones.setFont(QFont("Times",weight=QFont.Bold))               
-            self.distribuidor_tabla_recetas.addWidget(etiqueta_acciones, 0,2,1,3, Qt.AlignCenter)
-       
-            for dic_receta in self.recetas:
-                numero_fila=numero_fila+1
-
-                etiqueta_nombre=QLabel(dic_receta['nombre'] )
-                etiqueta_nombre.setWordWrap(True)
-                self.distribuidor_tabla_recetas.addWidget(etiqueta_nombre,numero_fila,0)
-
-                #Creación de los botones asociados a cada acción
-
-
-                btn_editar_receta=QPushButton("",self)
-                btn_editar_receta.setToolTip("Editar")
-                btn_editar_receta.setFixedSize(40,40)
-                btn_editar_receta.setIcon(QIcon("src/recursos/004-edit-button.png"))
-                btn_editar_receta.clicked.connect(partial(self.mostrar_receta,numero_fila-1) )
-                self.distribuidor_tabla_recetas.addWidget(btn_editar_receta,numero_fila,2,Qt.AlignCenter)
-
-                btn_eliminar=QPushButton("",self)
-                btn_eliminar.setToolTip("Borrar")
-                btn_eliminar.setFixedSize(40,40)
-                btn_eliminar.setIcon(QIcon("src/recursos/005-delete.png"))
-                btn_eliminar.clicked.connect(partial(self.eliminar_receta,numero_fila -1) )
-                self.distribuidor_tabla_recetas.addWidget(btn_eliminar,numero_fila,3,Qt.AlignCenter)
-
-                btn_preparar_receta = QPushButton("", self)
-                btn_preparar_receta.setToolTip("Preparar")
-                btn_preparar_receta.setFixedSize(40, 40)
-                btn_preparar_receta.setIcon(QIcon("src/recursos/002-preparar.png"))
-                btn_preparar_receta.clicked.connect(
-                    partial(self.mostrar_ventana_preparar, numero_fila - 1))
-                self.distribuidor_tabla_recetas.addWidget(btn_preparar_receta, numero_fila, 4,
-                                                           Qt.AlignCenter)
+        self.modelo_recetas.reiniciar()
 
-        else:
-                self.tabla_recetas.setVisible(False)
-
-        #persona para ajustar la forma de la tabla (y evitar que queden muy espaciados)
-        self.distribuidor_tabla_recetas.layout().setRowStretch(numero_fila+2, 1)
+    def ejecutar_accion(self, accion, indice):
+        """
+        Esta función ejecuta la acción de un botón de opciones sobre la receta de la fila indicada
+        """
+        id_receta = self.modelo_recetas.dar_receta(self.proxy_recetas.mapToSource(indice).row())['id']
+        if accion == 'editar':
+            self.mostrar_receta(id_receta)
+        elif accion == 'eliminar':
+            self.eliminar_receta(id_receta)
+        elif accion == 'preparar':
+            self.mostrar_ventana_preparar(id_receta)
 
     def crear_receta(self):
         """
@@ -176,13 +157,11 @@ class VistaListaRecetas(QWidget):
         mensaje_confirmacion.setText(
             "¿Esta seguro de que desea borrar esta receta?\nRecuerde que esta acción es irreversible")
         mensaje_confirmacion.setWindowTitle("¿Desea borrar esta receta?")
-        mensaje_confirmacion.setWindowIcon(QIcon("src/recursos/RecetarioLogo.png"))
+        mensaje_confirmacion.setWindowIcon(dar_icono(LOGO))
         mensaje_confirmacion.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         respuesta = mensaje_confirmacion.exec_()
         if respuesta == QMessageBox.Yes:
             self.interfaz.eliminar_receta(indice)
-            self.hide()
-            self.interfaz.mostrar_vista_lista_recetas()
 
     def mostrar_ingredientes(self):
         """
@@ -198,6 +177,7 @@ class VistaListaRecetas(QWidget):
         Esta función informa a la interfaz para desplegar la ventana de preparación de una receta
         """
         self.hide()
+        from .VistaPersonasPreparacion import VistaPersonasPreparacion
         dialogo=VistaPersonasPreparacion(self.interfaz)
         dialogo.exec_()
         if dialogo.cantidad_personas<0:
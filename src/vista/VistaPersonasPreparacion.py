@@ -1,6 +1,8 @@
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
 
+from .Recursos import LOGO, dar_icono
+
 
 class VistaPersonasPreparacion(QDialog):
     # Diálogo para crear o editar un ingrediente
@@ -15,7 +17,7 @@ class VistaPersonasPreparacion(QDialog):
         self.cantidad_personas = 0
 
         self.setFixedSize(300, 150)
-        self.setWindowIcon(QIcon("src/recursos/RecetarioLogo.png"))
+        self.setWindowIcon(dar_icono(LOGO))
 
         self.resultado = ""
 
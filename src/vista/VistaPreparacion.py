@@ -3,6 +3,8 @@ from PyQt5.QtGui import *
 from PyQt5.QtCore import *
 from PyQt5.QtWidgets import QWidget
 
+from .Recursos import LOGO, dar_icono
+
 
 class VistaPreparacion(QWidget):
     #Ventana que muestra la preparación de una receta
@@ -32,7 +34,7 @@ class VistaPreparacion(QWidget):
         # inicializamos la ventana
         self.setWindowTitle(self.titulo)
         self.setFixedSize(self.width, self.height)
-        self.setWindowIcon(QIcon("src/recursos/RecetarioLogo.png"))
+        self.setWindowIcon(dar_icono(LOGO))
 
         self.distribuidor_base = QVBoxLayout(self)
 
@@ -113,7 +115,7 @@ class VistaPreparacion(QWidget):
         self.btn_volver = QPushButton("Volver", self)
         self.btn_volver.setFixedSize(200, 40)
         self.btn_volver.setToolTip("Volver")
-        self.btn_volver.setIcon(QIcon("src/recursos/007-back-button.png"))
+        self.btn_volver.setIcon(dar_icono("007-back-button.png"))
         self.btn_volver.setIconSize(QSize(120, 120))
         self.btn_volver.clicked.connect(self.volver)
         self.distribuidor_base.addWidget(self.btn_volver)
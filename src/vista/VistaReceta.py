@@ -2,6 +2,8 @@ from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
 from PyQt5.QtCore import *
 
+from .Recursos import LOGO, dar_icono
+
 
 class VistaReceta(QWidget):
     #Ventana de receta
@@ -30,7 +32,7 @@ class VistaReceta(QWidget):
         # inicializamos la ventana
         self.setWindowTitle(self.titulo)
         self.setFixedSize(self.width, self.height)
-        self.setWindowIcon(QIcon("src/recursos/RecetarioLogo.png"))
+        self.setWindowIcon(dar_icono(LOGO))
 
         self.distribuidor_base = QVBoxLayout(self)
 
@@ -88,7 +90,7 @@ class VistaReceta(QWidget):
         self.btn_ingredientes_receta = QPushButton("Ingredientes", self)
         self.btn_ingredientes_receta.setFixedSize(130, 40)
         self.btn_ingredientes_receta.setToolTip("Ingredientes")
-        self.btn_ingredientes_receta.setIcon(QIcon("src/recursos/010-ingredientes.png"))
+        self.btn_ingredientes_receta.setIcon(dar_icono("010-ingredientes.png"))
         self.btn_ingredientes_receta.setDisabled(True)
         self.distribuidor_botones.addWidget(self.btn_ingredientes_receta, 0, 0, Qt.AlignCenter)
         self.btn_ingredientes_receta.clicked.connect(self.mostrar_ventana_ingredientes_receta)
@@ -96,7 +98,7 @@ class VistaReceta(QWidget):
         self.btn_guardar_receta = QPushButton("Guardar receta", self)
         self.btn_guardar_receta.setFixedSize(130, 40)
         self.btn_guardar_receta.setToolTip("Guardar receta")
-        self.btn_guardar_receta.setIcon(QIcon("src/recursos/floppy-disk.png"))
+        self.btn_guardar_receta.setIcon(dar_icono("floppy-disk.png"))
         self.distribuidor_botones.addWidget(self.btn_guardar_receta, 0, 1, Qt.AlignCenter)
         self.btn_guardar_receta.clicked.connect(self.guardar_cambios)
 
@@ -104,7 +106,7 @@ class VistaReceta(QWidget):
         self.btn_volver = QPushButton("Volver", self)
         self.btn_volver.setFixedSize(130, 40)
         self.btn_volver.setToolTip("Volver")
-        self.btn_volver.setIcon(QIcon("src/recursos/007-back-button.png"))
+        self.btn_volver.setIcon(dar_icono("007-back-button.png"))
         self.distribuidor_botones.addWidget(self.btn_volver, 0, 2, Qt.AlignCenter)
         self.btn_volver.clicked.connect(self.volver)
 
@@ -125,9 +127,14 @@ class VistaReceta(QWidget):
         """
         Esta función guarda los cambios de una receta
         """
-        resultado = self.interfaz.guardar_receta(self.texto_nombre_receta.text(), self.texto_tiempo_preparacion.text(),
-                                                  self.texto_personas.text(), self.texto_calorias.text(),
-                                                  self.texto_preparacion.toPlainText())
+        self.interfaz.guardar_receta(self.texto_nombre_receta.text(), self.texto_tiempo_preparacion.text(),
+                                     self.texto_personas.text(), self.texto_calorias.text(),
+                                     self.texto_preparacion.toPlainText(), al_terminar=self.cambios_guardados)
+
+    def cambios_guardados(self, resultado):
+        """
+        Esta función vuelve a la lista de recetas si se guardó la receta, o muestra el error de la validación
+        """
         if resultado == "":
             self.hide()
             self.interfaz.mostrar_vista_lista_recetas()
@@ -153,7 +160,7 @@ class VistaReceta(QWidget):
         mensaje_error.setIcon(QMessageBox.Question)
         mensaje_error.setText("Error: " + error)
         mensaje_error.setWindowTitle("Error al guardar receta")
-        mensaje_error.setWindowIcon(QIcon("src/recursos/RecetarioLogo.png"))
+        mensaje_error.setWindowIcon(dar_icono(LOGO))
         mensaje_error.setStandardButtons(QMessageBox.Ok ) 
         respuesta=mensaje_error.exec_()
 
@@ -162,7 +169,7 @@ class VistaReceta(QWidget):
         mensaje.setIcon(QMessageBox.Question)
         mensaje.setText("Receta guardada ")
         mensaje.setWindowTitle("Receta guradada")
-        mensaje.setWindowIcon(QIcon("src/recursos/RecetarioLogo.png"))
+        mensaje.setWindowIcon(dar_icono(LOGO))
         mensaje.setStandardButtons(QMessageBox.Ok ) 
         respuesta=mensaje.exec_()
 
@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
-from pkg_resources import get_distribution, DistributionNotFound
- 
-try:
-    # Change here if project is renamed and does not equal the package name
-    dist_name = __name__
-    __version__ = get_distribution(dist_name).version
-except DistributionNotFound:
-    __version__ = 'unknown'
-finally:
-    del get_distribution, DistributionNotFound
\ No newline at end of file
+
+
+def __getattr__(nombre):
+    # La versión se consulta sólo si se pide: importar pkg_resources al arrancar cuesta más
+    # que cargar la ventana principal
+    if nombre != '__version__':
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, nombre))
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        # Change here if project is renamed and does not equal the package name
+        return version(__name__)
+    except PackageNotFoundError:
+        return 'unknown'
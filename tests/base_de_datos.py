@@ -0,0 +1,62 @@
+'''
+Base de datos compartida por las pruebas que usan LogicaRecetario.
+
+Cada proceso crea una sola vez su base (en memoria por defecto, o en el archivo indicado en
+RECETARIO_DB_PRUEBAS) y le aplica las migraciones, de modo que varios procesos de pruebas en
+paralelo no se interfieren. Cada prueba corre dentro de una transacción con un SAVEPOINT que
+se revierte al terminar: las sesiones de la prueba y de la lógica se enlazan a esa conexión y
+sus commit no llegan a la base. Si una unidad de trabajo se revierte por un error, se pierde
+también lo que la prueba había creado antes en esa transacción.
+'''
+import os
+import unittest
+
+from faker import Faker
+
+from src.modelo.Declarative_base import Session, configurar_engine, dar_engine, sesion_contextual
+from src.modelo.Migraciones import migrar
+
+VARIABLE_ENTORNO_BD_PRUEBAS = 'RECETARIO_DB_PRUEBAS'
+
+SEMILLA_FAKER = 4101
+
+# Generador de datos compartido; se vuelve a sembrar en cada prueba para que sea reproducible
+faker = Faker("es_ES")
+
+_preparada = False
+
+
+def preparar_base_de_pruebas():
+    ''' Configura y migra la base de datos de pruebas del proceso, sólo la primera vez '''
+    global _preparada
+    if not _preparada:
+        configurar_engine(os.environ.get(VARIABLE_ENTORNO_BD_PRUEBAS, ':memory:'), transacciones_explicitas=True)
+        migrar(dar_engine())
+        _preparada = True
+
+
+class PruebaConBaseDeDatos(unittest.TestCase):
+    ''' Caso de prueba cuyos cambios en la base de datos se revierten al terminar cada prueba.
+    Las subclases que redefinen setUp y tearDown deben llamar a super() '''
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        preparar_base_de_pruebas()
+
+    def setUp(self):
+        self.conexion = dar_engine().connect()
+        self.transaccion = self.conexion.begin()
+        self.conexion.begin_nested()
+        Session.configure(bind=self.conexion)
+        sesion_contextual.remove()
+        faker.seed_instance(SEMILLA_FAKER)
+        self.faker = faker
+        self.session = Session()
+
+    def tearDown(self):
+        self.session.close()
+        sesion_contextual.remove()
+        self.transaccion.rollback()
+        self.conexion.close()
+        Session.configure(bind=dar_engine())
@@ -0,0 +1,58 @@
+import importlib.util
+import os
+import re
+import subprocess
+import sys
+import unittest
+
+RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Tiempo máximo de importación en frío de la interfaz, incluido PyQt5.QtWidgets, en milisegundos.
+# El tiempo depende de la máquina, así que sólo se verifica si se define
+# RECETARIO_PRESUPUESTO_IMPORTACION_MS (por ejemplo 200); los módulos importados siempre se verifican
+PRESUPUESTO_IMPORTACION_MS = os.environ.get('RECETARIO_PRESUPUESTO_IMPORTACION_MS')
+
+
+@unittest.skipIf(importlib.util.find_spec('PyQt5') is None, 'PyQt5 no está instalado')
+class ArranqueInterfazTestCase(unittest.TestCase):
+
+    def ejecutar(self, codigo, *opciones):
+        # En un proceso aparte para medir y observar una importación en frío
+        return subprocess.run([sys.executable] + list(opciones) + ['-c', codigo], cwd=RAIZ_PROYECTO,
+                              env=dict(os.environ, QT_QPA_PLATFORM='offscreen'),
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+
+    def test_importacion_no_carga_modulos_pesados(self):
+        proceso = self.ejecutar('import src.vista.InterfazRecetario', '-X', 'importtime')
+        acumulado = {}
+        for linea in proceso.stderr.decode().splitlines():
+            coincidencia = re.match(r'import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)', linea)
+            if coincidencia:
+                acumulado[coincidencia.group(2)] = int(coincidencia.group(1)) / 1000
+        self.assertNotIn('pkg_resources', acumulado)
+        self.assertNotIn('src.vista.VistaReceta', acumulado)
+        if PRESUPUESTO_IMPORTACION_MS is not None:
+            self.assertLess(acumulado['src.vista.InterfazRecetario'], float(PRESUPUESTO_IMPORTACION_MS))
+
+    def test_arranque_solo_construye_la_lista_de_recetas(self):
+        # La tabla pide la primera página desde el ciclo de eventos, después de pintarse, y la
+        # recibe del hilo del despachador
+        proceso = self.ejecutar(
+            'import sys\n'
+            'from src.logica.LogicaMock import LogicaMock\n'
+            'from src.vista.InterfazRecetario import App_Recetario\n'
+            'app = App_Recetario(sys.argv, LogicaMock())\n'
+            'modelo = app.vista_lista_recetas.modelo_recetas\n'
+            'for _ in range(200):\n'
+            '    app.processEvents()\n'
+            '    if modelo.rowCount():\n'
+            '        break\n'
+            '    app.despachador.esperar(10)\n'
+            'print(modelo.rowCount())\n'
+            'print(" ".join(modulo for modulo in sys.modules if modulo.startswith("src.vista.")))')
+        recetas, vistas = proceso.stdout.decode().splitlines()
+        self.assertGreater(int(recetas), 0)
+        self.assertEqual(sorted(vistas.split()), ['src.vista.DelegadoAcciones', 'src.vista.InterfazRecetario',
+                                                 'src.vista.ModeloListaRecetas', 'src.vista.ModeloTabla',
+                                                 'src.vista.Recursos', 'src.vista.Trabajadores',
+                                                 'src.vista.VistaListaRecetas'])
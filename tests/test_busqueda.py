@@ -0,0 +1,58 @@
+import unicodedata
+
+from src.logica.LogicaRecetario import LogicaRecetario
+from src.modelo.Receta import Receta
+from tests.base_de_datos import PruebaConBaseDeDatos
+
+
+class BusquedaRecetasTestCase(PruebaConBaseDeDatos):
+
+    def setUp(self):
+        super().setUp()
+        self.logica = LogicaRecetario()
+        self.ajiaco = Receta(nombre="Ajiaco santafereño", tiempoPreparacion=60, nroPersonasPreparacion=6, caloriasPorcion=400,
+                             instrucciones="Cocinar el pollo con guascas y papa criolla.")
+        self.pescado = Receta(nombre="Pescado al limón", tiempoPreparacion=30, nroPersonasPreparacion=2, caloriasPorcion=250,
+                              instrucciones="Llevar al HORNO con jugo de limón.")
+        self.pan = Receta(nombre="Pan de bono", tiempoPreparacion=40, nroPersonasPreparacion=10, caloriasPorcion=150,
+                          instrucciones="Mezclar almidón y queso, hornear a 200 grados.")
+        self.session.add_all([self.ajiaco, self.pescado, self.pan])
+        self.session.commit()
+
+    def nombres(self, resultados):
+        return [receta["nombre"] for receta in resultados]
+
+    def test_buscar_en_instrucciones(self):
+        self.assertEqual(self.nombres(self.logica.buscar_recetas("guascas")), ["Ajiaco santafereño"])
+
+    def test_buscar_sin_tildes_ni_mayusculas(self):
+        self.assertEqual(self.nombres(self.logica.buscar_recetas("LIMON")), ["Pescado al limón"])
+        self.assertEqual(self.nombres(self.logica.buscar_recetas("santafereno")), ["Ajiaco santafereño"])
+
+    def test_buscar_texto_descompuesto(self):
+        consulta = unicodedata.normalize("NFD", "limón")
+        self.assertEqual(self.nombres(self.logica.buscar_recetas(consulta)), ["Pescado al limón"])
+
+    def test_buscar_prefijo_y_relevancia(self):
+        resultados = self.nombres(self.logica.buscar_recetas("horn"))
+        self.assertEqual(sorted(resultados), ["Pan de bono", "Pescado al limón"])
+        self.assertEqual(self.nombres(self.logica.buscar_recetas("limón")), ["Pescado al limón"])
+
+    def test_paginar(self):
+        primera = self.logica.buscar_recetas("horn", limite=1)
+        segunda = self.logica.buscar_recetas("horn", limite=1, desplazamiento=1)
+        self.assertEqual(len(primera), 1)
+        self.assertEqual(len(segunda), 1)
+        self.assertNotEqual(primera[0]["id"], segunda[0]["id"])
+
+    def test_busqueda_vacia(self):
+        self.assertEqual(self.logica.buscar_recetas("  ¿? "), [])
+
+    def test_indice_sincronizado_al_editar_y_borrar(self):
+        self.pan.instrucciones = "Freír en aceite caliente."
+        self.session.commit()
+        self.assertEqual(self.nombres(self.logica.buscar_recetas("freir")), ["Pan de bono"])
+        self.assertNotIn("Pan de bono", self.nombres(self.logica.buscar_recetas("hornear")))
+        self.session.delete(self.ajiaco)
+        self.session.commit()
+        self.assertEqual(self.logica.buscar_recetas("guascas"), [])
@@ -0,0 +1,112 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from tempfile import TemporaryDirectory
+
+from src.consola.ConsolaRecetario import main
+from src.modelo.Ingrediente import Ingrediente
+from src.modelo.IngredienteReceta import IngredienteReceta
+from src.modelo.Receta import Receta
+from tests.base_de_datos import PruebaConBaseDeDatos
+
+RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ConsolaRecetarioTestCase(PruebaConBaseDeDatos):
+
+    def setUp(self):
+        super().setUp()
+        ajiaco = Receta(nombre="Ajiaco", tiempoPreparacion=60, nroPersonasPreparacion=4, caloriasPorcion=400,
+                        instrucciones="Cocinar la papa criolla con guascas.")
+        arepa = Receta(nombre="Arepa", tiempoPreparacion=20, nroPersonasPreparacion=2, caloriasPorcion=150,
+                       instrucciones="Asar la masa.")
+        papa = Ingrediente(nombre="Papa criolla", unidadMedida="libra", valorUnidad=4000, nombreProveedor="Plaza")
+        self.session.add_all([ajiaco, arepa, papa])
+        self.session.flush()
+        self.session.add(IngredienteReceta(idReceta=ajiaco.id, idIngrediente=papa.id, cantidad=2, unidadMedida="libra"))
+        self.session.commit()
+        self.id_ajiaco = ajiaco.id
+
+    def ejecutar(self, *argumentos):
+        salida = io.StringIO()
+        errores = io.StringIO()
+        with redirect_stdout(salida), redirect_stderr(errores):
+            codigo = main(argumentos)
+        return codigo, salida.getvalue(), errores.getvalue()
+
+    def test_listar_json_por_nombre(self):
+        codigo, salida, _ = self.ejecutar("listar", "--orden", "nombre", "--json")
+        self.assertEqual(codigo, 0)
+        self.assertEqual([receta["nombre"] for receta in json.loads(salida)], ["Ajiaco", "Arepa"])
+
+    def test_listar_tabla(self):
+        codigo, salida, _ = self.ejecutar("listar", "--limite", "1")
+        lineas = salida.splitlines()
+        self.assertEqual(codigo, 0)
+        self.assertEqual(lineas[0].split(), ["ID", "Nombre", "Tiempo", "Personas", "Calorías"])
+        self.assertEqual(len(lineas), 2)
+        self.assertIn("Ajiaco", lineas[1])
+
+    def test_ver_receta_con_ingredientes(self):
+        codigo, salida, _ = self.ejecutar("ver", str(self.id_ajiaco), "--json")
+        receta = json.loads(salida)
+        self.assertEqual(codigo, 0)
+        self.assertEqual(receta["preparacion"], "Cocinar la papa criolla con guascas.")
+        self.assertEqual(receta["ingredientes"], [{"ingrediente": "Papa criolla", "unidad": "libra", "cantidad": 2.0}])
+
+    def test_ver_receta_inexistente(self):
+        codigo, salida, errores = self.ejecutar("ver", "999")
+        self.assertEqual((codigo, salida), (1, ""))
+        self.assertIn("La receta no existe", errores)
+
+    def test_buscar(self):
+        codigo, salida, _ = self.ejecutar("buscar", "guascas", "--json")
+        self.assertEqual(codigo, 0)
+        self.assertEqual([receta["nombre"] for receta in json.loads(salida)], ["Ajiaco"])
+
+    def test_preparar_para_n_personas(self):
+        codigo, salida, _ = self.ejecutar("preparar", str(self.id_ajiaco), "8", "--json")
+        preparacion = json.loads(salida)
+        self.assertEqual(codigo, 0)
+        self.assertEqual(preparacion["datos_ingredientes"][0]["cantidad"], 4.0)
+        self.assertEqual(preparacion["costo"], 16000.0)
+        self.assertEqual(self.ejecutar("preparar", str(self.id_ajiaco), "0")[0], 2)
+
+    def test_catalogo(self):
+        codigo, salida, _ = self.ejecutar("catalogo", "--json")
+        resultado = json.loads(salida)
+        self.assertEqual(codigo, 0)
+        self.assertEqual((resultado["recetas"], resultado["ingredientes"], resultado["ingredientes_receta"]), (2, 1, 1))
+
+    def test_exportar_reenvia_argumentos(self):
+        with TemporaryDirectory() as directorio:
+            codigo, salida, _ = self.ejecutar("exportar", directorio, "--formato", "csv")
+            self.assertEqual(codigo, 0)
+            self.assertTrue(os.path.exists(os.path.join(directorio, "recetas.csv")))
+        self.assertIn("recetas: 2 filas", salida)
+
+
+class ImportacionesConsolaTestCase(unittest.TestCase):
+
+    def modulos_cargados(self, codigo):
+        # En un proceso aparte, porque otras pruebas pueden haber importado ya estos módulos
+        codigo = "import sys\n{}\nprint(' '.join(sys.modules))".format(codigo)
+        proceso = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ_PROYECTO,
+                                 env=dict(os.environ, RECETARIO_DB=":memory:"),
+                                 stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+        return set(proceso.stdout.decode().split())
+
+    def test_comandos_no_importan_pyqt5(self):
+        modulos = self.modulos_cargados("from src.consola.ConsolaRecetario import main\nmain(['catalogo'])")
+        self.assertIn("src.logica.LogicaRecetario", modulos)
+        self.assertNotIn("PyQt5", modulos)
+
+    def test_analizar_argumentos_no_importa_sqlalchemy(self):
+        modulos = self.modulos_cargados("from src.consola.ConsolaRecetario import crear_parser\n"
+                                        "crear_parser().parse_args(['preparar', '1', '4'])")
+        self.assertNotIn("sqlalchemy", modulos)
+        self.assertNotIn("PyQt5", modulos)
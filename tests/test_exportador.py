@@ -0,0 +1,46 @@
+import os
+import tempfile
+
+from src.logica.ExportadorRecetario import ExportadorRecetario
+from src.logica.ImportadorRecetario import ImportadorRecetario
+from src.logica.LogicaRecetario import LogicaRecetario
+from src.modelo.Ingrediente import Ingrediente
+from src.modelo.IngredienteReceta import IngredienteReceta
+from src.modelo.Receta import Receta
+from tests.base_de_datos import PruebaConBaseDeDatos
+
+
+class ExportadorTestCase(PruebaConBaseDeDatos):
+
+    def setUp(self):
+        super().setUp()
+        self.logica = LogicaRecetario()
+        receta = Receta(nombre="Ajiaco", tiempoPreparacion=60, nroPersonasPreparacion=6, caloriasPorcion=200, instrucciones="Cocinar con guascas")
+        papa = Ingrediente(nombre="Papa criolla", unidadMedida="libra", valorUnidad=4090, nombreProveedor="Plaza Concordia")
+        guascas = Ingrediente(nombre="Guascas", unidadMedida="gramo", valorUnidad=20, nombreProveedor="Plaza Concordia")
+        self.session.add_all([receta, papa, guascas,
+                              IngredienteReceta(receta=receta, ingrediente=papa, cantidad=2, unidadMedida="libra"),
+                              IngredienteReceta(receta=receta, ingrediente=guascas, cantidad=15, unidadMedida="gramo")])
+        self.session.commit()
+
+    def borrar_todo(self):
+        for modelo in (IngredienteReceta, Receta, Ingrediente):
+            self.session.query(modelo).delete()
+        self.session.commit()
+
+    def test_ida_y_vuelta(self):
+        for formato in ("jsonl", "csv"):
+            with tempfile.TemporaryDirectory() as directorio:
+                resultados = ExportadorRecetario(tamano_lote=1).exportar(directorio, formato)
+                self.assertEqual(resultados['ingredientes_receta']['filas'], 2)
+
+                self.borrar_todo()
+                importados = ImportadorRecetario().importar_archivos(
+                    *(os.path.join(directorio, '{}.{}'.format(tipo, formato)) for tipo in ('recetas', 'ingredientes', 'ingredientes_receta')))
+                self.assertTrue(all(resultado['errores'] == [] for resultado in importados.values()))
+
+            recetas = self.logica.dar_recetas()
+            self.assertEqual([(r['nombre'], r['personas']) for r in recetas], [("Ajiaco", 6)])
+            self.assertEqual(self.logica.dar_receta(recetas[0]['id'])['preparacion'], "Cocinar con guascas")
+            ingredientes = self.logica.dar_ingredientes_receta(recetas[0]['id'])
+            self.assertEqual(sorted((i['ingrediente'], i['cantidad']) for i in ingredientes), [("Guascas", 15), ("Papa criolla", 2)])
@@ -0,0 +1,73 @@
+import os
+import tempfile
+
+from src.logica.ImportadorRecetario import ImportadorRecetario, leer_filas
+from src.logica.LogicaRecetario import LogicaRecetario
+from tests.base_de_datos import PruebaConBaseDeDatos
+
+
+class ImportadorTestCase(PruebaConBaseDeDatos):
+
+    def setUp(self):
+        super().setUp()
+        self.logica = LogicaRecetario()
+        self.importador = ImportadorRecetario(tamano_lote=2)
+
+    def test_importar_recetas_con_errores_por_fila(self):
+        resultado = self.importador.importar_recetas([
+            {'nombre': 'Ajiaco', 'tiempo': '60', 'personas': '6', 'calorias': '200', 'preparacion': '...'},
+            {'nombre': '', 'tiempo': '60', 'personas': '6', 'calorias': '200', 'preparacion': '...'},
+            {'nombre': 'Paella', 'tiempo': 'abc', 'personas': '6', 'calorias': '200', 'preparacion': '...'},
+            {'nombre': 'Ajiaco', 'tiempo': '30', 'personas': '2', 'calorias': '100', 'preparacion': '...'},
+            {'nombre': 'Sancocho', 'tiempo': 90, 'personas': 8, 'calorias': 350, 'preparacion': '...'},
+        ])
+        self.assertEqual(resultado['leidas'], 5)
+        self.assertEqual(resultado['insertadas'], 2)
+        self.assertEqual(resultado['errores'], [
+            {'fila': 2, 'error': "El nombre de la receta no puede estar vacío"},
+            {'fila': 3, 'error': "El tiempo debe ser númerico"},
+            {'fila': 4, 'error': "La receta ya existe"},
+        ])
+        self.assertEqual([receta['nombre'] for receta in self.logica.dar_recetas()], ['Ajiaco', 'Sancocho'])
+
+    def test_valores_fuera_de_rango_son_errores_de_fila(self):
+        resultado = self.importador.importar_recetas([
+            {'nombre': 'Ajiaco', 'tiempo': '1e400', 'personas': '6', 'calorias': '200', 'preparacion': '...'},
+            {'nombre': 'Paella', 'tiempo': float('nan'), 'personas': '6', 'calorias': '200', 'preparacion': '...'},
+            {'nombre': 'Sancocho', 'tiempo': '90', 'personas': '8', 'calorias': '350', 'preparacion': '...'},
+        ])
+        self.assertEqual(resultado['insertadas'], 1)
+        self.assertEqual([error['fila'] for error in resultado['errores']], [1, 2])
+
+    def test_lineas_jsonl_invalidas_son_errores_de_fila(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'ingredientes.jsonl')
+            with open(ruta, 'w', encoding='utf-8') as archivo:
+                archivo.write('{"nombre": "Papa", "unidad": "libra", "valor": 1000, "sitioCompra": "Plaza"}\n'
+                              '{"nombre": "Yuca", \n'
+                              '[]\n'
+                              '1\n'
+                              '{"nombre": "Arroz", "unidad": "libra", "valor": 3000, "sitioCompra": "Plaza"}\n')
+            resultado = self.importador.importar_ingredientes(leer_filas(ruta))
+        self.assertEqual(resultado['leidas'], 5)
+        self.assertEqual(resultado['insertadas'], 2)
+        self.assertEqual([error['fila'] for error in resultado['errores']], [2, 3, 4])
+
+    def test_importar_ingredientes_receta_por_nombre(self):
+        self.importador.importar_recetas([{'nombre': 'Ajiaco', 'tiempo': '60', 'personas': '6', 'calorias': '200', 'preparacion': '...'}])
+        self.importador.importar_ingredientes([
+            {'nombre': 'Papa criolla', 'unidad': 'libra', 'valor': '4090', 'sitioCompra': 'Plaza Concordia'},
+            {'nombre': 'Guascas', 'unidad': 'gramo', 'valor': '20', 'sitioCompra': 'Plaza Concordia'},
+        ])
+        resultado = self.importador.importar_ingredientes_receta([
+            {'receta': 'Ajiaco', 'ingrediente': 'Papa criolla', 'cantidad': '2'},
+            {'receta': 'AJIACO ', 'ingrediente': 'guascas', 'cantidad': '15', 'unidad': 'gramo'},
+            {'receta': 'Ajiaco', 'ingrediente': 'Papa criolla', 'cantidad': '3'},
+            {'receta': 'Tamal', 'ingrediente': 'Guascas', 'cantidad': '1'},
+        ])
+        self.assertEqual(resultado['insertadas'], 2)
+        self.assertEqual(sorted(error['fila'] for error in resultado['errores']), [3, 4])
+        id_receta = self.logica.dar_recetas()[0]['id']
+        ingredientes = self.logica.dar_ingredientes_receta(id_receta)
+        self.assertEqual(sorted((i['ingrediente'], i['unidad']) for i in ingredientes),
+                         [('Guascas', 'gramo'), ('Papa criolla', 'libra')])
@@ -1,44 +1,76 @@
-import unittest
-
-from faker import Faker
-
 from src.logica.LogicaRecetario import LogicaRecetario
-from src.modelo.Declarative_base import Session
 from src.modelo.Ingrediente import Ingrediente
+from src.modelo.Sentencias import assert_max_queries
+from tests.base_de_datos import PruebaConBaseDeDatos
 
-class IngredienteTestCase(unittest.TestCase):
+class IngredienteTestCase(PruebaConBaseDeDatos):
 
     def setUp(self):
-        self.session = Session()
+        super().setUp()
         self.recetario = LogicaRecetario()
-        self.data_factory = Faker("es_ES")
+        self.data_factory = self.faker
 
         nombre = self.data_factory.name()
         unidadMedida = self.data_factory.random_element(["kilo", "libra", "gramo", "onza", "cuacharada", "cucharadita", "arroba", "miligramo", "litro"])
         valorUnidad = self.data_factory.pydecimal(min_value=1, max_value=100000, positive=True)
         nombreProveedor = self.data_factory.name()
 
-        self.session = Session()
         self.ingrediente1 = Ingrediente(nombre=nombre, unidadMedida=unidadMedida, valorUnidad=valorUnidad, nombreProveedor=nombreProveedor)
         self.session.add(self.ingrediente1)
 
         self.session.commit()
 
-    def tearDown(self):
-        '''Abre la sesión'''
-        self.session = Session()
-
-        busquedaIngrediente = self.session.query(Ingrediente).all()
+    def test_listar_ingredientes(self):
+        recetas = self.recetario.dar_ingredientes()
+        self.assertEqual(len(recetas), 1)
 
-        '''Borra todos los ingrediente'''
-        for ingrediente in busquedaIngrediente:
-            self.session.delete(ingrediente)
+    def test_listar_ingredientes_una_consulta(self):
+        for numero in range(20):
+            self.session.add(Ingrediente(nombre="Especia {}".format(numero), unidadMedida="g", valorUnidad=1, nombreProveedor="Plaza"))
+        self.session.commit()
+        with assert_max_queries(1):
+            ingredientes = self.recetario.dar_ingredientes()
+        self.assertEqual(len(ingredientes), 21)
 
+    def test_buscar_ingredientes_por_prefijo_y_contenido(self):
+        for nombre in ["Papa criolla", "Papá pastusa", "Puré de papa", "Tomate"]:
+            self.session.add(Ingrediente(nombre=nombre, unidadMedida="libra", valorUnidad=1, nombreProveedor="Plaza"))
         self.session.commit()
-        self.session.close()
+        with assert_max_queries(2):
+            ingredientes = self.recetario.buscar_ingredientes("PAPA")
+        self.assertEqual([ingrediente["nombre"] for ingrediente in ingredientes], ["Papa criolla", "Papá pastusa", "Puré de papa"])
+        self.assertEqual(set(ingredientes[0]), {"id", "nombre", "unidad", "valor", "sitioCompra"})
+        self.assertEqual(len(self.recetario.buscar_ingredientes("papa", limite=1)), 1)
+        self.assertEqual(len(self.recetario.buscar_ingredientes("", limite=3)), 3)
 
+    def test_validar_ingredientes_lote_una_consulta(self):
+        with assert_max_queries(1):
+            self.recetario.validar_ingredientes_lote([
+                {"nombre": "Especia {}".format(numero), "unidad": "g", "valor": "1", "sitioCompra": "Plaza"} for numero in range(50)])
 
-    def test_listar_ingredientes(self):
-        recetas = self.recetario.dar_ingredientes()
-        self.assertEqual(len(recetas), 1)
+    def test_validar_ingrediente_existente(self):
+        error = self.recetario.validar_crear_editar_ingrediente(self.ingrediente1.nombre, "libra", "100", "Plaza")
+        self.assertEqual(error, "El ingrediente ya existe")
+
+    def test_validar_ingrediente_existente_con_otra_grafia(self):
+        nombre = " {} ".format(self.ingrediente1.nombre.upper())
+        error = self.recetario.validar_crear_editar_ingrediente(nombre, "libra", "100", "Plaza")
+        self.assertEqual(error, "El ingrediente ya existe")
+
+    def test_validar_ingrediente_editado_conserva_nombre(self):
+        error = self.recetario.validar_crear_editar_ingrediente(self.ingrediente1.nombre, "libra", "100", "Plaza", self.ingrediente1.id)
+        self.assertEqual(error, "")
+
+    def test_validar_ingredientes_lote(self):
+        errores = self.recetario.validar_ingredientes_lote([
+            {"nombre": "Sal", "unidad": "gramo", "valor": "2", "sitioCompra": "Plaza"},
+            {"nombre": "", "unidad": "gramo", "valor": "2", "sitioCompra": "Plaza"},
+            {"nombre": "Azúcar", "unidad": "gramo", "valor": "dos", "sitioCompra": "Plaza"},
+            {"nombre": "Sal", "unidad": "kilo", "valor": "5", "sitioCompra": "Plaza"},
+        ])
+        self.assertEqual(errores, [
+            {"fila": 2, "error": "El nombre del ingrediente no puede estar vacío"},
+            {"fila": 3, "error": "El valor por unidad debe ser númerico"},
+            {"fila": 4, "error": "El ingrediente ya existe"},
+        ])
 
@@ -0,0 +1,81 @@
+import unittest
+
+from src.logica.LogicaCache import LogicaCache
+from src.logica.LogicaMemoria import LogicaMemoria
+from src.logica.LogicaMock import LogicaMock
+
+
+class LogicaCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.mock = LogicaMock()
+        self.logica = LogicaCache(self.mock, tamano_maximo=3)
+
+    def test_sirve_desde_memoria(self):
+        self.logica.dar_recetas()
+        self.mock.recetas.append({'nombre': 'No visible', 'tiempo': "00:10", 'personas': 1, 'calorias': 1, 'preparacion': '...'})
+        self.assertEqual(len(self.logica.dar_recetas()), 2)
+        estadisticas = self.logica.dar_estadisticas_cache()
+        self.assertEqual(estadisticas['aciertos'], 1)
+        self.assertEqual(estadisticas['fallos'], 1)
+
+    def test_retorna_copias(self):
+        self.logica.dar_recetas()[0]['nombre'] = 'Modificada'
+        self.assertEqual(self.logica.dar_recetas()[0]['nombre'], 'Ajiaco')
+
+    def test_crear_invalida_solo_la_lista_afectada(self):
+        self.logica.dar_recetas()
+        self.logica.dar_ingredientes()
+        self.logica.crear_receta('Sancocho', "01:30", 8, 350, '...')
+        self.assertEqual(len(self.logica.dar_recetas()), 3)
+        self.logica.dar_ingredientes()
+        self.assertEqual(self.logica.dar_estadisticas_cache()['aciertos'], 1)
+
+    def test_editar_invalida_la_consulta_por_id(self):
+        self.logica.dar_receta(0)
+        self.logica.dar_receta(1)
+        self.logica.editar_receta(0, 'Ajiaco santafereño', "01:00", 6, 200, '...')
+        self.assertEqual(self.logica.dar_receta(0)['nombre'], 'Ajiaco santafereño')
+        self.logica.dar_receta(1)
+        self.assertEqual(self.logica.dar_estadisticas_cache()['aciertos'], 1)
+
+    def test_eliminar_invalida_posiciones(self):
+        self.logica.dar_ingrediente(1)
+        self.logica.eliminar_ingrediente(0)
+        self.assertEqual(self.logica.dar_ingrediente(1)['nombre'], 'Papa criolla')
+
+    def test_desalojo_lru(self):
+        for indice in range(3):
+            self.logica.dar_ingrediente(indice)
+        self.logica.dar_ingrediente(0)
+        self.logica.dar_ingrediente(3)
+        self.logica.dar_ingrediente(0)
+        self.logica.dar_ingrediente(1)
+        estadisticas = self.logica.dar_estadisticas_cache()
+        self.assertEqual(estadisticas['desalojos'], 2)
+        self.assertEqual(estadisticas['aciertos'], 2)
+        self.assertEqual(estadisticas['entradas'], 3)
+
+    def test_crear_invalida_las_consultas_por_id_sin_resultado(self):
+        logica = LogicaCache(LogicaMemoria())
+        self.assertIsNone(logica.dar_receta(1))
+        self.assertIsNone(logica.dar_ingrediente(1))
+        logica.crear_receta('Sancocho', "90", "8", "350", '...')
+        logica.crear_ingrediente('Yuca', 'libra', "2000", 'Plaza')
+        self.assertEqual(logica.dar_receta(1)['nombre'], 'Sancocho')
+        self.assertEqual(logica.dar_ingrediente(1)['nombre'], 'Yuca')
+
+    def test_no_guarda_una_lectura_invalidada_mientras_se_hacia(self):
+        dar_recetas = self.mock.dar_recetas
+
+        def dar_recetas_con_escritura(*argumentos):
+            # Simula una escritura de otro hilo entre la consulta y el guardado en la caché
+            resultado = dar_recetas(*argumentos)
+            self.mock.dar_recetas = dar_recetas
+            self.logica.crear_receta('Sancocho', "01:30", 8, 350, '...')
+            return resultado
+
+        self.mock.dar_recetas = dar_recetas_con_escritura
+        self.assertEqual(len(self.logica.dar_recetas()), 2)
+        self.assertEqual(len(self.logica.dar_recetas()), 3)
+        self.assertEqual(self.logica.dar_estadisticas_cache()['aciertos'], 0)
@@ -0,0 +1,55 @@
+import json
+import os
+import tempfile
+
+from src.logica.LogicaInstrumentada import LogicaInstrumentada
+from src.logica.LogicaMemoria import LogicaMemoria
+from src.logica.LogicaRecetario import LogicaRecetario
+from tests.base_de_datos import PruebaConBaseDeDatos
+
+
+class LogicaInstrumentadaTestCase(PruebaConBaseDeDatos):
+
+    def setUp(self):
+        super().setUp()
+        self.logica = LogicaInstrumentada(LogicaMemoria())
+        self.logica.crear_receta("Ajiaco", "60", "6", "200", "...")
+        self.logica.crear_receta("Paella", "90", "4", "300", "...")
+
+    def test_cuenta_llamadas_y_filas(self):
+        self.logica.dar_recetas()
+        self.logica.dar_recetas(limite=1)
+        self.logica.dar_receta(1)
+        estadisticas = self.logica.dar_estadisticas()
+        self.assertEqual(estadisticas['crear_receta']['llamadas'], 2)
+        self.assertEqual(estadisticas['dar_recetas']['llamadas'], 2)
+        self.assertEqual(estadisticas['dar_recetas']['filas'], 3)
+        self.assertEqual(estadisticas['dar_receta']['filas'], 1)
+        self.assertEqual(sum(estadisticas['dar_recetas']['histograma'].values()), 2)
+        self.assertEqual(estadisticas['dar_recetas']['sentencias'], 0)
+
+    def test_cuenta_errores(self):
+        with self.assertRaises(ValueError):
+            self.logica.dar_recetas(orden="calorias")
+        self.assertEqual(self.logica.dar_estadisticas()['dar_recetas']['errores'], 1)
+
+    def test_cuenta_sentencias_sql(self):
+        logica = LogicaInstrumentada(LogicaRecetario())
+        logica.dar_recetas()
+        logica.validar_recetas_lote([{"nombre": "Receta {}".format(numero), "tiempo": "1", "personas": "2",
+                                      "calorias": "3"} for numero in range(20)])
+        logica.crear_receta("Sancocho", 1, 5, 200, "...")
+        estadisticas = logica.dar_estadisticas()
+        self.assertEqual(estadisticas['dar_recetas']['sentencias'], 1)
+        self.assertEqual(estadisticas['validar_recetas_lote']['sentencias'], 1)
+        self.assertEqual(estadisticas['crear_receta']['sentencias'], 2)
+
+    def test_volcado_de_estadisticas(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'estadisticas.json')
+            self.logica.iniciar_volcado(ruta, intervalo=3600)
+            self.logica.dar_recetas()
+            self.logica.detener_volcado()
+            with open(ruta, encoding='utf-8') as archivo:
+                volcado = json.load(archivo)
+        self.assertEqual(volcado['metodos']['dar_recetas']['llamadas'], 1)
@@ -0,0 +1,125 @@
+import unittest
+
+from src.logica.LogicaMemoria import LogicaMemoria
+
+
+class LogicaMemoriaTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.logica = LogicaMemoria()
+        self.logica.crear_receta("Ajiaco", "60", "6", "200", "Poner en una olla el agua, la papa criolla y las guascas")
+        self.logica.crear_receta("Berenjenas parmesanas", "30", "4", "100", "Cortar las berenjenas y hornear con salsa")
+        self.logica.crear_ingrediente("Papa criolla", "libra", "4090", "Plaza Concordia")
+        self.logica.crear_ingrediente("Guascas", "gramo", "20", "Plaza Concordia")
+        self.logica.crear_ingrediente("Berenjenas", "libra", "3800", "Plaza Concordia")
+        self.logica.agregar_ingrediente_receta(1, 1, "2")
+        self.logica.agregar_ingrediente_receta(1, 2, "15")
+        self.logica.agregar_ingrediente_receta(2, 3, "2")
+
+    def test_dar_recetas(self):
+        recetas = self.logica.dar_recetas()
+        self.assertEqual([receta['nombre'] for receta in recetas], ["Ajiaco", "Berenjenas parmesanas"])
+        self.assertEqual(recetas[0], {"id": 1, "nombre": "Ajiaco", "tiempo": 60, "personas": 6, "calorias": 200.0})
+
+    def test_dar_recetas_paginado(self):
+        self.logica.crear_receta("Arroz con pollo", "45", "5", "300", "...")
+        self.assertEqual([receta['id'] for receta in self.logica.dar_recetas(desde_id=1, limite=1)], [2])
+        por_nombre = self.logica.dar_recetas(desde_id=1, limite=2, orden="nombre")
+        self.assertEqual([receta['nombre'] for receta in por_nombre], ["Arroz con pollo", "Berenjenas parmesanas"])
+        with self.assertRaises(ValueError):
+            self.logica.dar_recetas(orden="calorias")
+
+    def test_validar_receta_existente_sin_tildes_ni_mayusculas(self):
+        self.assertEqual(self.logica.validar_crear_editar_receta(None, " AJÍACO", "1", "2", "3", "..."), "La receta ya existe")
+        self.assertEqual(self.logica.validar_crear_editar_receta(1, "Ajiaco", "1", "2", "3", "..."), "")
+        self.assertFalse(self.logica.crear_receta("ajiaco", "1", "2", "3", "..."))
+
+    def test_validar_ingredientes_lote(self):
+        errores = self.logica.validar_ingredientes_lote([
+            {"nombre": "Sal", "unidad": "gramo", "valor": "2", "sitioCompra": "Plaza"},
+            {"nombre": "guascas", "unidad": "gramo", "valor": "2", "sitioCompra": "Plaza"},
+            {"nombre": "Sal", "unidad": "kilo", "valor": "5", "sitioCompra": "Plaza"},
+        ])
+        self.assertEqual(errores, [{"fila": 2, "error": "El ingrediente ya existe"},
+                                   {"fila": 3, "error": "El ingrediente ya existe"}])
+
+    def test_editar_receta_actualiza_nombre_y_busqueda(self):
+        self.assertTrue(self.logica.editar_receta(2, "Lasaña de berenjena", "50", "4", "150", "Hornear por capas"))
+        self.assertEqual(self.logica.dar_receta(2)['nombre'], "Lasaña de berenjena")
+        self.assertEqual(self.logica.buscar_recetas("cortar"), [])
+        self.assertEqual([receta['id'] for receta in self.logica.buscar_recetas("lasana")], [2])
+        self.assertFalse(self.logica.editar_receta(2, "Ajiaco", "50", "4", "150", "..."))
+
+    def test_buscar_recetas_por_prefijo_y_relevancia(self):
+        self.logica.crear_receta("Sopa", "20", "2", "80", "Sopa con berenjenas asadas")
+        resultado = self.logica.buscar_recetas("BERENJ")
+        self.assertEqual([receta['nombre'] for receta in resultado], ["Berenjenas parmesanas", "Sopa"])
+        self.assertIn("berenjenas", resultado[0]['fragmento'])
+        self.assertEqual(self.logica.buscar_recetas("berenjenas guascas"), [])
+
+    def test_dar_ingredientes_receta(self):
+        self.assertEqual(self.logica.dar_ingredientes_receta(1), [
+            {"ingrediente": "Papa criolla", "unidad": "libra", "cantidad": 2.0},
+            {"ingrediente": "Guascas", "unidad": "gramo", "cantidad": 15.0},
+        ])
+        self.assertFalse(self.logica.agregar_ingrediente_receta(1, 1, "3"))
+        self.assertFalse(self.logica.agregar_ingrediente_receta(1, 99, "3"))
+
+    def test_editar_y_eliminar_ingrediente_receta(self):
+        self.assertTrue(self.logica.editar_ingrediente_receta(2, 1, 3, "1"))
+        self.assertEqual(self.logica.recetas_por_ingrediente[2], set())
+        self.assertEqual(self.logica.recetas_por_ingrediente[3], {1, 2})
+        self.assertTrue(self.logica.eliminar_ingrediente_receta(1, 1))
+        self.assertEqual(self.logica.dar_ingredientes_receta(1), [{"ingrediente": "Berenjenas", "unidad": "libra", "cantidad": 1.0}])
+
+    def test_eliminar_ingrediente_lo_retira_de_las_recetas(self):
+        self.assertTrue(self.logica.eliminar_ingrediente(3))
+        self.assertEqual(self.logica.dar_ingredientes_receta(2), [])
+        self.assertIsNone(self.logica.dar_ingrediente(3))
+        self.assertEqual(self.logica.validar_crear_editar_ingrediente("Berenjenas", "libra", "1", "Plaza"), "")
+
+    def test_eliminar_receta_actualiza_indices(self):
+        self.assertTrue(self.logica.eliminar_receta(1))
+        self.assertIsNone(self.logica.dar_receta(1))
+        self.assertEqual(self.logica.recetas_por_ingrediente[1], set())
+        self.assertEqual(self.logica.buscar_recetas("guascas"), [])
+        self.assertEqual([receta['id'] for receta in self.logica.dar_recetas(orden="nombre")], [2])
+
+    def test_buscar_ingredientes_por_prefijo_y_contenido(self):
+        self.logica.crear_ingrediente("Puré de papa", "libra", "5000", "Plaza Concordia")
+        self.assertEqual([ingrediente["nombre"] for ingrediente in self.logica.buscar_ingredientes("PAPA")],
+                         ["Papa criolla", "Puré de papa"])
+        self.logica.editar_ingrediente(1, "Yuca", "libra", "4090", "Plaza Concordia")
+        self.assertEqual([ingrediente["id"] for ingrediente in self.logica.buscar_ingredientes("papa")], [4])
+        self.assertEqual([ingrediente["nombre"] for ingrediente in self.logica.buscar_ingredientes("", limite=2)],
+                         ["Berenjenas", "Guascas"])
+
+    def test_validar_crear_editar_ingReceta(self):
+        self.assertEqual(self.logica.validar_crear_editar_ingReceta(1, 3, "2"), "")
+        self.assertEqual(self.logica.validar_crear_editar_ingReceta(9, 3, "2"), "La receta no existe")
+        self.assertEqual(self.logica.validar_crear_editar_ingReceta({"id": 1}, {"id": 9}, "2"), "El ingrediente no existe")
+        self.assertEqual(self.logica.validar_crear_editar_ingReceta(1, 3, "dos"), "La cantidad debe ser númerica")
+
+    def test_dar_preparacion_escala_cantidades(self):
+        preparacion = self.logica.dar_preparacion(1, 12)
+        self.assertEqual(preparacion['receta'], "Ajiaco")
+        self.assertEqual([(datos['nombre'], datos['cantidad']) for datos in preparacion['datos_ingredientes']],
+                         [("Guascas", 30.0), ("Papa criolla", 4.0)])
+        self.assertAlmostEqual(preparacion['costo'], 30 * 20 + 4 * 4090)
+        self.assertIsNone(self.logica.dar_preparacion(99, 4))
+        self.assertIsNone(self.logica.dar_preparacion(1, "cuatro"))
+        self.assertIsNone(self.logica.dar_preparacion(1, 0))
+        self.assertIsNone(self.logica.dar_preparacion(1, None))
+        self.assertIsNone(self.logica.dar_preparacion(1, "nan"))
+
+    def test_no_guarda_nombres_vacios_ni_datos_invalidos(self):
+        self.assertFalse(self.logica.crear_receta(None, "1", "2", "3", "..."))
+        self.assertFalse(self.logica.crear_receta("Sopa", "uno", "2", "3", "..."))
+        self.assertFalse(self.logica.editar_receta(1, None, "1", "2", "3", "..."))
+        self.assertFalse(self.logica.crear_ingrediente(None, "libra", "1", "Plaza"))
+        self.assertFalse(self.logica.crear_ingrediente("  ", "libra", "1", "Plaza"))
+        self.assertFalse(self.logica.editar_ingrediente(1, None, "libra", "1", "Plaza"))
+        self.assertEqual(self.logica.dar_receta(1)['nombre'], "Ajiaco")
+        self.assertEqual(self.logica.dar_ingrediente(1)['nombre'], "Papa criolla")
+        self.assertEqual(len(self.logica.dar_recetas()), 2)
+        self.assertEqual(len(self.logica.dar_ingredientes()), 3)
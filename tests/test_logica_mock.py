@@ -15,3 +15,28 @@ class LogicaMockTestCase(unittest.TestCase):
         self.assertEqual(receta["nombre"], "Ajiaco")
 
 
+
+    def test_buscar_recetas(self):
+        recetas = self.logica.buscar_recetas("GUASCAS")
+        self.assertEqual([receta["nombre"] for receta in recetas], ["Ajiaco"])
+
+    def test_dar_ingredientes_paginado_por_nombre(self):
+        primera = self.logica.dar_ingredientes(limite=2, orden="nombre")
+        self.assertEqual([ingrediente["nombre"] for ingrediente in primera], ["Aguacate", "Berenjenas"])
+        segunda = self.logica.dar_ingredientes(desde_id=5, limite=1, orden="nombre")
+        self.assertEqual(segunda[0]["nombre"], "Cebolla larga")
+
+    def test_dar_recetas_incluye_la_posicion_como_id(self):
+        recetas = self.logica.dar_recetas(desde_id=0)
+        self.assertEqual([(receta["id"], receta["nombre"]) for receta in recetas], [(1, "Berenjenas parmesanas")])
+        self.assertNotIn("id", self.logica.recetas[1])
+
+    def test_dar_recetas_no_incluye_la_preparacion(self):
+        recetas = self.logica.dar_recetas()
+        self.assertEqual(set(recetas[0]), {"id", "nombre", "tiempo", "personas", "calorias"})
+        self.assertIn("preparacion", self.logica.dar_receta(0))
+
+    def test_buscar_ingredientes(self):
+        ingredientes = self.logica.buscar_ingredientes("a", limite=3)
+        self.assertEqual([ingrediente["nombre"] for ingrediente in ingredientes], ["Aguacate", "Berenjenas", "Cebolla larga"])
+        self.assertEqual(self.logica.buscar_ingredientes("PAPA PASTUSA")[0]["id"], 3)
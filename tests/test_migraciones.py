@@ -0,0 +1,78 @@
+import unittest
+
+from src.modelo.Declarative_base import crear_engine
+from src.modelo.Migraciones import ULTIMA_VERSION, _v1_esquema_inicial, dar_version, migrar
+
+
+class MigracionesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        '''Crea una base de datos vacía en memoria'''
+        self.engine = crear_engine(':memory:')
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def dar_indices(self):
+        return {fila[0] for fila in self.engine.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+    def test_base_vacia_sin_version(self):
+        self.assertEqual(dar_version(self.engine), 0)
+
+    def test_migrar_base_vacia(self):
+        self.assertEqual(migrar(self.engine), ULTIMA_VERSION)
+        self.assertEqual(dar_version(self.engine), ULTIMA_VERSION)
+        tablas = {fila[0] for fila in self.engine.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        self.assertTrue({"Receta", "Ingrediente", "IngredienteReceta", "schema_version"} <= tablas)
+        self.assertIn("ix_Receta_nombre", self.dar_indices())
+
+    def test_migrar_base_existente_sin_version(self):
+        '''Una base creada antes de las migraciones conserva sus datos y recibe los índices'''
+        self.engine.execute('CREATE TABLE "Receta" (id INTEGER NOT NULL, nombre VARCHAR, "tiempoPreparacion" INTEGER, '
+                            '"nroPersonasPreparacion" INTEGER, "caloriasPorcion" FLOAT, instrucciones VARCHAR, PRIMARY KEY (id))')
+        self.engine.execute("INSERT INTO \"Receta\" (nombre) VALUES ('Ajiaco')")
+        migrar(self.engine)
+        self.assertEqual(self.engine.execute('SELECT nombre FROM "Receta"').scalar(), "Ajiaco")
+        self.assertIn("ix_Receta_nombre", self.dar_indices())
+
+    def test_migrar_calcula_nombres_normalizados(self):
+        '''Los nombres antiguos que comparten llave conservan sus datos y la llave repetida recibe el sufijo #id'''
+        self.engine.execute('CREATE TABLE "Ingrediente" (id INTEGER NOT NULL, nombre VARCHAR, "unidadMedida" VARCHAR, '
+                            '"valorUnidad" FLOAT, "nombreProveedor" VARCHAR, PRIMARY KEY (id))')
+        self.engine.execute("INSERT INTO \"Ingrediente\" (id, nombre) VALUES (1, 'Azúcar'), (2, 'azucar  '), (3, 'Sal')")
+        migrar(self.engine)
+        llaves = self.engine.execute('SELECT "nombreNormalizado" FROM "Ingrediente" ORDER BY id').fetchall()
+        self.assertEqual([fila[0] for fila in llaves], ["azucar", "azucar#2", "sal"])
+        self.assertIn("ix_Ingrediente_nombreNormalizado", self.dar_indices())
+
+    def test_migrar_conserva_los_nombres_nulos_sin_llave(self):
+        '''Los nombres NULL no reciben una llave inventada con sufijo y pueden repetirse'''
+        self.engine.execute('CREATE TABLE "Ingrediente" (id INTEGER NOT NULL, nombre VARCHAR, "unidadMedida" VARCHAR, '
+                            '"valorUnidad" FLOAT, "nombreProveedor" VARCHAR, PRIMARY KEY (id))')
+        self.engine.execute("INSERT INTO \"Ingrediente\" (id, nombre) VALUES (1, NULL), (2, 'Sal'), (3, NULL)")
+        migrar(self.engine)
+        filas = self.engine.execute('SELECT nombre, "nombreNormalizado" FROM "Ingrediente" ORDER BY id').fetchall()
+        self.assertEqual([tuple(fila) for fila in filas], [(None, None), ("Sal", "sal"), (None, None)])
+
+    def test_migrar_base_v1_con_nombres_repetidos(self):
+        '''El esquema v1 permitía nombres repetidos: la migración los conserva con el sufijo #id'''
+        conexion = self.engine.raw_connection()
+        try:
+            _v1_esquema_inicial(conexion.cursor())
+            conexion.commit()
+        finally:
+            conexion.close()
+        self.engine.execute("INSERT INTO \"Receta\" (id, nombre) VALUES (1, 'Ajiaco'), (2, 'Ajiaco'), (3, 'Sopa')")
+        self.engine.execute("INSERT INTO \"Ingrediente\" (id, nombre) VALUES (1, 'Sal'), (2, 'Sal'), (3, 'Sal')")
+        self.assertEqual(migrar(self.engine), ULTIMA_VERSION)
+        recetas = self.engine.execute('SELECT nombre, "nombreNormalizado" FROM "Receta" ORDER BY id').fetchall()
+        self.assertEqual([tuple(fila) for fila in recetas],
+                         [("Ajiaco", "ajiaco"), ("Ajiaco#2", "ajiaco#2"), ("Sopa", "sopa")])
+        ingredientes = self.engine.execute('SELECT nombre FROM "Ingrediente" ORDER BY id').fetchall()
+        self.assertEqual([fila[0] for fila in ingredientes], ["Sal", "Sal#2", "Sal#3"])
+
+    def test_migrar_es_idempotente(self):
+        migrar(self.engine)
+        migrar(self.engine)
+        versiones = self.engine.execute("SELECT COUNT(*) FROM schema_version").scalar()
+        self.assertEqual(versiones, ULTIMA_VERSION)
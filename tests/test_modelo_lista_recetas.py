@@ -0,0 +1,56 @@
+import importlib.util
+import unittest
+
+from src.logica.LogicaMemoria import LogicaMemoria
+
+
+@unittest.skipIf(importlib.util.find_spec('PyQt5') is None, 'PyQt5 no está instalado')
+class ModeloListaRecetasTestCase(unittest.TestCase):
+
+    def setUp(self):
+        from PyQt5.QtCore import Qt
+        from src.vista.ModeloListaRecetas import ModeloListaRecetas, ProxyListaRecetas
+        self.Qt = Qt
+        self.logica = LogicaMemoria()
+        for numero in range(250):
+            self.logica.crear_receta("Receta {:03d}".format(numero), str(numero % 7 + 1), "2", "100", "...")
+        self.modelo = ModeloListaRecetas(self.logica, tamano_pagina=100)
+        self.proxy = ProxyListaRecetas()
+        self.proxy.setSourceModel(self.modelo)
+
+    def test_carga_por_paginas(self):
+        self.assertEqual(self.modelo.rowCount(), 0)
+        self.assertTrue(self.modelo.canFetchMore())
+        self.modelo.fetchMore()
+        self.assertEqual(self.modelo.rowCount(), 100)
+        self.modelo.fetchMore()
+        self.modelo.fetchMore()
+        self.assertEqual(self.modelo.rowCount(), 250)
+        self.assertFalse(self.modelo.canFetchMore())
+        self.assertEqual(self.modelo.dar_receta(249)['nombre'], "Receta 249")
+
+    def test_reiniciar_vuelve_a_la_primera_pagina(self):
+        self.modelo.fetchMore()
+        self.logica.eliminar_receta(1)
+        self.modelo.reiniciar()
+        self.assertEqual(self.modelo.rowCount(), 0)
+        self.modelo.fetchMore()
+        self.assertEqual(self.modelo.dar_receta(0)['nombre'], "Receta 001")
+
+    def test_datos_y_encabezados(self):
+        self.modelo.fetchMore()
+        indice = self.modelo.index(3, 1)
+        self.assertEqual(indice.data(), "4")
+        self.assertEqual(indice.data(self.Qt.UserRole), 4)
+        self.assertIsNone(self.modelo.index(3, 4).data())
+        self.assertEqual(self.modelo.headerData(0, self.Qt.Horizontal), "Nombre")
+
+    def test_proxy_filtra_y_ordena_las_filas_cargadas(self):
+        self.modelo.fetchMore()
+        self.proxy.setFilterFixedString("RECETA 04")
+        self.assertEqual(self.proxy.rowCount(), 10)
+        self.proxy.setFilterFixedString("")
+        self.proxy.sort(1, self.Qt.DescendingOrder)
+        self.assertEqual(self.proxy.index(0, 1).data(self.Qt.UserRole), 7)
+        self.proxy.sort(4)
+        self.assertEqual(self.proxy.index(0, 0).data(), "Receta 000")
@@ -1,24 +1,19 @@
-import unittest
-
 from src.logica.LogicaRecetario import LogicaRecetario
 from src.modelo.Receta import Receta
 from src.modelo.Ingrediente import Ingrediente
 from src.modelo.IngredienteReceta import IngredienteReceta
-from src.modelo.Declarative_base import Session
-from faker import Faker
+from src.modelo.Sentencias import assert_max_queries
+from tests.base_de_datos import PruebaConBaseDeDatos
 
-class RecetaTestCase(unittest.TestCase):
+class RecetaTestCase(PruebaConBaseDeDatos):
 
     def setUp(self):
+        '''Abre la transacción de la prueba y su sesión'''
+        super().setUp()
+
         '''Crea una colección para hacer las pruebas'''
         self.logica = LogicaRecetario()
 
-        '''Inicializa Faker'''
-        self.faker = Faker()
-
-        '''Abre la sesión'''
-        self.session = Session()
-
         '''Crear los objetos'''
         self.receta1 = Receta(nombre = 'Arroz con pollo', tiempoPreparacion = 1, nroPersonasPreparacion = 5, caloriasPorcion = 200, instrucciones = 'Preparación...')
         self.receta2 = Receta(nombre = 'Ajiaco', tiempoPreparacion = 1, nroPersonasPreparacion = 10, caloriasPorcion = 400, instrucciones = 'Preparación...')
@@ -43,33 +38,9 @@ class RecetaTestCase(unittest.TestCase):
         self.session.add(self.rel2) 
         self.session.add(self.rel3)
 
-        '''Persiste los objetos y cierra la sesión'''
+        '''Persiste los objetos'''
         self.session.commit()
 
-    def tearDown(self):
-        '''Abre la sesión'''
-        self.session = Session()
-
-        '''Consulta todos las recetas, ingrediente, Ingrediente - receta'''
-        busquedaReceta = self.session.query(Receta).all()
-        busquedaIngrediente = self.session.query(Ingrediente).all()
-        busquedaIngredienteReceta = self.session.query(IngredienteReceta).all()
-
-        '''Borra todos las recetas'''
-        for receta in busquedaReceta:
-            self.session.delete(receta)
-
-        '''Borra todos los ingrediente'''
-        for ingrediente in busquedaIngrediente:
-            self.session.delete(ingrediente)
-
-        '''Borra todos los ingrediente Receta'''
-        for ingredienteReceta in busquedaIngredienteReceta:
-            self.session.delete(ingredienteReceta)
-
-        self.session.commit()
-        self.session.close()
-
     # Pruebas Unitarias: HU001 Agregar Receta (Validaciones)
     def test_nombre_vacio(self):
         error = self.logica.validar_crear_editar_receta(
@@ -122,6 +93,11 @@ class RecetaTestCase(unittest.TestCase):
         )
         self.assertEqual(error, "La receta ya existe")
     
+    def test_receta_existente_sin_tildes_ni_mayusculas(self):
+        for nombre in ("ajiaco", "  AJÍACO ", "Arroz   con POLLO"):
+            error = self.logica.validar_crear_editar_receta("-1", nombre, "2", "4", "300", "Preparar...")
+            self.assertEqual(error, "La receta ya existe")
+
     def test_editar_cambiando_a_nombre_existente(self):
         error = self.logica.validar_crear_editar_receta(
             str(self.receta1.id), 
@@ -138,6 +114,40 @@ class RecetaTestCase(unittest.TestCase):
         )
         self.assertEqual(error, "")
     
+    def test_validar_recetas_lote(self):
+        errores = self.logica.validar_recetas_lote([
+            {"id": None, "nombre": "Sancocho", "tiempo": "2", "personas": "8", "calorias": "350", "preparacion": "..."},
+            {"id": None, "nombre": "Ajiaco", "tiempo": "1", "personas": "6", "calorias": "200", "preparacion": "..."},
+            {"id": None, "nombre": "Tamal", "tiempo": "1e", "personas": "6", "calorias": "200", "preparacion": "..."},
+            {"id": None, "nombre": " Sancocho ", "tiempo": "2", "personas": "8", "calorias": "350", "preparacion": "..."},
+            {"id": str(self.receta3.id), "nombre": "Paella", "tiempo": "2", "personas": "15", "calorias": "300", "preparacion": "..."},
+            {"id": None, "nombre": "Lechona", "tiempo": 5, "personas": 40, "calorias": 800.5, "preparacion": "..."},
+        ])
+        self.assertEqual(errores, [
+            {"fila": 2, "error": "La receta ya existe"},
+            {"fila": 3, "error": "El tiempo debe ser númerico"},
+            {"fila": 4, "error": "La receta ya existe"},
+        ])
+
+    def test_validar_recetas_lote_con_ids_no_numericos(self):
+        errores = self.logica.validar_recetas_lote([
+            {"id": "abc", "nombre": "Bandeja paisa", "tiempo": "2", "personas": "4", "calorias": "900", "preparacion": "..."},
+            {"id": "abc", "nombre": "Paella", "tiempo": "2", "personas": "15", "calorias": "300", "preparacion": "..."},
+            {"id": " {} ".format(self.receta2.id), "nombre": "Ajiaco", "tiempo": "1", "personas": "10", "calorias": "400", "preparacion": "..."},
+        ])
+        self.assertEqual(errores, [{"fila": 2, "error": "La receta ya existe"}])
+
+    def test_validar_recetas_lote_rechaza_nan_e_infinito(self):
+        errores = self.logica.validar_recetas_lote([
+            {"id": None, "nombre": "Receta {}".format(valor), "tiempo": valor, "personas": "4", "calorias": "200", "preparacion": "..."}
+            for valor in ("nan", "inf", "-Infinity", "1e3")])
+        self.assertEqual(errores, [{"fila": fila, "error": "El tiempo debe ser númerico"} for fila in (1, 2, 3)])
+
+    def test_validar_recetas_lote_una_consulta(self):
+        with assert_max_queries(1):
+            self.logica.validar_recetas_lote([
+                {"nombre": "Receta {}".format(numero), "tiempo": "1", "personas": "2", "calorias": "3"} for numero in range(50)])
+
     # Pruebas Unitarias: HU001 Agregar Receta
     def test_agregar_receta(self):
         resultado = self.logica.crear_receta(
@@ -153,6 +163,13 @@ class RecetaTestCase(unittest.TestCase):
         )
         self.assertEqual(resultado, False)
 
+    def test_agregar_receta_existente_con_otra_grafia(self):
+        resultado = self.logica.crear_receta("AJÍACO ", 1, 5, 200, "Preparar...")
+        self.assertEqual(resultado, False)
+
+    def test_receta_guarda_nombre_normalizado(self):
+        self.assertEqual(self.receta1.nombreNormalizado, "arroz con pollo")
+
     # Pruebas Unitarias HU002 Listar Receta
     def test_listar_recetas(self):
         recetas = self.logica.dar_recetas()
@@ -161,6 +178,32 @@ class RecetaTestCase(unittest.TestCase):
         self.assertEqual(recetas[1]['nombre'], "Ajiaco")
         self.assertEqual(recetas[2]['nombre'], "Paella")
 
+    def test_listar_recetas_sin_preparacion(self):
+        recetas = self.logica.dar_recetas()
+        self.assertNotIn('preparacion', recetas[0])
+
+    def test_listar_recetas_paginado_por_id(self):
+        primera = self.logica.dar_recetas(limite=2)
+        segunda = self.logica.dar_recetas(desde_id=primera[-1]['id'], limite=2)
+        self.assertEqual([receta['nombre'] for receta in primera], ["Arroz con pollo", "Ajiaco"])
+        self.assertEqual([receta['nombre'] for receta in segunda], ["Paella"])
+
+    def test_listar_recetas_paginado_por_nombre(self):
+        primera = self.logica.dar_recetas(limite=1, orden="nombre")
+        segunda = self.logica.dar_recetas(desde_id=primera[-1]['id'], limite=5, orden="nombre")
+        self.assertEqual([receta['nombre'] for receta in primera], ["Ajiaco"])
+        self.assertEqual([receta['nombre'] for receta in segunda], ["Arroz con pollo", "Paella"])
+
+    def test_listar_recetas_orden_invalido(self):
+        with self.assertRaises(ValueError):
+            self.logica.dar_recetas(orden="calorias")
+
+    def test_dar_receta(self):
+        receta = self.logica.dar_receta(self.receta2.id)
+        self.assertEqual(receta['nombre'], "Ajiaco")
+        self.assertEqual(receta['preparacion'], "Preparación...")
+        self.assertIsNone(self.logica.dar_receta(9999))
+
     # Pruebas Unitarias HU010 Listar Ingredientes de una Receta
     def test_dar_ingredientes_receta_lista(self):
         logica = LogicaRecetario()
@@ -172,6 +215,31 @@ class RecetaTestCase(unittest.TestCase):
             assert "unidad" in ingrediente
             assert "cantidad" in ingrediente
 
+    def test_dar_ingredientes_receta_consultas_constantes(self):
+        id_receta = self.receta1.id
+        for numero in range(20):
+            ingrediente = Ingrediente(nombre="Especia {}".format(numero), unidadMedida="g", valorUnidad=1, nombreProveedor="Molinos SA")
+            self.session.add(IngredienteReceta(receta = self.receta1, ingrediente = ingrediente, cantidad = 1, unidadMedida = "g"))
+        self.session.commit()
+        with assert_max_queries(1):
+            ingredientes = self.logica.dar_ingredientes_receta(id_receta)
+        self.assertEqual(len(ingredientes), 21)
+
+    def test_listar_y_preparar_recetas_sin_n_mas_1(self):
+        # Con varios ingredientes por receta, una carga perezosa por fila repetiría la misma forma
+        for numero in range(5):
+            ingrediente = Ingrediente(nombre="Especia {}".format(numero), unidadMedida="g", valorUnidad=1, nombreProveedor="Molinos SA")
+            self.session.add(IngredienteReceta(receta = self.receta1, ingrediente = ingrediente, cantidad = 1, unidadMedida = "g"))
+        self.session.commit()
+        with assert_max_queries(1, umbral_n_mas_1=3) as registro:
+            recetas = self.logica.dar_recetas()
+        self.assertEqual(registro.cantidad, 1)
+        self.assertEqual(len(recetas), 3)
+        for id_receta in [self.receta1.id, self.receta2.id, self.receta3.id]:
+            with assert_max_queries(1, umbral_n_mas_1=3) as registro:
+                self.logica.dar_preparacion(id_receta, 4)
+            self.assertEqual(registro.cantidad, 1)
+
         # Pruebas Unitarias HU010 Gestionar Ingrediente Receta:  Agregar Ingrediente a Receta
     def test_agregar_ingrediente_receta(self):
         nombre_receta = self.faker.word()
@@ -191,4 +259,37 @@ class RecetaTestCase(unittest.TestCase):
         # Verifica que el ingrediente fue agregado correctamente
         ingredientes = self.logica.dar_ingredientes_receta(receta.id)
         nombres = [i["ingrediente"] for i in ingredientes]
-        self.assertIn(nombre_ingrediente, nombres)
\ No newline at end of file
+        self.assertIn(nombre_ingrediente, nombres)
+
+    # Pruebas Unitarias: Preparar receta para una cantidad de personas
+    def test_dar_preparacion_escala_cantidades(self):
+        self.session.add(IngredienteReceta(receta = self.receta1, ingrediente = self.ingrediente2, cantidad = 5, unidadMedida = "unidad"))
+        self.session.commit()
+        preparacion = self.logica.dar_preparacion(self.receta1.id, 10)
+        self.assertEqual(preparacion["receta"], "Arroz con pollo")
+        self.assertEqual(preparacion["personas"], 10)
+        self.assertEqual(preparacion["calorias"], 200)
+        self.assertEqual(preparacion["tiempo_preparacion"], 1)
+        ingredientes = {ingrediente["nombre"]: ingrediente for ingrediente in preparacion["datos_ingredientes"]}
+        self.assertEqual(ingredientes["Harina"]["cantidad"], 6)
+        self.assertEqual(ingredientes["Harina"]["valor"], 6)
+        self.assertEqual(ingredientes["Huevo"]["cantidad"], 10)
+        self.assertEqual(ingredientes["Huevo"]["valor"], 20)
+        self.assertEqual(preparacion["costo"], 26)
+
+    def test_dar_preparacion_receta_sin_ingredientes(self):
+        receta = Receta(nombre = 'Agua de panela', tiempoPreparacion = 1, nroPersonasPreparacion = 2, caloriasPorcion = 90, instrucciones = 'Preparación...')
+        self.session.add(receta)
+        self.session.commit()
+        preparacion = self.logica.dar_preparacion(receta.id, 4)
+        self.assertEqual(preparacion["datos_ingredientes"], [])
+        self.assertEqual(preparacion["costo"], 0)
+
+    def test_dar_preparacion_receta_inexistente(self):
+        self.assertIsNone(self.logica.dar_preparacion(9999, 4))
+
+    def test_dar_preparacion_cantidad_personas_invalida(self):
+        for personas in ("abc", "", None, 0, "-2", "nan", "1e400", float("nan")):
+            self.assertIsNone(self.logica.dar_preparacion(self.receta1.id, personas), personas)
+        self.assertEqual(self.logica.dar_preparacion(self.receta1.id, "10")["receta"], "Arroz con pollo")
+
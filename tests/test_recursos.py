@@ -0,0 +1,35 @@
+import importlib.util
+import os
+import unittest
+
+
+@unittest.skipIf(importlib.util.find_spec('PyQt5') is None, 'PyQt5 no está instalado')
+class RecursosTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt5.QtWidgets import QApplication
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from src.vista import Recursos
+        self.Recursos = Recursos
+        Recursos.vaciar_cache()
+
+    def test_comparte_una_instancia_por_archivo(self):
+        icono = self.Recursos.dar_icono("004-edit-button.png")
+        self.assertFalse(icono.isNull())
+        self.assertIs(self.Recursos.dar_icono("004-edit-button.png"), icono)
+        self.assertEqual(self.Recursos.dar_icono.cache_info().misses, 1)
+
+    def test_imagen_escalada_conserva_la_proporcion(self):
+        logo = self.Recursos.dar_pixmap(self.Recursos.LOGO, 488, 158)
+        self.assertLessEqual(logo.width(), 488)
+        self.assertLessEqual(logo.height(), 158)
+        self.assertIs(self.Recursos.dar_pixmap(self.Recursos.LOGO, 488, 158), logo)
+
+    def test_las_rutas_no_dependen_del_directorio_de_trabajo(self):
+        for nombre in ("002-preparar.png", "004-edit-button.png", "005-delete.png", "006-add.png",
+                       "007-back-button.png", "010-ingredientes.png", "floppy-disk.png", self.Recursos.LOGO):
+            self.assertTrue(os.path.isfile(self.Recursos.ruta_recurso(nombre)), nombre)
@@ -0,0 +1,74 @@
+import importlib.util
+import os
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+from src.logica.LogicaMemoria import LogicaMemoria
+
+
+@unittest.skipIf(importlib.util.find_spec('PyQt5') is None, 'PyQt5 no está instalado')
+class SelectorIngredientesTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt5.QtWidgets import QApplication
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from src.vista.Trabajadores import Despachador
+        from src.vista.VistaCrearIngReceta import LIMITE_SUGERENCIAS, VistaCrearIngReceta
+        self.limite = LIMITE_SUGERENCIAS
+        self.VistaCrearIngReceta = VistaCrearIngReceta
+        logica = LogicaMemoria()
+        for numero in range(500):
+            logica.crear_ingrediente("Papa {:03d}".format(numero), "libra", "1000", "Plaza")
+        logica.crear_ingrediente("Ají dulce", "gramo", "20", "Fruver")
+        self.hilos = []
+        buscar_ingredientes = logica.buscar_ingredientes
+
+        def buscar_registrando(*argumentos):
+            self.hilos.append(threading.current_thread() is threading.main_thread())
+            return buscar_ingredientes(*argumentos)
+
+        logica.buscar_ingredientes = buscar_registrando
+        self.despachador = Despachador()
+        self.interfaz = SimpleNamespace(logica=logica, despachador=self.despachador)
+
+    def esperar(self):
+        # Deja pasar la pausa de la búsqueda diferida y entrega los resultados del despachador
+        limite = time.monotonic() + 0.5
+        while time.monotonic() < limite:
+            self.despachador.esperar(10)
+            self.app.processEvents()
+            time.sleep(0.005)
+
+    def test_sugiere_solo_las_primeras_coincidencias_fuera_del_hilo_de_la_interfaz(self):
+        dialogo = self.VistaCrearIngReceta(None, self.interfaz)
+        for texto in ("p", "pa", "papa"):
+            dialogo.texto_ingrediente.textEdited.emit(texto)
+        self.assertEqual(self.hilos, [])
+        self.esperar()
+        self.assertEqual(self.hilos, [False])
+        sugerencias = dialogo.modelo_sugerencias.stringList()
+        self.assertEqual(len(sugerencias), self.limite)
+        self.assertEqual(sugerencias[0], "Papa 000[libra]")
+
+    def test_resuelve_el_ingrediente_escrito(self):
+        dialogo = self.VistaCrearIngReceta(None, self.interfaz)
+        dialogo.texto_ingrediente.setText("aji dulce")
+        dialogo.guardar()
+        self.esperar()
+        self.assertEqual(dialogo.resultado, 1)
+        self.assertEqual(dialogo.ingrediente["nombre"], "Ají dulce")
+        self.assertEqual(dialogo.dar_ingrediente([{"nombre": "Papa 001"}, {"nombre": "Papa 002"}]), None)
+
+    def test_editar_preselecciona_el_ingrediente_de_la_receta(self):
+        dialogo = self.VistaCrearIngReceta({"ingrediente": "Papa 123", "unidad": "libra", "cantidad": 2}, self.interfaz)
+        self.assertEqual(dialogo.texto_ingrediente.text(), "Papa 123[libra]")
+        dialogo.guardar()
+        self.esperar()
+        self.assertEqual(dialogo.ingrediente["id"], 124)
+        self.assertEqual(self.hilos, [False])
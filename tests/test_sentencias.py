@@ -0,0 +1,60 @@
+import unittest
+
+from src.modelo.Declarative_base import Session, crear_engine
+from src.modelo.Migraciones import migrar
+from src.modelo.Receta import Receta
+from src.modelo.Sentencias import RegistroSentencias, activar_registro_lento, assert_max_queries, dar_forma
+
+
+class SentenciasTestCase(unittest.TestCase):
+
+    def setUp(self):
+        '''Crea una base de datos en memoria con tres recetas que tienen un ingrediente cada una'''
+        self.engine = crear_engine(':memory:')
+        migrar(self.engine)
+        for numero in range(1, 4):
+            self.engine.execute('INSERT INTO "Receta" (id, nombre, "nroPersonasPreparacion") VALUES (?, ?, 4)',
+                                (numero, 'Receta {}'.format(numero)))
+            self.engine.execute('INSERT INTO "Ingrediente" (id, nombre, "valorUnidad") VALUES (?, ?, 1)',
+                                (numero, 'Ingrediente {}'.format(numero)))
+            self.engine.execute('INSERT INTO "IngredienteReceta" ("idReceta", "idIngrediente", cantidad) VALUES (?, ?, 1)',
+                                (numero, numero))
+        self.session = Session(bind=self.engine)
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_forma_sin_literales(self):
+        self.assertEqual(dar_forma("SELECT * FROM Receta WHERE id = 12 AND nombre = 'Ajiaco'"),
+                         "SELECT * FROM Receta WHERE id = ? AND nombre = ?")
+        self.assertEqual(dar_forma("SELECT id FROM Receta WHERE nombre IN (?, ?,\n ?)"),
+                         "SELECT id FROM Receta WHERE nombre IN (?...)")
+
+    def test_detecta_carga_perezosa_n_mas_1(self):
+        with RegistroSentencias(self.engine) as registro:
+            for receta in self.session.query(Receta).all():
+                receta.ingredientes
+        self.assertEqual(registro.cantidad, 4)
+        self.assertEqual(registro.detectar_n_mas_1(umbral=3)[0][1], 3)
+
+    def test_assert_max_queries(self):
+        with assert_max_queries(1, self.engine):
+            self.engine.execute('SELECT COUNT(*) FROM "Receta"')
+        with self.assertRaises(AssertionError):
+            with assert_max_queries(1, self.engine):
+                self.engine.execute('SELECT COUNT(*) FROM "Receta"')
+                self.engine.execute('SELECT COUNT(*) FROM "Ingrediente"')
+        with self.assertRaises(AssertionError):
+            with assert_max_queries(10, self.engine, umbral_n_mas_1=3):
+                for numero in range(1, 4):
+                    self.engine.execute('SELECT nombre FROM "Receta" WHERE id = ?', (numero,))
+
+    def test_registro_lento_incluye_plan(self):
+        desactivar = activar_registro_lento(umbral_ms=0, engine=self.engine)
+        try:
+            with self.assertLogs('src.modelo.Sentencias', level='WARNING') as registros:
+                self.engine.execute('SELECT id FROM "Receta" WHERE "nombreNormalizado" = ?', ('receta 1',))
+        finally:
+            desactivar()
+        self.assertIn("ix_Receta_nombreNormalizado", registros.output[0])
@@ -0,0 +1,180 @@
+import importlib.util
+import os
+import threading
+import time
+import unittest
+
+
+@unittest.skipIf(importlib.util.find_spec('PyQt5') is None, 'PyQt5 no está instalado')
+class BusquedaDiferidaTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt5.QtWidgets import QApplication
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from src.vista.Trabajadores import BusquedaDiferida
+        self.pedidos = []
+        self.entregados = []
+        self.liberar = threading.Event()
+        self.liberar.set()
+        self.busqueda = BusquedaDiferida(self.buscar, espera_ms=20)
+        self.busqueda.resultados.connect(lambda texto, resultado: self.entregados.append(resultado))
+
+    def buscar(self, texto):
+        self.pedidos.append(texto)
+        self.liberar.wait(5)
+        return texto.upper()
+
+    def esperar(self, segundos=0.5):
+        limite = time.monotonic() + segundos
+        while time.monotonic() < limite:
+            self.app.processEvents()
+            time.sleep(0.005)
+
+    def test_agrupa_las_pulsaciones_seguidas(self):
+        for texto in ("s", "sa", "sal"):
+            self.busqueda.solicitar(texto)
+        self.esperar()
+        self.assertEqual(self.pedidos, ["sal"])
+        self.assertEqual(self.entregados, ["SAL"])
+
+    def test_descarta_respuestas_viejas(self):
+        self.liberar.clear()
+        self.busqueda.solicitar("a")
+        self.esperar(0.1)
+        self.busqueda.solicitar("azu")
+        self.esperar(0.1)
+        self.liberar.set()
+        self.esperar()
+        self.assertEqual(self.pedidos, ["a", "azu"])
+        self.assertEqual(self.entregados, ["AZU"])
+
+    def test_cancelar_descarta_la_busqueda_en_curso(self):
+        self.liberar.clear()
+        self.busqueda.solicitar("a")
+        self.esperar(0.1)
+        self.busqueda.cancelar()
+        self.liberar.set()
+        self.esperar()
+        self.assertEqual(self.entregados, [])
+
+
+@unittest.skipIf(importlib.util.find_spec('PyQt5') is None, 'PyQt5 no está instalado')
+class DespachadorTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt5.QtWidgets import QApplication
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from src.vista.Trabajadores import Despachador
+        self.despachador = Despachador()
+        self.estados = []
+        self.fallos = []
+        self.despachador.ocupado.connect(self.estados.append)
+        self.despachador.fallo.connect(lambda operacion, error: self.fallos.append(operacion))
+        self.llamadas = []
+        self.liberar = threading.Event()
+        self.liberar.set()
+
+    def dar_recetas(self, desde_id, limite):
+        self.llamadas.append((threading.current_thread() is threading.main_thread(), desde_id))
+        self.liberar.wait(5)
+        return list(range(limite))
+
+    def eliminar_receta(self, id_receta):
+        raise ValueError("No existe")
+
+    def entregar(self):
+        self.despachador.esperar()
+        self.app.processEvents()
+
+    def test_ejecuta_fuera_del_hilo_de_la_interfaz_y_entrega_el_resultado(self):
+        resultados = []
+        self.despachador.ejecutar(self.dar_recetas, None, 3, al_terminar=resultados.append)
+        self.entregar()
+        self.assertEqual(self.llamadas, [(False, None)])
+        self.assertEqual(resultados, [[0, 1, 2]])
+        self.assertEqual(self.estados, [True, False])
+
+    def test_agrupa_lecturas_identicas_en_curso(self):
+        self.liberar.clear()
+        resultados = []
+        for _ in range(3):
+            self.despachador.ejecutar(self.dar_recetas, None, 2, al_terminar=resultados.append, agrupar=True)
+        self.liberar.set()
+        self.entregar()
+        self.assertEqual(len(self.llamadas), 1)
+        self.assertEqual(resultados, [[0, 1]] * 3)
+
+    def test_no_agrupa_una_lectura_encolada_despues_de_una_escritura(self):
+        self.liberar.clear()
+        self.despachador.ejecutar(self.dar_recetas, None, 2, agrupar=True)
+        self.despachador.ejecutar(self.eliminar_receta, 1)
+        self.despachador.ejecutar(self.dar_recetas, None, 2, agrupar=True)
+        self.liberar.set()
+        self.entregar()
+        self.assertEqual(len(self.llamadas), 2)
+        self.assertEqual(self.fallos, ["eliminar_receta"])
+        self.assertEqual(self.estados, [True, False])
+
+    def test_al_fallar_recibe_la_excepcion(self):
+        errores = []
+        resultados = []
+        self.despachador.ejecutar(self.eliminar_receta, 1, al_terminar=resultados.append, al_fallar=errores.append)
+        self.entregar()
+        self.assertEqual(resultados, [])
+        self.assertEqual([str(error) for error in errores], ["No existe"])
+        self.assertEqual(self.fallos, ["eliminar_receta"])
+
+    def test_fallo_emite_la_descripcion_de_la_operacion(self):
+        from src.vista.InterfazRecetario import validar_y_escribir
+        self.despachador.ejecutar(validar_y_escribir, lambda nombre: "", ("Sal",), self.eliminar_receta, (1,),
+                                  descripcion="crear el ingrediente")
+        self.despachador.ejecutar(self.eliminar_receta, 1)
+        self.entregar()
+        self.assertEqual(self.fallos, ["crear el ingrediente", "eliminar_receta"])
+
+    def test_una_pagina_fallida_no_deja_el_modelo_cargando(self):
+        from src.vista.ModeloTabla import ModeloTablaPaginada
+        intentos = []
+
+        def dar_pagina(desde_id, limite):
+            intentos.append(desde_id)
+            if len(intentos) == 1:
+                raise ValueError("Base de datos ocupada")
+            return [{'id': numero} for numero in range(limite - 1)]
+
+        modelo = ModeloTablaPaginada([('id', 'Id')], dar_pagina, tamano_pagina=3, despachador=self.despachador)
+        modelo.fetchMore()
+        self.assertFalse(modelo.canFetchMore())
+        self.entregar()
+        self.assertTrue(modelo.canFetchMore())
+        modelo.fetchMore()
+        self.entregar()
+        self.assertEqual(len(intentos), 2)
+        self.assertEqual(modelo.rowCount(), 2)
+        self.assertFalse(modelo.canFetchMore())
+
+    def test_valida_y_escribe_en_el_hilo_del_despachador(self):
+        from src.vista.InterfazRecetario import validar_y_escribir
+        hilos = []
+        escrituras = []
+
+        def validar(nombre):
+            hilos.append(threading.current_thread() is threading.main_thread())
+            return "" if nombre else "El nombre no puede estar vacío"
+
+        resultados = []
+        for nombre in ("Sal", ""):
+            self.despachador.ejecutar(validar_y_escribir, validar, (nombre,), escrituras.append, (nombre,),
+                                      al_terminar=resultados.append)
+        self.entregar()
+        self.assertEqual(hilos, [False, False])
+        self.assertEqual(escrituras, ["Sal"])
+        self.assertEqual(resultados, ["", "El nombre no puede estar vacío"])
@@ -0,0 +1,49 @@
+import threading
+
+from src.logica.LogicaRecetario import LogicaRecetario
+from src.modelo.Declarative_base import unidad_de_trabajo
+from src.modelo.Receta import Receta
+from tests.base_de_datos import PruebaConBaseDeDatos
+
+
+class UnidadDeTrabajoTestCase(PruebaConBaseDeDatos):
+
+    def setUp(self):
+        super().setUp()
+        self.logica = LogicaRecetario()
+
+    def test_confirma_al_salir(self):
+        with unidad_de_trabajo() as sesion:
+            sesion.add(Receta(nombre="Bandeja paisa", tiempoPreparacion=2, nroPersonasPreparacion=4, caloriasPorcion=900, instrucciones="..."))
+        self.assertEqual(len(self.logica.dar_recetas()), 1)
+
+    def test_revierte_con_excepcion(self):
+        with self.assertRaises(ValueError):
+            with unidad_de_trabajo() as sesion:
+                sesion.add(Receta(nombre="Tamal", tiempoPreparacion=3, nroPersonasPreparacion=8, caloriasPorcion=700, instrucciones="..."))
+                sesion.flush()
+                raise ValueError("falla")
+        self.assertEqual(len(self.logica.dar_recetas()), 0)
+
+    def test_unidades_anidadas_comparten_sesion(self):
+        with unidad_de_trabajo() as externa:
+            with unidad_de_trabajo() as interna:
+                self.assertIs(externa, interna)
+
+    def test_mapa_de_identidad_se_libera(self):
+        with unidad_de_trabajo() as sesion:
+            sesion.add(Receta(nombre="Changua", tiempoPreparacion=1, nroPersonasPreparacion=2, caloriasPorcion=150, instrucciones="..."))
+        self.assertEqual(len(sesion.identity_map), 0)
+
+    def test_sesion_por_hilo(self):
+        sesiones = []
+
+        def registrar():
+            with unidad_de_trabajo() as sesion:
+                sesiones.append(sesion)
+
+        with unidad_de_trabajo() as principal:
+            hilo = threading.Thread(target=registrar)
+            hilo.start()
+            hilo.join()
+        self.assertIsNot(sesiones[0], principal)